@@ -5,6 +5,8 @@ from pygine.scene import Scene, SceneManager
 # Константы
 WIDTH, HEIGHT = 800, 600
 FPS = 60
+# Частота симуляции: физика игрока не зависит от частоты кадров
+SIMULATION_RATE = 60
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -15,7 +17,14 @@ TELEPORT_COOLDOWN_TIME = 0.5
 
 
 # Инициализация игры
-game = pg.Game(WIDTH, HEIGHT, "Duality", FPS, background_image="assets/background.png")
+game = pg.Game(
+    WIDTH,
+    HEIGHT,
+    "Duality",
+    FPS,
+    background_image="assets/background.png",
+    fixed_timestep=SIMULATION_RATE,
+)
 
 background = pygame.transform.scale(
     pygame.image.load("assets/background.png").convert(), (WIDTH, HEIGHT)
@@ -108,6 +117,7 @@ class GameScene(Scene):
 
         # Создание игрока
         self.player = pg.AnimatedSprite("assets/player.png", (21, 21), (400, 300))
+        self.player.set_collision_layer("player")
         self.player.add_animation("stance", [0], fps=8, loop=True)
         self.player.add_animation("walk", [1, 7, 8, 9], fps=8, loop=True)
         self.player.add_animation("run", [1, 7, 8, 9], fps=24, loop=True)
@@ -116,6 +126,12 @@ class GameScene(Scene):
         self.player.add_animation("teleport", [2, 3], fps=8, loop=False)
         self.player.set_scale(2.0)
 
+        # Физическое тело игрока: гравитацию и прыжок интегрирует спрайт
+        self.gravity = 1500
+        self.body = self.player.attach_body(gravity=self.gravity)
+        self.body.air_resistance = 1.0
+        self.body.friction = 1.0
+
         # Начальная позиция игрока
         initial_ground_y = HEIGHT - (self.player.frame_size[1] * self.player.scale) / 2
         self.player.set_position(0, initial_ground_y)
@@ -124,8 +140,6 @@ class GameScene(Scene):
         # Параметры движения
         self.speed = 200
         self.run_speed = 400
-        self.jump_speed = 0
-        self.gravity = 1500
         self.jump_power = -500
         self.idle_timer = 0.0
         self.current_world = "upper"
@@ -151,8 +165,14 @@ class GameScene(Scene):
         else:
             ground_y = HEIGHT - half_h
 
+        # Не проваливаемся сквозь землю (тело уже сдвинулось в этом тике)
+        if self.player.y > ground_y:
+            self.player.y = ground_y
+            self.body.velocity = (self.body.velocity[0], 0)
+
         # Стоим ли на земле?
         on_ground = self.player.y >= ground_y - 0.1
+        self.body.on_ground = on_ground
 
         # Приседаем
         if keys[pygame.K_s] and on_ground:
@@ -163,7 +183,8 @@ class GameScene(Scene):
 
             # Прыгаем
             if keys[pygame.K_SPACE] and on_ground:
-                self.jump_speed = self.jump_power
+                self.body.velocity = (self.body.velocity[0], self.jump_power)
+                self.body.on_ground = False
                 self.player.play_animation("jump")
 
             # Ходим или бегаем
@@ -235,16 +256,7 @@ class GameScene(Scene):
                 self.player.set_position(saved_x, new_y)
 
                 # Сбрасываем скорость прыжка после телепортации
-                self.jump_speed = 0
-
-        # Применяем гравитацию
-        self.jump_speed += self.gravity * dt
-        self.player.y += self.jump_speed * dt
-
-        # Не проваливаемся сквозь землю
-        if self.player.y > ground_y:
-            self.player.y = ground_y
-            self.jump_speed = 0
+                self.body.velocity = (0, 0)
 
         # Не выходим за пределы экрана
         if self.player.x < half_w:
@@ -258,29 +270,32 @@ class GameScene(Scene):
         screen.blit(background, (0, 0))
 
         # # Отрисовка игрока
-        screen.blit(self.player.image, self.player.rect)
+        game.render_queue.submit(self.player.image, game.get_draw_rect(self.player))
 
         # Отображение инструкции
 
 
+def define_level_clips():
+    """Определить клипы дверей и ключей, общие для всех их спрайтов."""
+    pg.define_clip("assets/doors.png", (21, 42), "closed", [0], fps=1)
+    pg.define_clip("assets/doors.png", (21, 42), "open", [1], fps=1)
+    pg.define_clip("assets/yellow_keys.png", (21, 21), "key", [0], fps=1)
+    pg.define_clip("assets/yellow_keys.png", (21, 21), "no_key", [1], fps=1)
+
+
 class FirstScene(GameScene):
     def __init__(self):
         super().__init__()
+        define_level_clips()
         self.door = pg.AnimatedSprite("assets/doors.png", (21, 42))
         self.key = pg.AnimatedSprite("assets/yellow_keys.png", (21, 21))
         self.close_key = pg.AnimatedSprite("assets/yellow_keys.png", (21, 21))
         self.sign = pg.AnimatedSprite("assets/right_sign.png", (21, 21))
 
-        self.door.add_animation("closed", [0], fps=1, loop=True)
-        self.door.add_animation("open", [1], fps=1, loop=True)
+        # Клипы листов определены один раз (см. define_level_clips) и
+        # берутся спрайтами по имени
         self.door.play_animation("closed")
-
-        self.key.add_animation("key", [0], fps=1, loop=True)
-        self.key.add_animation("no_key", [1], fps=1, loop=True)
         self.key.play_animation("key")
-
-        self.close_key.add_animation("key", [0], fps=1, loop=True)
-        self.close_key.add_animation("no_key", [1], fps=1, loop=True)
         self.close_key.play_animation("no_key")
 
         self.door.set_scale(3.0)
@@ -306,24 +321,35 @@ class FirstScene(GameScene):
         self.initial_ground_y = HEIGHT - (self.key.frame_size[1] * self.key.scale)
         self.key.set_position(WIDTH / 2, self.initial_ground_y)
 
+        # Игрок проверяется только с ключом и дверью; декорации ни с чем не сталкиваются
+        self.door.set_collision_layer("trigger", "player")
+        self.key.set_collision_layer("pickup", "player")
+        self.close_key.set_collision_layer("decoration", [])
+        self.sign.set_collision_layer("decoration", [])
+
         game.add_sprite([self.door, self.key, self.close_key, self.sign])
 
+        # Касания игрока приходят событиями коллизий (один проход за кадр)
+        self.key.on_collision_enter = self.on_key_touched
+        self.door.on_collision_enter = self.on_door_touched
+        self.door.on_collision_stay = self.on_door_touched
+        game.enable_collision_events()
+
         self.is_complete = False
 
-    def new_update(self):
-        if self.player.collides_with(self.key) and not self.is_complete:
+    def on_key_touched(self, other):
+        if other is self.player and self.active and not self.is_complete:
             self.key.play_animation("no_key")
             self.close_key.play_animation("key")
             self.door.play_animation("open")
             self.is_complete = True
-        if self.player.collides_with(self.door) and self.is_complete:
+
+    def on_door_touched(self, other):
+        if other is self.player and self.active and self.is_complete:
             restart_menu()
 
     def draw(self, screen):
-        self.new_update()
-        screen.blit(self.door.image, self.door.rect)
-        screen.blit(self.key.image, self.key.rect)
-        screen.blit(self.close_key.image, self.close_key.rect)
+        game.render_queue.submit_sprites((self.door, self.key, self.close_key))
         pg.Text(20, 20, self.instruction_text, size=18, color=BLACK).draw(screen)
 
 
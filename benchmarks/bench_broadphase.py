@@ -0,0 +1,94 @@
+"""
+Сравнение поиска столкновений: полный перебор против широкой фазы.
+
+Для 100, 1 000 и 10 000 спрайтов, равномерно разбросанных по миру
+с постоянной плотностью, измеряется время поиска всех сталкивающихся
+пар. Полный перебор на 10 000 спрайтов занимает минуты, поэтому
+по умолчанию пропускается (включается флагом --full).
+
+Запуск:
+    python benchmarks/bench_broadphase.py [--full]
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pygame  # noqa: E402
+from pygine import AnimatedSprite, SpatialHash, LooseQuadtree  # noqa: E402
+
+ASSET = os.path.join(os.path.dirname(__file__), "..", "assets", "player.png")
+SIZES = (100, 1_000, 10_000)
+# Площадь мира на один спрайт (пикселей), чтобы плотность не менялась
+AREA_PER_SPRITE = 80 * 80
+
+
+def make_sprites(count: int):
+    """Создать спрайты, разбросанные по квадратному миру."""
+    side = int((count * AREA_PER_SPRITE) ** 0.5)
+    rng = random.Random(count)
+    sprites = []
+    for _ in range(count):
+        sprite = AnimatedSprite(ASSET, (21, 21))
+        sprite.set_position(rng.uniform(0, side), rng.uniform(0, side))
+        if rng.random() < 0.3:
+            sprite.set_rotation(rng.uniform(0, 360))
+        sprite.update(0)
+        sprites.append(sprite)
+    return sprites, side
+
+
+def brute_force(sprites):
+    """Все пары перебором."""
+    pairs = []
+    for i, a in enumerate(sprites):
+        for b in sprites[i + 1:]:
+            if a.collides_with(b):
+                pairs.append((a, b))
+    return pairs
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    full = "--full" in sys.argv
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    print(f"{'sprites':>8} {'brute':>10} {'hash':>10} {'quadtree':>10} {'pairs':>7}")
+    for count in SIZES:
+        sprites, side = make_sprites(count)
+
+        grid = SpatialHash(64)
+        tree = LooseQuadtree((0, 0, side, side))
+        for sprite in sprites:
+            grid.insert(sprite)
+            tree.insert(sprite)
+
+        hash_time, hash_pairs = timed(grid.colliding_pairs)
+        tree_time, tree_pairs = timed(tree.colliding_pairs)
+        assert len(hash_pairs) == len(tree_pairs)
+
+        if full or count <= 1_000:
+            brute_time, brute_pairs = timed(brute_force, sprites)
+            assert len(brute_pairs) == len(hash_pairs)
+            brute = f"{brute_time * 1000:8.1f}ms"
+        else:
+            brute = f"{'skipped':>10}"
+
+        print(
+            f"{count:>8} {brute} {hash_time * 1000:8.1f}ms "
+            f"{tree_time * 1000:8.1f}ms {len(hash_pairs):>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,16 @@ __author__ = "pygine contributors"
 # Основные импорты
 from .sprite import AnimatedSprite
 from .animation import Animation, AnimationManager
+from .clips import ClipLibrary, get_clip_library, define_clip, load_clip_manifest
+from .coroutines import (
+    Wait,
+    Scheduler,
+    next_frame,
+    wait_seconds,
+    wait_until,
+    animation_finished,
+    animation_marker,
+)
 from .game import Game
 from .utils import (
     wait,
@@ -41,6 +51,42 @@ from .camera import Camera
 from .scene import Scene, SceneManager
 from .physics import PhysicsBody
 from .spritesheet_tools import visualize_spritesheet, create_spritesheet_from_frames
+from .render import RenderQueue
+from .tilemap import TileMap
+from .collision_grid import CollisionGrid
+from .broadphase import SpatialHash, LooseQuadtree
+from .layers import ALL_LAYERS, NO_LAYERS, define_layer, layer_bits, layers_interact
+from .frame_cache import (
+    TransformCache,
+    SpriteSheet,
+    FrameStore,
+    get_frame_store,
+    purge_frame_store,
+    set_transform_cache_limit,
+    clear_transform_caches,
+)
+
+# Модули на NumPy импортируются при первом обращении к их именам, чтобы
+# пакет работал и без NumPy: {имя: подмодуль}
+_NUMPY_EXPORTS = {
+    "AnimationSystem": "animation_system",
+    "PhysicsWorld": "physics_world",
+    "query_many": "collision",
+}
+
+
+def __getattr__(name):
+    submodule = _NUMPY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = _importlib.import_module(f".{submodule}", __name__)
+    except ImportError as error:
+        raise ImportError(f"pygine.{name} requires NumPy (pip install numpy)") from error
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
 
 # Экспорт основных классов и функций
 __all__ = [
@@ -48,7 +94,20 @@ __all__ = [
     "AnimatedSprite",
     "Animation",
     "AnimationManager",
+    "AnimationSystem",
+    "ClipLibrary",
+    "get_clip_library",
+    "define_clip",
+    "load_clip_manifest",
+    "Wait",
+    "Scheduler",
+    "next_frame",
+    "wait_seconds",
+    "wait_until",
+    "animation_finished",
+    "animation_marker",
     "Game",
+    "RenderQueue",
     # Утилитарные функции
     "wait",
     "wait_for_key",
@@ -83,12 +142,31 @@ __all__ = [
     "draw_rounded_rect_border",
     # Расширенные возможности
     "Camera",
+    "TileMap",
+    "CollisionGrid",
+    "SpatialHash",
+    "LooseQuadtree",
+    "query_many",
+    "ALL_LAYERS",
+    "NO_LAYERS",
+    "define_layer",
+    "layer_bits",
+    "layers_interact",
     "Scene",
     "SceneManager",
     "PhysicsBody",
+    "PhysicsWorld",
     # Инструменты для спрайтшитов
     "visualize_spritesheet",
     "create_spritesheet_from_frames",
+    # Кэширование кадров
+    "TransformCache",
+    "SpriteSheet",
+    "FrameStore",
+    "get_frame_store",
+    "purge_frame_store",
+    "set_transform_cache_limit",
+    "clear_transform_caches",
 ]
 
 # ---------------------------------------------------------------------------
@@ -102,6 +180,9 @@ _sys.modules["pygame_easy"] = _sys.modules[__name__]
 # И подмодули тоже
 _submodules = [
     "animation",
+    "animation_system",
+    "clips",
+    "coroutines",
     "sprite",
     "game",
     "utils",
@@ -110,9 +191,22 @@ _submodules = [
     "camera",
     "scene",
     "physics",
+    "physics_world",
     "spritesheet_tools",
+    "frame_cache",
+    "render",
+    "tilemap",
+    "broadphase",
+    "collision",
+    "layers",
+    "collision_grid",
 ]
 
 for _sub in _submodules:
-    _sys.modules[f"pygame_easy.{_sub}"] = _importlib.import_module(f".{_sub}", __name__)
-del _sys, _importlib, _submodules
+    try:
+        _sys.modules[f"pygame_easy.{_sub}"] = _importlib.import_module(f".{_sub}", __name__)
+    except ImportError:
+        if _sub not in _NUMPY_EXPORTS.values():
+            raise
+        # Без NumPy этих подмодулей нет и под старым именем
+del _sys, _submodules
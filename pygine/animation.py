@@ -3,8 +3,8 @@
 """
 
 import time
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import Callable, List, Dict, Iterable, Optional, Tuple
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -12,42 +12,110 @@ class Animation:
     """
     Представляет одну анимационную последовательность.
 
+    Анимация неизменна по смыслу и может быть общей для многих спрайтов
+    (см. ClipLibrary), поэтому кадры хранятся кортежем. Метки кадров —
+    это только данные; обработчики меток регистрируются у менеджера
+    анимаций каждого спрайта (AnimationManager.on_marker).
+
     Аргументы:
         name: Уникальный идентификатор анимации
-        frames: Список индексов кадров для воспроизведения
+        frames: Индексы кадров для воспроизведения
         fps: Скорость анимации (кадров в секунду)
         loop: Зацикливать ли анимацию
+        markers: Метки кадров {позиция в анимации: имя метки},
+            например {2: "footstep"}
     """
 
     name: str
-    frames: List[int]
+    frames: Tuple[int, ...]
     fps: float
     loop: bool = True
+    markers: Dict[int, str] = field(default_factory=dict)
 
     def __post_init__(self):
         """Проверяет параметры анимации после инициализации."""
+        self.frames = tuple(self.frames)
         if not self.frames:
             raise ValueError(f"Animation '{self.name}' must have at least one frame")
         if self.fps <= 0:
             raise ValueError(f"Animation '{self.name}' fps must be positive")
 
+        # Ключи меток из JSON/TOML приходят строками
+        self.markers = {int(index): marker for index, marker in self.markers.items()}
+        for index in self.markers:
+            if not 0 <= index < len(self.frames):
+                raise ValueError(
+                    f"Animation '{self.name}' marker at frame {index} is out of range"
+                )
+
         # Рассчитываем длительность кадра
         self.frame_duration = 1.0 / self.fps
         self.total_duration = len(self.frames) * self.frame_duration
 
 
+class _PlaybackField:
+    """
+    Поле состояния воспроизведения AnimationManager.
+
+    Пока менеджер не подключён к AnimationSystem, значение хранится в
+    самом менеджере; после подключения — в столбце массивов системы.
+    """
+
+    def __init__(self, column: str, cast):
+        self.column = column
+        self.cast = cast
+        self.local = ""
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.local = "_" + name
+
+    def __get__(self, manager, owner=None):
+        if manager is None:
+            return self
+        system = manager._system
+        if system is None:
+            return manager.__dict__[self.local]
+        return self.cast(getattr(system, self.column)[manager._slot])
+
+    def __set__(self, manager, value) -> None:
+        system = manager.__dict__.get("_system")
+        if system is None:
+            manager.__dict__[self.local] = value
+        else:
+            system._set_state(manager._slot, self.column, value)
+
+
 class AnimationManager:
     """
     Управляет воспроизведением анимаций спрайтов.
 
     Отвечает за состояние, тайминги и переходы между различными анимациями.
+    Если спрайт зарегистрирован в AnimationSystem, состояние (кадр,
+    таймер, флаги) лежит в массивах системы, а кадры продвигает
+    AnimationSystem.step() сразу для всех спрайтов; update() менеджера
+    тогда ничего не делает.
     """
 
+    # Состояние воспроизведения (локальное или в массивах AnimationSystem)
+    current_frame_index = _PlaybackField("_frame", int)
+    frame_timer = _PlaybackField("_timer", float)
+    is_playing = _PlaybackField("_playing", bool)
+    is_paused = _PlaybackField("_paused", bool)
+    finished = _PlaybackField("_finished", bool)
+
     def __init__(self):
+        # Система, которая ведёт воспроизведение, и строка в её массивах
+        self._system = None
+        self._slot = -1
+
         self.animations: Dict[str, Animation] = {}
-        self.current_animation: Optional[Animation] = None
+        self._current_animation: Optional[Animation] = None
         self.current_animation_name: Optional[str] = None
 
+        # Обработчики событий: окончание анимации и метки кадров
+        self._finish_callbacks: List[Callable] = []
+        self._marker_callbacks: Dict[str, List[Callable]] = {}
+
         # Тайминг
         self.current_frame_index = 0
         self.frame_timer = 0.0
@@ -58,6 +126,17 @@ class AnimationManager:
         self.is_paused = False
         self.finished = False
 
+    @property
+    def current_animation(self) -> Optional[Animation]:
+        """Текущая анимация."""
+        return self._current_animation
+
+    @current_animation.setter
+    def current_animation(self, animation: Optional[Animation]) -> None:
+        self._current_animation = animation
+        if self._system is not None:
+            self._system._set_clip(self._slot, animation)
+
     def add_animation(self, animation: Animation) -> None:
         """
         Добавить анимацию в менеджер.
@@ -102,6 +181,10 @@ class AnimationManager:
         self.is_paused = False
         self.finished = False
 
+        # Первый кадр начался — его метка срабатывает сразу
+        if self._marker_callbacks and 0 in animation.markers:
+            self._dispatch_markers(animation, (0,))
+
         return True
 
     def stop(self) -> None:
@@ -124,33 +207,153 @@ class AnimationManager:
 
     def update(self, dt: float) -> None:
         """
-        Обновить таймер анимации и, при необходимости, переключить кадр.
+        Обновить таймер анимации и переключить кадры.
+
+        Остаток времени переносится в следующий вызов, а за один вызов
+        анимация может продвинуться на несколько кадров (число кадров
+        считается делением, без цикла). Поэтому скорость анимации
+        не зависит от частоты кадров игры, и редкое обновление с большим
+        dt (например, для спрайта за экраном) не сбивает её. Для менеджера,
+        подключённого к AnimationSystem, кадры продвигает система.
 
         Аргументы:
             dt: Дельта‑время в секундах
         """
+        if self._system is not None:
+            return
         if not self.is_playing or self.is_paused or not self.current_animation:
             return
 
-        if self.finished and not self.current_animation.loop:
+        animation = self.current_animation
+        if self.finished and not animation.loop:
             return
 
         # Обновляем таймер
         self.frame_timer += dt
+        if self.frame_timer < animation.frame_duration:
+            return
+
+        # Сколько целых кадров прошло; остаток остаётся в таймере
+        steps, self.frame_timer = divmod(self.frame_timer, animation.frame_duration)
+        start_index = self.current_frame_index
+        frame_index = start_index + int(steps)
+        frame_count = len(animation.frames)
+        finished_now = False
+
+        # Обрабатываем окончание анимации
+        if frame_index >= frame_count:
+            if animation.loop:
+                frame_index %= frame_count
+            else:
+                frame_index = frame_count - 1
+                self.frame_timer = 0.0
+                self.finished = True
+                self.is_playing = False
+                finished_now = True
+        self.current_frame_index = frame_index
+
+        if self._finish_callbacks or self._marker_callbacks:
+            self._dispatch_events(animation, start_index, int(steps), finished_now)
+
+    # События анимации
+    def on_finish(self, callback: Callable[[str], None]) -> None:
+        """
+        Добавить обработчик окончания незацикленной анимации.
+
+        Обработчик вызывается из update() (или шага AnimationSystem) с
+        именем завершившейся анимации — опрашивать is_finished() не нужно.
+
+        Аргументы:
+            callback: Функция (animation_name)
+
+        Пример:
+            >>> manager.on_finish(lambda name: manager.play_animation("idle"))
+        """
+        self._finish_callbacks.append(callback)
+        self._listeners_changed()
+
+    def on_marker(self, marker: str, callback: Callable[[str, str], None]) -> None:
+        """
+        Добавить обработчик метки кадра.
+
+        Обработчик вызывается, когда анимация входит в кадр с меткой
+        (см. Animation.markers). Если за один update() пройдено несколько
+        кругов, каждая метка срабатывает один раз.
 
-        # Проверяем, пора ли перейти к следующему кадру
-        if self.frame_timer >= self.current_animation.frame_duration:
-            self.frame_timer = 0.0
-            self.current_frame_index += 1
-
-            # Обрабатываем окончание анимации
-            if self.current_frame_index >= len(self.current_animation.frames):
-                if self.current_animation.loop:
-                    self.current_frame_index = 0
-                else:
-                    self.current_frame_index = len(self.current_animation.frames) - 1
-                    self.finished = True
-                    self.is_playing = False
+        Аргументы:
+            marker: Имя метки
+            callback: Функция (animation_name, marker)
+
+        Пример:
+            >>> manager.on_marker("footstep", lambda name, marker: step_sound.play())
+        """
+        self._marker_callbacks.setdefault(marker, []).append(callback)
+        self._listeners_changed()
+
+    def remove_callback(self, callback: Callable) -> bool:
+        """
+        Удалить обработчик окончания или меток.
+
+        Возвращает:
+            True, если обработчик был найден
+        """
+        removed = False
+        if callback in self._finish_callbacks:
+            self._finish_callbacks.remove(callback)
+            removed = True
+        for marker, callbacks in list(self._marker_callbacks.items()):
+            if callback in callbacks:
+                callbacks.remove(callback)
+                removed = True
+                if not callbacks:
+                    del self._marker_callbacks[marker]
+        if removed:
+            self._listeners_changed()
+        return removed
+
+    def has_listeners(self) -> bool:
+        """Есть ли у менеджера обработчики событий."""
+        return bool(self._finish_callbacks or self._marker_callbacks)
+
+    def _listeners_changed(self) -> None:
+        """Сообщить системе анимаций, нужно ли рассылать события этой строки."""
+        if self._system is not None:
+            self._system._set_state(self._slot, "_listening", self.has_listeners())
+
+    @staticmethod
+    def _passed_positions(
+        animation: Animation, start_index: int, steps: int
+    ) -> Iterable[int]:
+        """Позиции кадров, в которые анимация вошла за steps шагов от start_index."""
+        frame_count = len(animation.frames)
+        if not animation.loop:
+            return range(start_index + 1, min(start_index + steps, frame_count - 1) + 1)
+        if steps >= frame_count:
+            # Полный круг и больше: каждый кадр пройден (метка — один раз)
+            return range(frame_count)
+        return [(start_index + step) % frame_count for step in range(1, steps + 1)]
+
+    def _dispatch_events(
+        self, animation: Animation, start_index: int, steps: int, finished_now: bool
+    ) -> None:
+        """Разослать события шага: метки пройденных кадров, затем окончание."""
+        if self._marker_callbacks and animation.markers:
+            self._dispatch_markers(
+                animation, self._passed_positions(animation, start_index, steps)
+            )
+        if finished_now:
+            for callback in list(self._finish_callbacks):
+                callback(animation.name)
+
+    def _dispatch_markers(self, animation: Animation, positions: Iterable[int]) -> None:
+        """Вызвать обработчики меток на перечисленных позициях кадров."""
+        markers = animation.markers
+        for position in positions:
+            marker = markers.get(position)
+            if marker is None:
+                continue
+            for callback in list(self._marker_callbacks.get(marker, ())):
+                callback(animation.name, marker)
 
     def get_current_animation(self) -> Optional[Animation]:
         """Получить текущую воспроизводимую анимацию."""
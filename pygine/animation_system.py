@@ -0,0 +1,285 @@
+"""
+Централизованное воспроизведение анимаций на массивах NumPy.
+"""
+
+import weakref
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .animation import Animation
+
+
+class AnimationSystem:
+    """
+    Состояние воспроизведения анимаций всех спрайтов в параллельных массивах.
+
+    Номер кадра, таймер, флаги и параметры текущей анимации каждого
+    зарегистрированного спрайта лежат в столбцах NumPy, а step()
+    продвигает все играющие анимации одним векторным проходом за тик
+    (с переносом остатка времени, как AnimationManager.update()).
+    Менеджеры анимаций спрайтов остаются прежним интерфейсом:
+    play_animation(), pause() и остальные методы читают и пишут
+    строку системы.
+
+    Система держит спрайты слабыми ссылками: строка освобождается при
+    kill() спрайта, remove() или когда спрайт собран сборщиком мусора.
+
+    Аргументы:
+        capacity: Начальная ёмкость (массивы растут автоматически)
+
+    Пример:
+        >>> system = AnimationSystem()
+        >>> for sprite in enemies:
+        ...     system.add(sprite)
+        >>> changed = system.step(dt)  # спрайты, у которых сменился кадр
+    """
+
+    # Столбцы хранилища: (атрибут, значение пустой строки, тип)
+    _COLUMNS = (
+        ("_frame", 0, np.int64),
+        ("_timer", 0.0, np.float64),
+        ("_playing", False, np.bool_),
+        ("_paused", False, np.bool_),
+        ("_finished", False, np.bool_),
+        # Параметры текущей анимации строки
+        ("_duration", 1.0, np.float64),
+        ("_length", 1, np.int64),
+        ("_loop", False, np.bool_),
+        ("_offset", 0, np.int64),
+        # Показанный кадр спрайтшита (для поиска изменившихся спрайтов)
+        ("_displayed", -1, np.int64),
+        # Есть ли у менеджера обработчики окончания или меток
+        ("_listening", False, np.bool_),
+    )
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = max(1, int(capacity))
+        self._count = 0  # занятые строки (включая освобождённые дыры)
+        self._free: List[int] = []
+        # Слабые ссылки на спрайты строк, их менеджеры и строки спрайтов (по id)
+        self._sprites: List[Optional[weakref.ref]] = [None] * self.capacity
+        self._managers: List = [None] * self.capacity
+        self._slots: Dict[int, int] = {}
+        for name, fill, dtype in self._COLUMNS:
+            setattr(self, name, np.full(self.capacity, fill, dtype=dtype))
+
+        # Кадры всех анимаций подряд; одинаковые последовательности
+        # хранятся один раз. Нулевой элемент — заглушка для строк без анимации
+        self._clip_frames = np.full(1, -1, dtype=np.int64)
+        self._clip_offsets: Dict[Tuple[int, ...], int] = {}
+
+    def _grow(self) -> None:
+        """Удвоить ёмкость массивов, сохранив состояние."""
+        capacity = self.capacity * 2
+        count = self._count
+        for name, fill, dtype in self._COLUMNS:
+            column = np.full(capacity, fill, dtype=dtype)
+            column[:count] = getattr(self, name)[:count]
+            setattr(self, name, column)
+        self._sprites.extend([None] * (capacity - self.capacity))
+        self._managers.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def add(self, sprite) -> None:
+        """
+        Зарегистрировать спрайт: его состояние анимации переходит в систему.
+
+        Аргументы:
+            sprite: Спрайт с animation_manager (AnimatedSprite)
+        """
+        if id(sprite) in self._slots:
+            return
+        manager = sprite.animation_manager
+
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._count == self.capacity:
+                self._grow()
+            slot = self._count
+            self._count += 1
+
+        # Забираем текущее состояние менеджера до подключения
+        state = (
+            manager.current_frame_index,
+            manager.frame_timer,
+            manager.is_playing,
+            manager.is_paused,
+            manager.finished,
+        )
+        key = id(sprite)
+        self._sprites[slot] = weakref.ref(sprite, lambda _, key=key: self._release(key))
+        self._managers[slot] = manager
+        self._slots[key] = slot
+        manager._system = self
+        manager._slot = slot
+
+        self._set_clip(slot, manager.current_animation)
+        self._listening[slot] = manager.has_listeners()
+        (
+            manager.current_frame_index,
+            manager.frame_timer,
+            manager.is_playing,
+            manager.is_paused,
+            manager.finished,
+        ) = state
+
+    def remove(self, sprite) -> None:
+        """Снять спрайт с учёта; состояние возвращается в его менеджер."""
+        if id(sprite) in self._slots:
+            self._release(id(sprite))
+
+    def _release(self, key: int) -> None:
+        """Вернуть состояние строки менеджеру и освободить строку (спрайт по id)."""
+        slot = self._slots.pop(key)
+        manager = self._managers[slot]
+        state = (
+            manager.current_frame_index,
+            manager.frame_timer,
+            manager.is_playing,
+            manager.is_paused,
+            manager.finished,
+        )
+        manager._system = None
+        manager._slot = -1
+        (
+            manager.current_frame_index,
+            manager.frame_timer,
+            manager.is_playing,
+            manager.is_paused,
+            manager.finished,
+        ) = state
+
+        for name, fill, _ in self._COLUMNS:
+            getattr(self, name)[slot] = fill
+        self._sprites[slot] = None
+        self._managers[slot] = None
+        self._free.append(slot)
+
+    def _clip_offset(self, frames) -> int:
+        """Смещение последовательности кадров в общей таблице (добавляет новую)."""
+        key = tuple(frames)
+        offset = self._clip_offsets.get(key)
+        if offset is None:
+            offset = len(self._clip_frames)
+            self._clip_frames = np.concatenate(
+                (self._clip_frames, np.asarray(key, dtype=np.int64))
+            )
+            self._clip_offsets[key] = offset
+        return offset
+
+    def _set_clip(self, slot: int, animation: Optional[Animation]) -> None:
+        """Записать параметры текущей анимации строки."""
+        if animation is None:
+            self._duration[slot] = 1.0
+            self._length[slot] = 1
+            self._loop[slot] = False
+            self._offset[slot] = 0
+        else:
+            self._duration[slot] = animation.frame_duration
+            self._length[slot] = len(animation.frames)
+            self._loop[slot] = animation.loop
+            self._offset[slot] = self._clip_offset(animation.frames)
+        self._refresh_displayed(slot)
+
+    def _set_state(self, slot: int, column: str, value) -> None:
+        """Записать поле состояния строки (вызывается менеджером анимаций)."""
+        getattr(self, column)[slot] = value
+        if column == "_frame":
+            self._refresh_displayed(slot)
+
+    def _refresh_displayed(self, slot: int) -> None:
+        """Пересчитать показанный кадр строки после изменения извне."""
+        frame = self._frame[slot]
+        if 0 <= frame < self._length[slot]:
+            self._displayed[slot] = self._clip_frames[self._offset[slot] + frame]
+        else:
+            self._displayed[slot] = -1
+
+    def step(self, dt: float) -> List:
+        """
+        Продвинуть все играющие анимации на dt одним векторным проходом.
+
+        Аргументы:
+            dt: Шаг времени в секундах
+
+        Возвращает:
+            Спрайты, у которых за этот шаг сменился показанный кадр
+            спрайтшита (смена номера кадра с тем же изображением не в счёт).
+            Обработчики меток и окончания (AnimationManager.on_marker,
+            on_finish) вызываются здесь же, после записи состояния
+        """
+        count = self._count
+        if not count:
+            return []
+
+        active = self._playing[:count] & ~self._paused[:count]
+        timer = self._timer[:count]
+        np.add(timer, dt, out=timer, where=active)
+
+        rows = np.flatnonzero(active & (timer >= self._duration[:count]))
+        if not rows.size:
+            return []
+
+        # Сколько целых кадров прошло; остаток остаётся в таймере
+        steps, remainder = np.divmod(timer[rows], self._duration[rows])
+        start = self._frame[rows]
+        frame = start + steps.astype(np.int64)
+        length = self._length[rows]
+
+        # Обрабатываем окончание анимации
+        over = frame >= length
+        end = np.zeros(len(rows), dtype=bool)
+        if over.any():
+            loop = self._loop[rows]
+            wrap = over & loop
+            frame[wrap] %= length[wrap]
+            end = over & ~loop
+            if end.any():
+                frame[end] = length[end] - 1
+                remainder[end] = 0.0
+                ended = rows[end]
+                self._finished[ended] = True
+                self._playing[ended] = False
+
+        self._frame[rows] = frame
+        self._timer[rows] = remainder
+
+        shown = self._clip_frames[self._offset[rows] + frame]
+        changed = rows[shown != self._displayed[rows]]
+        self._displayed[rows] = shown
+
+        sprites = self._sprites
+        changed_sprites = [sprites[slot]() for slot in changed.tolist()]
+
+        # События (метки, окончание) — только для строк с обработчиками
+        # (менеджеры берём заранее: обработчик может убить другой спрайт)
+        listening = np.flatnonzero(self._listening[rows]).tolist()
+        managers = [self._managers[rows[index]] for index in listening]
+        for index, manager in zip(listening, managers):
+            if manager._system is not self:
+                continue
+            manager._dispatch_events(
+                manager.current_animation,
+                int(start[index]),
+                int(steps[index]),
+                bool(end[index]),
+            )
+        return changed_sprites
+
+    def __contains__(self, sprite) -> bool:
+        return id(sprite) in self._slots
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def debug_info(self) -> dict:
+        """Получить отладочную информацию о системе."""
+        count = self._count
+        return {
+            "sprites": len(self._slots),
+            "playing": int(np.count_nonzero(self._playing[:count] & ~self._paused[:count])),
+            "capacity": self.capacity,
+            "clip_frames": len(self._clip_frames) - 1,
+        }
@@ -0,0 +1,421 @@
+"""
+Широкая фаза коллизий: пространственный хэш и свободное квадродерево.
+
+Структуры отбирают пары спрайтов, чьи ограничивающие прямоугольники
+хитбоксов попадают в общие ячейки, чтобы точная (узкая) проверка
+collides_with выполнялась только для них, а не для всех пар. Пары,
+несовместимые по слоям коллизий (см. layers), отбрасываются сразу.
+"""
+
+import itertools
+import weakref
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .layers import layers_interact
+
+Bounds = Tuple[float, float, float, float]  # (left, top, right, bottom)
+
+# Группы спрайтов, привязанные к структурам широкой фазы (bind_group)
+_bound_groups: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+# Номер первой регистрации спрайта в любой структуре: задаёт порядок
+# внутри пар и между ними (id() менялся бы от запуска к запуску) и
+# сохраняется при пересоздании структуры
+_serials: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_next_serial = itertools.count()
+
+
+def _track(sprite) -> None:
+    """Выдать спрайту номер регистрации, если его ещё нет."""
+    if sprite not in _serials:
+        _serials[sprite] = next(_next_serial)
+
+
+def _ordered_pair(a, b) -> tuple:
+    """Пара в каноническом порядке, чтобы (a, b) и (b, a) совпадали."""
+    return (a, b) if _serials[a] < _serials[b] else (b, a)
+
+
+def _sorted_pairs(pairs: Iterable[tuple]) -> List[tuple]:
+    """Упорядочить пары по номерам регистрации их спрайтов."""
+    return sorted(pairs, key=lambda pair: (_serials[pair[0]], _serials[pair[1]]))
+
+
+def _filter_layers(sprite, candidates: Set) -> Set:
+    """Оставить кандидатов, с которыми спрайт может сталкиваться по слоям."""
+    return {other for other in candidates if layers_interact(sprite, other)}
+
+
+def bound_broadphase(group) -> Optional["_Broadphase"]:
+    """Получить структуру широкой фазы, к которой привязана группа (None — нет)."""
+    return _bound_groups.get(group)
+
+
+class _Broadphase:
+    """Общая часть структур широкой фазы: привязка групп спрайтов."""
+
+    def bind_group(self, group) -> None:
+        """
+        Привязать группу спрайтов к структуре.
+
+        Спрайты группы (текущие и добавленные позже) регистрируются в
+        структуре, а убранные из группы — снимаются с неё, поэтому
+        collides_with_group() для этой группы берёт кандидатов прямо из
+        структуры, не перебирая группу. Группа привязана не больше чем
+        к одной структуре.
+
+        Аргументы:
+            group: Группа pygame.sprite.Group
+        """
+        _bound_groups[group] = self
+        for sprite in group:
+            if hasattr(sprite, "get_collision_bounds"):
+                self.insert(sprite)
+
+    def unbind_group(self, group) -> None:
+        """Отвязать группу (её спрайты остаются зарегистрированными)."""
+        if _bound_groups.get(group) is self:
+            del _bound_groups[group]
+
+
+class SpatialHash(_Broadphase):
+    """
+    Равномерная сетка (пространственный хэш) для широкой фазы коллизий.
+
+    Каждый спрайт регистрируется во всех ячейках, которые пересекает
+    ограничивающий прямоугольник его хитбокса. При перемещении спрайта
+    структура обновляется инкрементально: если набор ячеек не изменился,
+    работа не выполняется вовсе.
+
+    Аргументы:
+        cell_size: Размер ячейки в пикселях (обычно 1–2 размера спрайта)
+
+    Пример:
+        >>> grid = SpatialHash(64)
+        >>> for enemy in enemies:
+        ...     grid.insert(enemy)
+        >>> for a, b in grid.colliding_pairs():
+        ...     print(a, "hits", b)
+    """
+
+    def __init__(self, cell_size: float = 64):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set] = {}
+        self._sprite_cells: Dict[object, Tuple[int, int, int, int]] = {}
+
+    def _cell_range(self, bounds: Bounds) -> Tuple[int, int, int, int]:
+        """Диапазон ячеек (x0, y0, x1, y1), покрываемый прямоугольником."""
+        size = self.cell_size
+        left, top, right, bottom = bounds
+        return (
+            int(left // size),
+            int(top // size),
+            int(right // size),
+            int(bottom // size),
+        )
+
+    def insert(self, sprite) -> None:
+        """Зарегистрировать спрайт в сетке."""
+        if sprite in self._sprite_cells:
+            self.update(sprite)
+            return
+        cell_range = self._cell_range(sprite.get_collision_bounds())
+        self._sprite_cells[sprite] = cell_range
+        _track(sprite)
+        self._add_to_cells(sprite, cell_range)
+        sprite._register_broadphase(self)
+
+    def remove(self, sprite) -> None:
+        """Удалить спрайт из сетки."""
+        cell_range = self._sprite_cells.pop(sprite, None)
+        if cell_range is None:
+            return
+        self._remove_from_cells(sprite, cell_range)
+        sprite._unregister_broadphase(self)
+
+    def update(self, sprite) -> None:
+        """Обновить ячейки спрайта после перемещения или смены хитбокса."""
+        old_range = self._sprite_cells.get(sprite)
+        if old_range is None:
+            return
+        new_range = self._cell_range(sprite.get_collision_bounds())
+        if new_range == old_range:
+            return
+        self._remove_from_cells(sprite, old_range)
+        self._add_to_cells(sprite, new_range)
+        self._sprite_cells[sprite] = new_range
+
+    def _add_to_cells(self, sprite, cell_range: Tuple[int, int, int, int]) -> None:
+        cells = self._cells
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {sprite}
+                else:
+                    bucket.add(sprite)
+
+    def _remove_from_cells(self, sprite, cell_range: Tuple[int, int, int, int]) -> None:
+        cells = self._cells
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.discard(sprite)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def clear(self) -> None:
+        """Удалить все спрайты."""
+        for sprite in list(self._sprite_cells):
+            self.remove(sprite)
+
+    def query_bounds(self, bounds: Bounds) -> Set:
+        """Получить спрайты из ячеек, пересекаемых прямоугольником (left, top, right, bottom)."""
+        result: Set = set()
+        cells = self._cells
+        x0, y0, x1, y1 = self._cell_range(bounds)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    result.update(bucket)
+        return result
+
+    def query_rect(self, rect) -> Set:
+        """Получить кандидатов для pygame.Rect."""
+        return self.query_bounds((rect.left, rect.top, rect.right, rect.bottom))
+
+    def query_sprite(self, sprite) -> Set:
+        """Получить кандидатов на столкновение со спрайтом (без него самого)."""
+        cell_range = self._sprite_cells.get(sprite)
+        if cell_range is None:
+            candidates = self.query_bounds(sprite.get_collision_bounds())
+        else:
+            candidates = set()
+            cells = self._cells
+            x0, y0, x1, y1 = cell_range
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    candidates.update(cells[(cx, cy)])
+        candidates.discard(sprite)
+        return _filter_layers(sprite, candidates)
+
+    def candidate_pairs(self) -> List[tuple]:
+        """
+        Получить все пары спрайтов, делящих хотя бы одну ячейку и совместимых по слоям.
+
+        Пары упорядочены по номерам регистрации спрайтов.
+        """
+        pairs: Set[tuple] = set()
+        for bucket in self._cells.values():
+            if len(bucket) < 2:
+                continue
+            members = list(bucket)
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    if layers_interact(a, b):
+                        pairs.add(_ordered_pair(a, b))
+        return _sorted_pairs(pairs)
+
+    def colliding_pairs(self) -> List[tuple]:
+        """Получить все пары, которые действительно сталкиваются в этом кадре."""
+        return [(a, b) for a, b in self.candidate_pairs() if a.collides_with(b)]
+
+    def __contains__(self, sprite) -> bool:
+        return sprite in self._sprite_cells
+
+    def __len__(self) -> int:
+        return len(self._sprite_cells)
+
+    def __iter__(self):
+        return iter(list(self._sprite_cells))
+
+    def debug_info(self) -> Dict:
+        """Получить отладочную информацию о сетке."""
+        return {
+            "sprites": len(self._sprite_cells),
+            "cells": len(self._cells),
+            "cell_size": self.cell_size,
+            "max_per_cell": max((len(b) for b in self._cells.values()), default=0),
+        }
+
+
+class _QuadNode:
+    """Узел свободного квадродерева."""
+
+    __slots__ = ("cx", "cy", "half", "depth", "items", "children")
+
+    def __init__(self, cx: float, cy: float, half: float, depth: int):
+        self.cx = cx
+        self.cy = cy
+        self.half = half
+        self.depth = depth
+        self.items: Set = set()
+        self.children: Optional[List["_QuadNode"]] = None
+
+
+class LooseQuadtree(_Broadphase):
+    """
+    Свободное (loose) квадродерево для широкой фазы коллизий.
+
+    Подходит для сцен с сильно различающимися размерами объектов, где
+    равномерной сетке трудно подобрать размер ячейки. Границы каждого
+    узла расширены вдвое, поэтому объект всегда лежит ровно в одном узле,
+    выбранном по его центру и размеру, и перемещение редко меняет узел.
+    Интерфейс совпадает с SpatialHash.
+
+    Аргументы:
+        bounds: Область мира (left, top, width, height)
+        max_depth: Максимальная глубина дерева
+    """
+
+    def __init__(
+        self,
+        bounds: Tuple[float, float, float, float],
+        max_depth: int = 8,
+    ):
+        left, top, width, height = bounds
+        half = max(width, height) / 2
+        self.max_depth = max_depth
+        self._root = _QuadNode(left + half, top + half, half, 0)
+        self._sprite_nodes: Dict[object, _QuadNode] = {}
+
+    def _find_node(self, bounds: Bounds) -> _QuadNode:
+        """Найти самый глубокий узел, свободные границы которого вмещают объект."""
+        left, top, right, bottom = bounds
+        x = (left + right) / 2
+        y = (top + bottom) / 2
+        extent = max(right - left, bottom - top) / 2
+
+        node = self._root
+        while node.depth < self.max_depth:
+            half = node.half / 2
+            # Свободные границы дочернего узла вдвое больше его размера,
+            # поэтому объект помещается, если его полуразмер не больше half
+            if extent > half:
+                break
+            if node.children is None:
+                node.children = [
+                    _QuadNode(node.cx - half, node.cy - half, half, node.depth + 1),
+                    _QuadNode(node.cx + half, node.cy - half, half, node.depth + 1),
+                    _QuadNode(node.cx - half, node.cy + half, half, node.depth + 1),
+                    _QuadNode(node.cx + half, node.cy + half, half, node.depth + 1),
+                ]
+            index = (1 if x >= node.cx else 0) + (2 if y >= node.cy else 0)
+            child = node.children[index]
+            # Центр должен лежать внутри самого узла (за пределами мира — в корне)
+            if abs(x - child.cx) > half or abs(y - child.cy) > half:
+                break
+            node = child
+        return node
+
+    def insert(self, sprite) -> None:
+        """Зарегистрировать спрайт в дереве."""
+        if sprite in self._sprite_nodes:
+            self.update(sprite)
+            return
+        node = self._find_node(sprite.get_collision_bounds())
+        node.items.add(sprite)
+        self._sprite_nodes[sprite] = node
+        _track(sprite)
+        sprite._register_broadphase(self)
+
+    def remove(self, sprite) -> None:
+        """Удалить спрайт из дерева."""
+        node = self._sprite_nodes.pop(sprite, None)
+        if node is None:
+            return
+        node.items.discard(sprite)
+        sprite._unregister_broadphase(self)
+
+    def update(self, sprite) -> None:
+        """Переместить спрайт в подходящий узел после изменения."""
+        node = self._sprite_nodes.get(sprite)
+        if node is None:
+            return
+        new_node = self._find_node(sprite.get_collision_bounds())
+        if new_node is not node:
+            node.items.discard(sprite)
+            new_node.items.add(sprite)
+            self._sprite_nodes[sprite] = new_node
+
+    def clear(self) -> None:
+        """Удалить все спрайты."""
+        for sprite in list(self._sprite_nodes):
+            self.remove(sprite)
+
+    def query_bounds(self, bounds: Bounds) -> Set:
+        """Получить спрайты из узлов, чьи свободные границы пересекают прямоугольник."""
+        left, top, right, bottom = bounds
+        result: Set = set()
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            # Свободные границы: вдвое больше узла, кроме корня (он вмещает всё)
+            loose = node.half * 2
+            if node.depth > 0 and (
+                right < node.cx - loose
+                or left > node.cx + loose
+                or bottom < node.cy - loose
+                or top > node.cy + loose
+            ):
+                continue
+            result.update(node.items)
+            if node.children is not None:
+                stack.extend(node.children)
+        return result
+
+    def query_rect(self, rect) -> Set:
+        """Получить кандидатов для pygame.Rect."""
+        return self.query_bounds((rect.left, rect.top, rect.right, rect.bottom))
+
+    def query_sprite(self, sprite) -> Set:
+        """Получить кандидатов на столкновение со спрайтом (без него самого)."""
+        candidates = self.query_bounds(sprite.get_collision_bounds())
+        candidates.discard(sprite)
+        return _filter_layers(sprite, candidates)
+
+    def candidate_pairs(self) -> List[tuple]:
+        """
+        Получить все пары спрайтов с пересекающимися свободными узлами и совместимых по слоям.
+
+        Пары упорядочены по номерам регистрации спрайтов.
+        """
+        pairs: Set[tuple] = set()
+        for sprite in self._sprite_nodes:
+            for other in self.query_sprite(sprite):
+                pairs.add(_ordered_pair(sprite, other))
+        return _sorted_pairs(pairs)
+
+    def colliding_pairs(self) -> List[tuple]:
+        """Получить все пары, которые действительно сталкиваются в этом кадре."""
+        return [(a, b) for a, b in self.candidate_pairs() if a.collides_with(b)]
+
+    def __contains__(self, sprite) -> bool:
+        return sprite in self._sprite_nodes
+
+    def __len__(self) -> int:
+        return len(self._sprite_nodes)
+
+    def __iter__(self):
+        return iter(list(self._sprite_nodes))
+
+    def debug_info(self) -> Dict:
+        """Получить отладочную информацию о дереве."""
+        return {
+            "sprites": len(self._sprite_nodes),
+            "max_depth": self.max_depth,
+        }
+
+
+def build_broadphase(sprites: Iterable, cell_size: float = 64) -> SpatialHash:
+    """Создать пространственный хэш и зарегистрировать в нём спрайты."""
+    grid = SpatialHash(cell_size)
+    for sprite in sprites:
+        grid.insert(sprite)
+    return grid
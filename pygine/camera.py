@@ -41,3 +41,24 @@ class Camera:
     def get_offset(self) -> Tuple[int, int]:
         """Получить смещение камеры для отрисовки."""
         return (int(-self.x), int(-self.y))
+
+    def get_view_rect(self, margin: int = 0) -> pygame.Rect:
+        """
+        Получить видимую область мира.
+
+        Аргументы:
+            margin: Запас вокруг области в пикселях
+
+        Возвращает:
+            Rect области просмотра в мировых координатах
+        """
+        return pygame.Rect(
+            int(self.x) - margin,
+            int(self.y) - margin,
+            self.width + 2 * margin,
+            self.height + 2 * margin,
+        )
+
+    def is_visible(self, rect: pygame.Rect, margin: int = 0) -> bool:
+        """Проверить, пересекает ли rect (в мировых координатах) область просмотра."""
+        return self.get_view_rect(margin).colliderect(rect)
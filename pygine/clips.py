@@ -0,0 +1,210 @@
+"""
+Библиотека анимационных клипов, общих для спрайтов одного спрайтшита.
+"""
+
+import json
+import weakref
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+from .animation import Animation
+from .frame_cache import FrameStore, SpriteSheet
+
+SheetKey = Tuple[str, Tuple[int, int]]
+
+
+class ClipLibrary:
+    """
+    Клипы (объекты Animation), определённые один раз для спрайтшита.
+
+    Клипы хранятся по ключу листа (путь к изображению и размер кадра)
+    и имени. Спрайты этого листа ссылаются на клип по имени:
+    play_animation() сам находит его в библиотеке, поэтому сотни врагов
+    одного типа разделяют один набор объектов Animation. Клипы можно
+    описать в коде (define) или в манифесте JSON/TOML (load_manifest).
+
+    Пример:
+        >>> library = get_clip_library()
+        >>> library.define("enemy.png", (32, 32), "walk", [0, 1, 2, 3], fps=8)
+        >>> enemy = AnimatedSprite("enemy.png", (32, 32))
+        >>> enemy.play_animation("walk")
+    """
+
+    def __init__(self):
+        self._clips: Dict[SheetKey, Dict[str, Animation]] = {}
+        # Клипы, созданные add_animation(): одинаковые описания спрайтов
+        # одного листа — один объект. Ключ — сам лист, а не его путь:
+        # частный лист (with_frames) не делит клипы с общим, а записи
+        # листа исчезают вместе с ним или при FrameStore.purge()
+        self._interned: "weakref.WeakKeyDictionary[SpriteSheet, Dict[Tuple, Animation]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def define(
+        self,
+        image_path: Union[str, Path],
+        frame_size: Tuple[int, int],
+        name: str,
+        frames: Sequence[int],
+        fps: float = 10,
+        loop: bool = True,
+        markers: Optional[Dict[int, str]] = None,
+    ) -> Animation:
+        """
+        Определить клип листа (повторное определение заменяет клип).
+
+        Аргументы:
+            image_path: Путь к изображению спрайтшита
+            frame_size: Размер кадра (width, height)
+            name: Имя клипа
+            frames: Индексы кадров
+            fps: Скорость (кадров в секунду)
+            loop: Зацикливать ли клип
+            markers: Метки кадров {позиция: имя метки}
+
+        Возвращает:
+            Общий объект Animation
+        """
+        clip = Animation(name, frames, fps, loop, dict(markers or {}))
+        key = FrameStore.make_key(image_path, frame_size)
+        self._clips.setdefault(key, {})[name] = clip
+        return clip
+
+    def get(self, sheet_key: SheetKey, name: str) -> Optional[Animation]:
+        """Получить клип листа по ключу FrameStore.make_key() и имени."""
+        clips = self._clips.get(sheet_key)
+        if clips is None:
+            return None
+        return clips.get(name)
+
+    def clips_for(
+        self, image_path: Union[str, Path], frame_size: Tuple[int, int]
+    ) -> Dict[str, Animation]:
+        """Получить все клипы листа (имя -> Animation)."""
+        key = FrameStore.make_key(image_path, frame_size)
+        return dict(self._clips.get(key, {}))
+
+    def intern(
+        self,
+        sheet: SpriteSheet,
+        name: str,
+        frames: Sequence[int],
+        fps: float,
+        loop: bool,
+        markers: Optional[Dict[int, str]] = None,
+    ) -> Optional[Animation]:
+        """Найти уже созданный для листа клип с таким же описанием (None — нет)."""
+        clips = self._interned.get(sheet)
+        if clips is None:
+            return None
+        marker_key = tuple(sorted((markers or {}).items()))
+        return clips.get((name, tuple(frames), fps, loop, marker_key))
+
+    def add_interned(self, sheet: SpriteSheet, clip: Animation) -> None:
+        """Запомнить клип, созданный add_animation(), для повторного использования."""
+        clips = self._interned.get(sheet)
+        if clips is None:
+            clips = self._interned[sheet] = {}
+        marker_key = tuple(sorted(clip.markers.items()))
+        clips[(clip.name, clip.frames, clip.fps, clip.loop, marker_key)] = clip
+
+    def forget_sheet(self, sheet: SpriteSheet) -> None:
+        """Забыть клипы, созданные add_animation() для листа (лист выгружен)."""
+        self._interned.pop(sheet, None)
+
+    def load_manifest(self, path: Union[str, Path]) -> int:
+        """
+        Загрузить клипы из манифеста JSON или TOML.
+
+        Пути к изображениям отсчитываются от папки манифеста. Формат
+        (JSON; в TOML — те же ключи, листы в [[sheets]]):
+
+            {"sheets": [
+                {"image": "keys.png", "frame_size": [21, 21],
+                 "clips": {"key": {"frames": [0], "fps": 1},
+                           "no_key": {"frames": [1], "fps": 1, "loop": false},
+                           "spin": {"frames": [0, 1], "markers": {"1": "flip"}}}}
+            ]}
+
+        Аргументы:
+            path: Путь к файлу .json или .toml
+
+        Возвращает:
+            Количество загруженных клипов
+        """
+        path = Path(path)
+        if path.suffix.lower() == ".toml":
+            try:
+                import tomllib
+            except ImportError:  # Python < 3.11
+                try:
+                    import tomli as tomllib
+                except ImportError:
+                    raise ImportError(
+                        "Loading TOML clip manifests requires Python 3.11+ or the 'tomli' package"
+                    ) from None
+            with open(path, "rb") as file:
+                manifest = tomllib.load(file)
+        else:
+            with open(path, encoding="utf-8") as file:
+                manifest = json.load(file)
+
+        loaded = 0
+        for sheet in manifest.get("sheets", []):
+            image_path = path.parent / sheet["image"]
+            frame_size = tuple(sheet["frame_size"])
+            for name, spec in sheet.get("clips", {}).items():
+                self.define(
+                    image_path,
+                    frame_size,
+                    name,
+                    spec["frames"],
+                    spec.get("fps", 10),
+                    spec.get("loop", True),
+                    spec.get("markers"),
+                )
+                loaded += 1
+        return loaded
+
+    def clear(self) -> None:
+        """Удалить все клипы библиотеки."""
+        self._clips.clear()
+        self._interned.clear()
+
+    def __len__(self) -> int:
+        return sum(len(clips) for clips in self._clips.values())
+
+    def debug_info(self) -> dict:
+        """Получить отладочную информацию о библиотеке."""
+        return {
+            "sheets": len(self._clips),
+            "clips": len(self),
+            "interned": sum(len(clips) for clips in self._interned.values()),
+        }
+
+
+# Общая библиотека клипов
+_clip_library = ClipLibrary()
+
+
+def get_clip_library() -> ClipLibrary:
+    """Получить общую библиотеку клипов."""
+    return _clip_library
+
+
+def define_clip(
+    image_path: Union[str, Path],
+    frame_size: Tuple[int, int],
+    name: str,
+    frames: Sequence[int],
+    fps: float = 10,
+    loop: bool = True,
+    markers: Optional[Dict[int, str]] = None,
+) -> Animation:
+    """Определить клип листа в общей библиотеке (см. ClipLibrary.define)."""
+    return _clip_library.define(image_path, frame_size, name, frames, fps, loop, markers)
+
+
+def load_clip_manifest(path: Union[str, Path]) -> int:
+    """Загрузить клипы из манифеста в общую библиотеку (см. ClipLibrary.load_manifest)."""
+    return _clip_library.load_manifest(path)
@@ -0,0 +1,280 @@
+"""
+Пакетная проверка столкновений на NumPy.
+
+Вместо вызова collides_with для каждой пары (тысячи вызовов Python за
+кадр при стрельбе по толпе врагов) хитбоксы упаковываются в массивы,
+и все проверки — окружность/окружность, AABB, OBB (SAT) и
+окружность/прямоугольник — выполняются векторно. Формулы повторяют
+методы AnimatedSprite операция в операцию, поэтому результат совпадает
+с collides_with, включая collision_offset и custom_hitbox_size.
+Пары с попиксельными масками отбираются так же векторно, а затем
+проверяются через collides_with.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Сколько пар (a, b) проверять в одном блоке широкой фильтрации
+_PAIR_BLOCK = 1 << 20
+# Запас фильтра по ограничивающим прямоугольникам (пиксели), чтобы
+# округление не отбросило пару, которую точная проверка признала бы касанием
+_BOUNDS_MARGIN = 1.0
+
+
+class _Hitboxes:
+    """Хитбоксы набора спрайтов, упакованные в массивы NumPy."""
+
+    def __init__(self, sprites: Sequence):
+        count = len(sprites)
+        self.count = count
+        self.center = np.zeros((count, 2))
+        self.radius = np.zeros(count)
+        self.is_circle = np.zeros(count, dtype=bool)
+        self.is_mask = np.zeros(count, dtype=bool)
+        self.layer = np.zeros(count, dtype=np.int64)
+        self.filter = np.zeros(count, dtype=np.int64)
+        self.rotated = np.zeros(count, dtype=bool)
+        # Прямоугольник проверяется как многоугольник при повороте или
+        # пользовательском хитбоксе (как в _check_circle_rect_collision)
+        self.polygon = np.zeros(count, dtype=bool)
+        self.bounds = np.zeros((count, 4))
+        # Границы выровненного прямоугольника по размеру кадра
+        self.frame_bounds = np.zeros((count, 4))
+        self.corners = np.zeros((count, 4, 2))
+        self.normals = np.zeros((count, 4, 2))
+
+        for index, sprite in enumerate(sprites):
+            center_x = int(sprite._position[0]) + sprite.collision_offset[0]
+            center_y = int(sprite._position[1]) + sprite.collision_offset[1]
+            self.center[index] = (center_x, center_y)
+            self.layer[index] = sprite.collision_layer
+            self.filter[index] = sprite.collision_filter
+
+            if sprite.hitbox_shape == "mask":
+                self.is_mask[index] = True
+                self.bounds[index] = sprite.get_collision_bounds()
+                continue
+
+            if sprite.hitbox_shape == "circle":
+                radius = sprite.hitbox_radius
+                self.is_circle[index] = True
+                self.radius[index] = radius
+                self.bounds[index] = (
+                    center_x - radius,
+                    center_y - radius,
+                    center_x + radius,
+                    center_y + radius,
+                )
+                continue
+
+            corners, bounds, normals = sprite._get_geometry()
+            self.corners[index] = corners
+            self.bounds[index] = bounds
+            # Вырожденные рёбра не дают нормалей; нулевая ось ничего не разделяет
+            self.normals[index, : len(normals)] = normals
+            self.rotated[index] = sprite.rotation != 0
+            self.polygon[index] = bool(sprite.rotation != 0 or sprite.custom_hitbox_size)
+
+            rect_width = sprite.frame_size[0] * sprite.scale
+            rect_height = sprite.frame_size[1] * sprite.scale
+            self.frame_bounds[index] = (
+                center_x - rect_width / 2,
+                center_y - rect_height / 2,
+                center_x + rect_width / 2,
+                center_y + rect_height / 2,
+            )
+
+
+def _candidate_pairs(a: _Hitboxes, b: _Hitboxes, same: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Пары индексов, совместимые по слоям и с пересекающимися (с запасом) границами."""
+    if a.count == 0 or b.count == 0:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty
+
+    b_left = b.bounds[:, 0] - _BOUNDS_MARGIN
+    b_top = b.bounds[:, 1] - _BOUNDS_MARGIN
+    b_right = b.bounds[:, 2] + _BOUNDS_MARGIN
+    b_bottom = b.bounds[:, 3] + _BOUNDS_MARGIN
+    b_layer = b.layer
+    b_filter = b.filter
+
+    rows = max(1, _PAIR_BLOCK // b.count)
+    found_a: List[np.ndarray] = []
+    found_b: List[np.ndarray] = []
+    for start in range(0, a.count, rows):
+        block = a.bounds[start:start + rows]
+        overlap = (
+            (block[:, 0, None] <= b_right)
+            & (b_left <= block[:, 2, None])
+            & (block[:, 1, None] <= b_bottom)
+            & (b_top <= block[:, 3, None])
+            & ((a.layer[start:start + rows, None] & b_filter) != 0)
+            & ((b_layer & a.filter[start:start + rows, None]) != 0)
+        )
+        if same:
+            # Каждую пару внутри одного набора учитываем один раз, без самого себя
+            overlap &= np.arange(start, start + len(block))[:, None] < np.arange(b.count)
+        index_a, index_b = np.nonzero(overlap)
+        found_a.append(index_a + start)
+        found_b.append(index_b)
+    return np.concatenate(found_a), np.concatenate(found_b)
+
+
+def _circle_circle(a: _Hitboxes, b: _Hitboxes, ia: np.ndarray, ib: np.ndarray) -> np.ndarray:
+    """Векторный аналог _check_circle_collision."""
+    delta = b.center[ib] - a.center[ia]
+    distance = np.sqrt(delta[:, 0] * delta[:, 0] + delta[:, 1] * delta[:, 1])
+    return distance <= a.radius[ia] + b.radius[ib]
+
+
+def _rect_rect(a: _Hitboxes, b: _Hitboxes, ia: np.ndarray, ib: np.ndarray) -> np.ndarray:
+    """Векторный аналог _check_precise_rect_collision (AABB + SAT)."""
+    bounds_a = a.bounds[ia]
+    bounds_b = b.bounds[ib]
+    hits = ~(
+        (bounds_a[:, 2] < bounds_b[:, 0])
+        | (bounds_b[:, 2] < bounds_a[:, 0])
+        | (bounds_a[:, 3] < bounds_b[:, 1])
+        | (bounds_b[:, 3] < bounds_a[:, 1])
+    )
+
+    # SAT нужен только при пересечении AABB, если хотя бы один повёрнут
+    need_sat = hits & (a.rotated[ia] | b.rotated[ib])
+    if need_sat.any():
+        sa = ia[need_sat]
+        sb = ib[need_sat]
+        axes = np.concatenate((a.normals[sa], b.normals[sb]), axis=1)
+        axis_x = axes[:, :, None, 0]
+        axis_y = axes[:, :, None, 1]
+
+        corners_a = a.corners[sa][:, None]
+        corners_b = b.corners[sb][:, None]
+        proj_a = corners_a[..., 0] * axis_x + corners_a[..., 1] * axis_y
+        proj_b = corners_b[..., 0] * axis_x + corners_b[..., 1] * axis_y
+
+        separated = (proj_a.max(axis=2) < proj_b.min(axis=2)) | (
+            proj_b.max(axis=2) < proj_a.min(axis=2)
+        )
+        hits[need_sat] = ~separated.any(axis=1)
+    return hits
+
+
+def _circle_rect(
+    circles: _Hitboxes, rects: _Hitboxes, ic: np.ndarray, ir: np.ndarray
+) -> np.ndarray:
+    """Векторный аналог _check_circle_rect_collision и _check_polygon_circle_collision."""
+    hits = np.zeros(len(ic), dtype=bool)
+    center = circles.center[ic]
+    radius = circles.radius[ic]
+    polygon = rects.polygon[ir]
+
+    # Выровненный по осям прямоугольник: ближайшая точка к центру окружности
+    aligned = ~polygon
+    if aligned.any():
+        point = center[aligned]
+        bounds = rects.frame_bounds[ir[aligned]]
+        closest_x = np.maximum(bounds[:, 0], np.minimum(point[:, 0], bounds[:, 2]))
+        closest_y = np.maximum(bounds[:, 1], np.minimum(point[:, 1], bounds[:, 3]))
+        dx = point[:, 0] - closest_x
+        dy = point[:, 1] - closest_y
+        hits[aligned] = np.sqrt(dx * dx + dy * dy) <= radius[aligned]
+
+    if polygon.any():
+        point = center[polygon][:, None]
+        px = point[..., 0]
+        py = point[..., 1]
+        p1 = rects.corners[ir[polygon]]
+        p2 = np.roll(p1, -1, axis=1)
+        x1, y1 = p1[..., 0], p1[..., 1]
+        x2, y2 = p2[..., 0], p2[..., 1]
+
+        # Центр внутри многоугольника (лучевой бросок, как _point_in_polygon)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_inters = (py - y1) * (x2 - x1) / (y2 - y1) + x1
+        crossings = (
+            (py > np.minimum(y1, y2))
+            & (py <= np.maximum(y1, y2))
+            & (px <= np.maximum(x1, x2))
+            & ((x1 == x2) | (px <= x_inters))
+        )
+        inside = crossings.sum(axis=1) % 2 == 1
+
+        # Расстояние до каждого ребра (как _point_to_line_distance)
+        line_x = x2 - x1
+        line_y = y2 - y1
+        line_len_sq = line_x * line_x + line_y * line_y
+        dot_product = (px - x1) * line_x + (py - y1) * line_y
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = np.clip(dot_product / line_len_sq, 0, 1)
+        t = np.where(line_len_sq == 0, 0.0, t)
+        dx = px - (x1 + t * line_x)
+        dy = py - (y1 + t * line_y)
+        near_edge = (np.sqrt(dx * dx + dy * dy) <= radius[polygon][:, None]).any(axis=1)
+
+        hits[polygon] = inside | near_edge
+    return hits
+
+
+def query_many(a_sprites: Sequence, b_sprites: Optional[Sequence] = None) -> np.ndarray:
+    """
+    Найти все сталкивающиеся пары между двумя наборами спрайтов.
+
+    Результат совпадает с попарными вызовами a.collides_with(b), но
+    вычисляется векторно: сначала пары отбираются по ограничивающим
+    прямоугольникам хитбоксов, затем для оставшихся выполняются точные
+    проверки по типам хитбоксов.
+
+    Аргументы:
+        a_sprites: Первый набор спрайтов (список или группа)
+        b_sprites: Второй набор; если не указан, ищутся пары внутри
+            a_sprites (каждая пара один раз, i < j)
+
+    Возвращает:
+        Массив NumPy формы (N, 2) с индексами (i, j): a_sprites[i]
+        сталкивается с b_sprites[j]. Пары упорядочены по i, затем по j.
+
+    Пример:
+        >>> bullets = list(bullet_group)
+        >>> enemies = list(enemy_group)
+        >>> for i, j in query_many(bullets, enemies):
+        ...     enemies[j].kill()
+        ...     bullets[i].kill()
+    """
+    same = b_sprites is None
+    a_list = list(a_sprites)
+    b_list = a_list if same else list(b_sprites)
+
+    a = _Hitboxes(a_list)
+    b = a if same else _Hitboxes(b_list)
+    ia, ib = _candidate_pairs(a, b, same)
+
+    hits = np.zeros(len(ia), dtype=bool)
+
+    # Маски не векторизуются: для них точная проверка через collides_with
+    masked = a.is_mask[ia] | b.is_mask[ib]
+    for pair in np.flatnonzero(masked):
+        hits[pair] = a_list[ia[pair]].collides_with(b_list[ib[pair]])
+
+    circle_a = a.is_circle[ia] & ~masked
+    circle_b = b.is_circle[ib] & ~masked
+
+    both = circle_a & circle_b
+    if both.any():
+        hits[both] = _circle_circle(a, b, ia[both], ib[both])
+
+    neither = ~circle_a & ~circle_b & ~masked
+    if neither.any():
+        hits[neither] = _rect_rect(a, b, ia[neither], ib[neither])
+
+    a_circle = circle_a & ~circle_b
+    if a_circle.any():
+        hits[a_circle] = _circle_rect(a, b, ia[a_circle], ib[a_circle])
+
+    b_circle = ~circle_a & circle_b
+    if b_circle.any():
+        hits[b_circle] = _circle_rect(b, a, ib[b_circle], ia[b_circle])
+
+    pairs = np.stack((ia[hits], ib[hits]), axis=1)
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    return pairs[order]
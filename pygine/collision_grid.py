@@ -0,0 +1,264 @@
+"""
+Статическая сетка коллизий для геометрии уровня.
+"""
+
+import math
+from typing import Iterable, Iterator, Optional, Sequence, Tuple
+
+Bounds = Tuple[float, float, float, float]  # (left, top, right, bottom)
+
+# Допуск (в долях клетки), чтобы касание грани не считалось пересечением
+# из-за погрешности вычислений с плавающей точкой
+_EPS = 1e-6
+
+
+class CollisionGrid:
+    """
+    Неизменяемая сетка твёрдых клеток размером с тайл.
+
+    Клетки хранятся в компактном bytearray (один байт на клетку), поиск
+    клетки — O(1). Свипы по осям проверяют только клетки, в которые
+    входит ведущая грань прямоугольника за это перемещение, поэтому
+    персонаж разрешает движение за постоянное время независимо от того,
+    сколько твёрдых тайлов на уровне. В отличие от спрайтов-платформ,
+    сетка не участвует в проверках SAT.
+
+    Сетка неизменяема: после правки уровня постройте новую.
+
+    Аргументы:
+        cells: Строки клеток; истинное значение — твёрдая клетка
+        cell_size: Размер клетки (width, height) в пикселях
+        solid_outside: Считать ли твёрдым всё за пределами сетки
+
+    Пример:
+        >>> grid = CollisionGrid(
+        ...     [[0, 0, 0, 0],
+        ...      [1, 1, 1, 1]],
+        ...     (21, 21),
+        ... )
+        >>> hit_x, hit_y = grid.move_sprite(player, vx * dt, vy * dt)
+        >>> if hit_y and vy > 0:
+        ...     vy = 0  # приземлились
+    """
+
+    def __init__(
+        self,
+        cells: Sequence[Sequence[int]],
+        cell_size: Tuple[int, int],
+        solid_outside: bool = False,
+    ):
+        self.cell_size = (int(cell_size[0]), int(cell_size[1]))
+        if self.cell_size[0] <= 0 or self.cell_size[1] <= 0:
+            raise ValueError("cell_size must be positive")
+        self.solid_outside = solid_outside
+
+        self.rows = len(cells)
+        self.cols = max((len(row) for row in cells), default=0)
+        self._cells = bytearray(self.cols * self.rows)
+        for row_index, row in enumerate(cells):
+            offset = row_index * self.cols
+            for col_index, value in enumerate(row):
+                if value:
+                    self._cells[offset + col_index] = 1
+        self.solid_count = self._cells.count(1)
+
+    @classmethod
+    def from_tilemap(
+        cls,
+        tilemap,
+        solid_ids: Optional[Iterable[int]] = None,
+        solid_outside: bool = False,
+    ) -> "CollisionGrid":
+        """
+        Построить сетку по тайловой карте.
+
+        Аргументы:
+            tilemap: Карта TileMap
+            solid_ids: Id твёрдых тайлов (None — любой непустой тайл)
+            solid_outside: Считать ли твёрдым всё за пределами карты
+
+        Возвращает:
+            Новую сетку с размером клетки, равным размеру тайла
+        """
+        grid = cls([], tilemap.tile_size, solid_outside)
+        grid.rows = tilemap.rows
+        grid.cols = tilemap.cols
+        if solid_ids is None:
+            grid._cells = bytearray(1 if tile_id else 0 for tile_id in tilemap._grid)
+        else:
+            solid = set(solid_ids)
+            grid._cells = bytearray(1 if tile_id in solid else 0 for tile_id in tilemap._grid)
+        grid.solid_count = grid._cells.count(1)
+        return grid
+
+    # Размеры
+    @property
+    def pixel_width(self) -> int:
+        """Ширина сетки в пикселях."""
+        return self.cols * self.cell_size[0]
+
+    @property
+    def pixel_height(self) -> int:
+        """Высота сетки в пикселях."""
+        return self.rows * self.cell_size[1]
+
+    # Поиск клеток
+    def is_solid(self, col: int, row: int) -> bool:
+        """Проверить, твёрдая ли клетка (O(1))."""
+        if 0 <= col < self.cols and 0 <= row < self.rows:
+            return self._cells[row * self.cols + col] != 0
+        return self.solid_outside
+
+    def cell_at(self, x: float, y: float) -> Tuple[int, int]:
+        """Перевести мировые координаты в (столбец, строка)."""
+        return (int(x // self.cell_size[0]), int(y // self.cell_size[1]))
+
+    def is_solid_at(self, x: float, y: float) -> bool:
+        """Проверить, твёрдая ли клетка в точке мира."""
+        col, row = self.cell_at(x, y)
+        return self.is_solid(col, row)
+
+    def _span(self, start: float, end: float, size: int) -> Tuple[int, int]:
+        """Диапазон клеток, которые перекрывает отрезок [start, end) (касание не считается)."""
+        return (
+            math.floor(start / size + _EPS),
+            math.ceil(end / size - _EPS) - 1,
+        )
+
+    def iter_solid(self, bounds: Bounds) -> Iterator[Tuple[int, int]]:
+        """Перебрать твёрдые клетки, которые пересекает прямоугольник."""
+        left, top, right, bottom = bounds
+        col_first, col_last = self._span(left, right, self.cell_size[0])
+        row_first, row_last = self._span(top, bottom, self.cell_size[1])
+        for row in range(row_first, row_last + 1):
+            for col in range(col_first, col_last + 1):
+                if self.is_solid(col, row):
+                    yield (col, row)
+
+    def overlaps(self, bounds: Bounds) -> bool:
+        """Проверить, пересекает ли прямоугольник хотя бы одну твёрдую клетку."""
+        return next(self.iter_solid(bounds), None) is not None
+
+    # Свипы
+    def _line_blocked(self, index: int, first: int, last: int, vertical: bool) -> bool:
+        """Есть ли твёрдая клетка в столбце (vertical=False) или строке index."""
+        if vertical:
+            return any(self.is_solid(col, index) for col in range(first, last + 1))
+        return any(self.is_solid(index, row) for row in range(first, last + 1))
+
+    def _sweep(
+        self,
+        lead: float,
+        delta: float,
+        size: int,
+        cross: Tuple[int, int],
+        count: int,
+        vertical: bool,
+    ) -> float:
+        """Общий свип ведущей грани lead на delta вдоль одной оси."""
+        first, last = cross
+        if delta > 0:
+            index = math.ceil(lead / size - _EPS)
+            # Без твёрдой границы клетки за сеткой пусты — дальше не смотрим
+            end = index + math.ceil(delta / size) + 1
+            if not self.solid_outside:
+                end = min(end, count)
+            while index < end and index * size < lead + delta:
+                if self._line_blocked(index, first, last, vertical):
+                    return max(0.0, index * size - lead)
+                index += 1
+        elif delta < 0:
+            index = math.floor(lead / size + _EPS) - 1
+            end = index - math.ceil(-delta / size) - 1
+            if not self.solid_outside:
+                end = max(end, -1)
+            while index > end and (index + 1) * size > lead + delta:
+                if self._line_blocked(index, first, last, vertical):
+                    return min(0.0, (index + 1) * size - lead)
+                index -= 1
+        return delta
+
+    def sweep_x(self, bounds: Bounds, dx: float) -> float:
+        """
+        Сдвинуть прямоугольник по X до первой твёрдой клетки.
+
+        Аргументы:
+            bounds: Прямоугольник (left, top, right, bottom)
+            dx: Желаемое смещение
+
+        Возвращает:
+            Допустимое смещение (по модулю не больше dx)
+        """
+        left, top, right, bottom = bounds
+        rows = self._span(top, bottom, self.cell_size[1])
+        lead = right if dx > 0 else left
+        return self._sweep(lead, dx, self.cell_size[0], rows, self.cols, False)
+
+    def sweep_y(self, bounds: Bounds, dy: float) -> float:
+        """
+        Сдвинуть прямоугольник по Y до первой твёрдой клетки.
+
+        Аргументы:
+            bounds: Прямоугольник (left, top, right, bottom)
+            dy: Желаемое смещение
+
+        Возвращает:
+            Допустимое смещение (по модулю не больше dy)
+        """
+        left, top, right, bottom = bounds
+        cols = self._span(left, right, self.cell_size[0])
+        lead = bottom if dy > 0 else top
+        return self._sweep(lead, dy, self.cell_size[1], cols, self.rows, True)
+
+    def move(self, bounds: Bounds, dx: float, dy: float) -> Tuple[float, float, bool, bool]:
+        """
+        Переместить прямоугольник сначала по X, затем по Y.
+
+        Возвращает:
+            Кортеж (допустимый dx, допустимый dy, упёрся по X, упёрся по Y)
+        """
+        left, top, right, bottom = bounds
+        allowed_x = self.sweep_x(bounds, dx) if dx else 0.0
+        moved = (left + allowed_x, top, right + allowed_x, bottom)
+        allowed_y = self.sweep_y(moved, dy) if dy else 0.0
+        return (allowed_x, allowed_y, allowed_x != dx, allowed_y != dy)
+
+    def move_sprite(self, sprite, dx: float, dy: float) -> Tuple[bool, bool]:
+        """
+        Переместить спрайт с учётом твёрдых клеток.
+
+        Используется ограничивающий прямоугольник хитбокса спрайта,
+        смещённый на дробную часть позиции, чтобы после упора спрайт
+        стоял точно на грани клетки.
+
+        Аргументы:
+            sprite: Спрайт (AnimatedSprite)
+            dx: Желаемое смещение по X
+            dy: Желаемое смещение по Y
+
+        Возвращает:
+            Кортеж (упёрся по X, упёрся по Y)
+        """
+        x, y = sprite.get_position()
+        left, top, right, bottom = sprite.get_collision_bounds()
+        frac_x = x - int(x)
+        frac_y = y - int(y)
+        bounds = (left + frac_x, top + frac_y, right + frac_x, bottom + frac_y)
+
+        allowed_x, allowed_y, hit_x, hit_y = self.move(bounds, dx, dy)
+        if allowed_x or allowed_y:
+            sprite.set_position(x + allowed_x, y + allowed_y)
+        return (hit_x, hit_y)
+
+    def is_grounded(self, bounds: Bounds, distance: float = 1.0) -> bool:
+        """Проверить, стоит ли прямоугольник на твёрдой клетке (в пределах distance)."""
+        return self.sweep_y(bounds, distance) < distance
+
+    def debug_info(self) -> dict:
+        """Получить отладочную информацию о сетке."""
+        return {
+            "size": (self.cols, self.rows),
+            "cell_size": self.cell_size,
+            "solid_cells": self.solid_count,
+            "bytes": len(self._cells),
+        }
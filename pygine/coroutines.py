@@ -0,0 +1,237 @@
+"""
+Сопрограммы для сценариев, которые ждут, не останавливая игровой цикл.
+
+Сценарий — это генератор (yield) или сопрограмма async def (await),
+которую Game продвигает раз в тик. Ожидание времени, следующего кадра,
+условия или конца анимации не блокирует окно и не тратит процессор.
+
+Пример:
+    >>> def cutscene():
+    ...     player.play_animation("attack")
+    ...     yield animation_finished(player)
+    ...     yield wait_seconds(0.5)
+    ...     player.play_animation("idle")
+    >>> game.start_coroutine(cutscene())
+
+    >>> async def cutscene():
+    ...     player.play_animation("attack")
+    ...     await animation_finished(player)
+    ...     await wait_seconds(0.5)
+    >>> game.start_coroutine(cutscene())
+"""
+
+from typing import Any, Callable, List, Optional
+
+
+class Wait:
+    """
+    Условие ожидания сопрограммы.
+
+    Объект можно вернуть через yield из генератора или дождаться через
+    await в async def. Планировщик вызывает ready(dt) раз в тик и
+    продолжает сценарий, когда условие выполнено.
+    """
+
+    def ready(self, dt: float) -> bool:
+        """Выполнено ли условие (dt — время тика в секундах)."""
+        return True
+
+    def cancel(self) -> None:
+        """Освободить ресурсы условия, если сценарий остановлен раньше."""
+
+    def __await__(self):
+        yield self
+
+
+class _Seconds(Wait):
+    """Ожидание игрового времени."""
+
+    def __init__(self, seconds: float):
+        self.remaining = seconds
+
+    def ready(self, dt: float) -> bool:
+        self.remaining -= dt
+        return self.remaining <= 0
+
+
+class _Until(Wait):
+    """Ожидание, пока функция не вернёт истину."""
+
+    def __init__(self, predicate: Callable[[], bool]):
+        self.predicate = predicate
+
+    def ready(self, dt: float) -> bool:
+        return bool(self.predicate())
+
+
+class _AnimationEvent(Wait):
+    """
+    Ожидание события анимации спрайта через одноразовый обработчик.
+
+    Ожидание относится к клипу, который играл при создании условия: если
+    его остановили или сменили другим play_animation(), ожидание
+    завершается с interrupted = True.
+    """
+
+    def __init__(self, manager, marker: Optional[str] = None):
+        self.manager = manager
+        self.clip = manager.current_animation
+        self.done = False
+        self.interrupted = False
+        if marker is None:
+            if manager.is_finished() or not manager.is_playing:
+                # Ждать нечего: анимация уже закончилась или не играет
+                self.done = True
+                return
+            if self.clip.loop:
+                raise ValueError(
+                    f"Animation '{self.clip.name}' loops and never finishes; "
+                    "wait for a marker or use a non-looping clip"
+                )
+            manager.on_finish(self._fire)
+        else:
+            if not manager.is_playing:
+                self.done = self.interrupted = True
+                return
+            manager.on_marker(marker, self._fire)
+
+    def _fire(self, *args: Any) -> None:
+        self.done = True
+        self.manager.remove_callback(self._fire)
+
+    def ready(self, dt: float) -> bool:
+        if self.done:
+            return True
+        manager = self.manager
+        if manager.current_animation is not self.clip or not manager.is_playing:
+            # Клип сменили или остановили — события уже не будет
+            self.interrupted = True
+            self._fire()
+        return self.done
+
+    def cancel(self) -> None:
+        self.manager.remove_callback(self._fire)
+
+
+def next_frame() -> Wait:
+    """Продолжить сценарий в следующем тике."""
+    return Wait()
+
+
+def wait_seconds(seconds: float) -> Wait:
+    """Продолжить сценарий через seconds секунд игрового времени."""
+    return _Seconds(seconds)
+
+
+def wait_until(predicate: Callable[[], bool]) -> Wait:
+    """Продолжить сценарий, когда predicate() вернёт истину (проверка раз в тик)."""
+    return _Until(predicate)
+
+
+def animation_finished(sprite) -> Wait:
+    """
+    Продолжить сценарий, когда текущая незацикленная анимация спрайта закончится.
+
+    Если анимацию остановят или сменят другой, сценарий продолжится
+    сразу (у условия interrupted = True). Для зацикленной анимации
+    вызывает ValueError. Неблокирующая замена utils.wait_for_animation().
+    """
+    return _AnimationEvent(sprite.animation_manager)
+
+
+def animation_marker(sprite, marker: str) -> Wait:
+    """
+    Продолжить сценарий, когда анимация спрайта войдёт в кадр с меткой marker.
+
+    Если анимацию остановят или сменят другой, сценарий продолжится
+    сразу (у условия interrupted = True).
+    """
+    return _AnimationEvent(sprite.animation_manager, marker)
+
+
+def _as_wait(value: Any) -> Wait:
+    """Перевести значение yield в условие ожидания."""
+    if value is None:
+        return next_frame()
+    if isinstance(value, Wait):
+        return value
+    if isinstance(value, (int, float)):
+        return wait_seconds(value)
+    raise TypeError(f"Coroutine yielded unsupported value {value!r}")
+
+
+class _Routine:
+    """Запущенный сценарий и условие, которого он ждёт."""
+
+    __slots__ = ("routine", "wait")
+
+    def __init__(self, routine):
+        self.routine = routine
+        self.wait: Optional[Wait] = None
+
+
+class Scheduler:
+    """
+    Планировщик сопрограмм: продвигает запущенные сценарии раз в тик.
+
+    Сценарий запускается в первом тике после start(). yield/await
+    принимает условие Wait, число секунд или None (следующий тик).
+    """
+
+    def __init__(self):
+        self._routines: List[_Routine] = []
+
+    def start(self, routine):
+        """
+        Запустить сценарий.
+
+        Аргументы:
+            routine: Генератор или сопрограмма (результат вызова async def)
+
+        Возвращает:
+            Тот же объект (для stop())
+        """
+        self._routines.append(_Routine(routine))
+        return routine
+
+    def stop(self, routine) -> bool:
+        """
+        Остановить сценарий.
+
+        Возвращает:
+            True, если сценарий был запущен
+        """
+        for entry in self._routines:
+            if entry.routine is routine:
+                self._finish(entry)
+                routine.close()
+                return True
+        return False
+
+    def stop_all(self) -> None:
+        """Остановить все сценарии."""
+        for entry in list(self._routines):
+            self._finish(entry)
+            entry.routine.close()
+
+    def _finish(self, entry: _Routine) -> None:
+        if entry.wait is not None:
+            entry.wait.cancel()
+        self._routines.remove(entry)
+
+    def update(self, dt: float) -> None:
+        """Продвинуть сценарии, чьи условия выполнены."""
+        for entry in list(self._routines):
+            if entry not in self._routines:
+                continue  # остановлен другим сценарием в этом тике
+            if entry.wait is not None and not entry.wait.ready(dt):
+                continue
+            try:
+                value = entry.routine.send(None)
+            except StopIteration:
+                self._routines.remove(entry)
+                continue
+            entry.wait = _as_wait(value)
+
+    def __len__(self) -> int:
+        return len(self._routines)
@@ -0,0 +1,572 @@
+"""
+Кэширование кадров спрайтшитов и их трансформаций.
+"""
+
+import pygame
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+# Лимит памяти на один спрайтшит по умолчанию (в байтах)
+DEFAULT_CACHE_LIMIT = 8 * 1024 * 1024
+
+# Шаг квантования угла поворота по умолчанию (в градусах)
+DEFAULT_ROTATION_QUANTUM = 1.0
+
+
+class TransformCache:
+    """
+    LRU-кэш трансформированных кадров одного спрайтшита.
+
+    Хранит результаты масштабирования, отражения и поворота кадров,
+    чтобы в установившемся режиме получение изображения стоило один поиск
+    в словаре вместо трёх выделений Surface. Ключ кэша —
+    (индекс кадра, масштаб, flip_x, flip_y, квантованный угол поворота).
+
+    Здесь же под своими ключами (lookup()/store()) лежат маски кадров,
+    построенные при проверке коллизий на лету. Таблицы предрассчитанных
+    поворотов и заранее построенные маски в лимит не входят: лист
+    закрепляет их отдельно (см. SpriteSheet.get_rotation_table, get_mask).
+
+    Возвращаемые поверхности общие для всех спрайтов одного листа,
+    изменять их нельзя.
+
+    Аргументы:
+        max_bytes: Максимальный объём памяти под кэш в байтах
+        rotation_quantum: Шаг квантования угла поворота в градусах
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_CACHE_LIMIT,
+        rotation_quantum: float = DEFAULT_ROTATION_QUANTUM,
+    ):
+        self.max_bytes = max_bytes
+        self.rotation_quantum = rotation_quantum
+        self._entries: "OrderedDict[Tuple, object]" = OrderedDict()
+        self._sizes: Dict[Tuple, int] = {}
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def quantize_rotation(self, rotation: float) -> float:
+        """Привести угол к ближайшему шагу квантования."""
+        if self.rotation_quantum <= 0:
+            return rotation % 360
+        return (round(rotation / self.rotation_quantum) * self.rotation_quantum) % 360
+
+    def get(
+        self,
+        frames: List[pygame.Surface],
+        frame_index: int,
+        scale: float,
+        flip_x: bool,
+        flip_y: bool,
+        rotation: float,
+    ) -> pygame.Surface:
+        """
+        Получить кадр с применёнными трансформациями.
+
+        Аргументы:
+            frames: Список исходных кадров спрайтшита
+            frame_index: Индекс кадра
+            scale: Масштаб
+            flip_x: Отражение по горизонтали
+            flip_y: Отражение по вертикали
+            rotation: Угол поворота в градусах
+
+        Возвращает:
+            Трансформированную поверхность (общую, только для чтения)
+        """
+        rotation = self.quantize_rotation(rotation)
+
+        # Кадр без трансформаций не требует отдельной копии
+        if scale == 1.0 and not flip_x and not flip_y and rotation == 0:
+            return frames[frame_index]
+
+        key = (frame_index, scale, flip_x, flip_y, rotation)
+        image = self._entries.get(key)
+        if image is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = self._render(frames[frame_index], scale, flip_x, flip_y, rotation)
+        self.store(key, image, surface_bytes(image))
+        return image
+
+    def lookup(self, key: Tuple):
+        """
+        Найти запись кэша по ключу (например, маску кадра).
+
+        Возвращает:
+            Сохранённое значение или None
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    @staticmethod
+    def _render(
+        image: pygame.Surface,
+        scale: float,
+        flip_x: bool,
+        flip_y: bool,
+        rotation: float,
+    ) -> pygame.Surface:
+        """Применить трансформации к кадру."""
+        if scale != 1.0:
+            new_size = (
+                int(image.get_width() * scale),
+                int(image.get_height() * scale),
+            )
+            image = pygame.transform.scale(image, new_size)
+
+        if flip_x or flip_y:
+            image = pygame.transform.flip(image, flip_x, flip_y)
+
+        if rotation != 0:
+            image = pygame.transform.rotate(image, rotation)
+
+        return image
+
+    def store(self, key: Tuple, value, size: int) -> None:
+        """
+        Сохранить запись в кэше, вытесняя самые старые записи.
+
+        Аргументы:
+            key: Ключ записи
+            value: Поверхность, маска или список поверхностей
+            size: Занимаемая память в байтах
+        """
+        if size > self.max_bytes:
+            # Слишком большую запись не кэшируем, чтобы не вытеснить всё остальное
+            return
+
+        previous = self._sizes.pop(key, None)
+        if previous is not None:
+            self.size_bytes -= previous
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self.size_bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        """Вытеснить давно не использованные записи сверх лимита памяти."""
+        while self.size_bytes > self.max_bytes and self._entries:
+            old_key, _ = self._entries.popitem(last=False)
+            self.size_bytes -= self._sizes.pop(old_key)
+
+    def set_limit(self, max_bytes: int) -> None:
+        """Изменить лимит памяти и сразу вытеснить лишнее."""
+        self.max_bytes = max(0, max_bytes)
+        self._evict()
+
+    def clear(self) -> None:
+        """Очистить кэш."""
+        self._entries.clear()
+        self._sizes.clear()
+        self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def debug_info(self) -> Dict:
+        """Получить отладочную информацию о кэше."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def surface_bytes(surface: pygame.Surface) -> int:
+    """Память, занимаемая пикселями поверхности, в байтах."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def mask_bytes(mask: pygame.mask.Mask) -> int:
+    """Память, занимаемая битами маски, в байтах (приблизительно)."""
+    width, height = mask.get_size()
+    return (width * height + 7) // 8
+
+
+class SpriteSheet:
+    """
+    Загруженный спрайтшит с нарезанными кадрами и кэшем трансформаций.
+
+    Экземпляры создаёт и раздаёт FrameStore; кадры хранятся в кортеже
+    и общие для всех спрайтов, поэтому изменять их напрямую нельзя.
+    По умолчанию кадры — это subsurface-представления листа без копирования
+    пикселей; для изменения кадра используйте get_mutable_frame().
+    """
+
+    def __init__(
+        self,
+        path: str,
+        frame_size: Tuple[int, int],
+        image: pygame.Surface,
+        subsurfaces: bool = True,
+    ):
+        self.path = path
+        self.frame_size = frame_size
+        self.image = image
+        self.frames_per_row = image.get_width() // frame_size[0]
+        self.frames_per_col = image.get_height() // frame_size[1]
+        self.frames: Tuple[pygame.Surface, ...] = tuple(
+            extract_frames(image, frame_size, subsurfaces)
+        )
+        self._materialized = [not subsurfaces] * len(self.frames)
+        # Кэш трансформаций; в нём же под ключами ("mask", ...) лежат
+        # маски, построенные на лету
+        self.transforms = TransformCache(_cache_limit)
+        # Закреплённые таблицы поворотов и маски: вне LRU, чтобы поток
+        # поворотов на лету не вытеснил их и не заставил пересчитывать
+        # в игровом кадре. Живут до изменения кадров или выгрузки листа
+        self._pinned: Dict[Tuple, object] = {}
+        self.pinned_bytes = 0
+        self.ref_count = 0
+        # Увеличивается при каждом изменении кадров
+        self.version = 0
+
+    @property
+    def key(self) -> Tuple[str, Tuple[int, int]]:
+        """Ключ листа в хранилище."""
+        return (self.path, self.frame_size)
+
+    def with_frames(self, frames: Iterable[pygame.Surface]) -> "SpriteSheet":
+        """
+        Создать частный лист с тем же изображением и ключом, но своими кадрами.
+
+        Лист не регистрируется в FrameStore; его кэши отдельные.
+
+        Аргументы:
+            frames: Кадры нового листа
+
+        Возвращает:
+            Новый SpriteSheet
+        """
+        sheet = SpriteSheet(self.path, self.frame_size, self.image)
+        sheet.frames = tuple(frames)
+        sheet._materialized = [True] * len(sheet.frames)
+        return sheet
+
+    def get_mutable_frame(self, index: int) -> pygame.Surface:
+        """
+        Получить кадр, который можно изменять.
+
+        Кадр-представление при первом обращении копируется в отдельную
+        поверхность (лист остаётся нетронутым), а кэш трансформаций
+        очищается. Изменения видны всем спрайтам этого листа.
+
+        Аргументы:
+            index: Индекс кадра
+
+        Возвращает:
+            Самостоятельную поверхность кадра
+        """
+        if not self._materialized[index]:
+            frames = list(self.frames)
+            frames[index] = frames[index].copy()
+            self.frames = tuple(frames)
+            self._materialized[index] = True
+        self.clear_caches()
+        self.version += 1
+        return self.frames[index]
+
+    def _pin(self, key: Tuple, value, size: int) -> None:
+        """Закрепить запись вне LRU-кэша."""
+        self._pinned[key] = value
+        self.pinned_bytes += size
+
+    def clear_caches(self) -> None:
+        """Очистить кэш трансформаций и закреплённые таблицы и маски листа."""
+        self.transforms.clear()
+        self._pinned.clear()
+        self.pinned_bytes = 0
+
+    def get_rotation_table(
+        self,
+        steps: int,
+        scale: float,
+        flip_x: bool,
+        flip_y: bool,
+        frame_indices: Iterable[int],
+    ) -> Dict[int, List[pygame.Surface]]:
+        """
+        Получить таблицу предрассчитанных поворотов кадров.
+
+        Для каждого кадра хранится `steps` поверхностей, повёрнутых на
+        i * 360 / steps градусов. Недостающие кадры рассчитываются сразу,
+        поэтому во время игры поворот сводится к поиску в таблице.
+        Повороты кадров закреплены в листе вне лимита кэша трансформаций
+        (см. pinned_bytes) до изменения кадров или выгрузки листа.
+
+        Аргументы:
+            steps: Количество шагов поворота на полный оборот
+            scale: Масштаб
+            flip_x: Отражение по горизонтали
+            flip_y: Отражение по вертикали
+            frame_indices: Индексы кадров, которые должны быть в таблице
+
+        Возвращает:
+            Словарь {индекс кадра: список поверхностей по шагам}
+        """
+        pinned = self._pinned
+        step_angle = 360.0 / steps
+        table = {}
+        for index in frame_indices:
+            if index in table or not 0 <= index < len(self.frames):
+                continue
+            key = ("rotation", steps, scale, flip_x, flip_y, index)
+            rotations = pinned.get(key)
+            if rotations is None:
+                base = TransformCache._render(self.frames[index], scale, flip_x, flip_y, 0)
+                rotations = [base] + [
+                    pygame.transform.rotate(base, step * step_angle)
+                    for step in range(1, steps)
+                ]
+                self._pin(key, rotations, sum(surface_bytes(image) for image in rotations))
+            table[index] = rotations
+        return table
+
+    def get_mask(
+        self,
+        frame_index: int,
+        scale: float = 1.0,
+        flip_x: bool = False,
+        flip_y: bool = False,
+        rotation: float = 0.0,
+        rotation_steps: Optional[int] = None,
+        pin: bool = False,
+    ) -> pygame.mask.Mask:
+        """
+        Получить маску кадра для попиксельной коллизии.
+
+        Маска строится один раз для каждого сочетания кадра, масштаба,
+        отражения и (квантованного) поворота. Маски шагов таблицы поворотов
+        и маски, запрошенные с pin=True, закрепляются в листе вместе с
+        таблицами; остальные берутся из кэша трансформаций (с его лимитом
+        памяти). Маска соответствует изображению, которое спрайт получает
+        из кэша трансформаций или таблицы поворотов с теми же параметрами.
+
+        Аргументы:
+            frame_index: Индекс кадра
+            scale: Масштаб
+            flip_x: Отражение по горизонтали
+            flip_y: Отражение по вертикали
+            rotation: Угол поворота в градусах
+            rotation_steps: Шагов в таблице поворотов (None — поворот на лету)
+            pin: Закрепить маску вне лимита кэша (для заранее построенных)
+
+        Возвращает:
+            Общую маску (только для чтения)
+        """
+        if rotation_steps:
+            step = int(round(rotation * rotation_steps / 360.0)) % rotation_steps
+            rotation_key = ("step", rotation_steps, step)
+        else:
+            rotation_key = self.transforms.quantize_rotation(rotation)
+
+        key = ("mask", frame_index, scale, flip_x, flip_y, rotation_key)
+        mask = self._pinned.get(key)
+        if mask is None:
+            mask = self.transforms.lookup(key)
+        if mask is None:
+            if rotation_steps:
+                image = self.get_rotation_table(
+                    rotation_steps, scale, flip_x, flip_y, (frame_index,)
+                )[frame_index][step]
+            else:
+                image = self.transforms.get(
+                    self.frames, frame_index, scale, flip_x, flip_y, rotation
+                )
+            mask = pygame.mask.from_surface(image)
+            if pin or rotation_steps:
+                self._pin(key, mask, mask_bytes(mask))
+            else:
+                self.transforms.store(key, mask, mask_bytes(mask))
+        elif pin and key not in self._pinned:
+            self._pin(key, mask, mask_bytes(mask))
+        return mask
+
+
+def extract_frames(
+    sheet: pygame.Surface, frame_size: Tuple[int, int], subsurfaces: bool = False
+) -> List[pygame.Surface]:
+    """
+    Нарезать спрайтшит на отдельные кадры (построчно, слева направо).
+
+    Аргументы:
+        sheet: Поверхность спрайтшита
+        frame_size: Размер кадра (width, height)
+        subsurfaces: Вернуть subsurface-представления листа вместо копий
+    """
+    frames = []
+    frame_width, frame_height = frame_size
+
+    for row in range(sheet.get_height() // frame_height):
+        for col in range(sheet.get_width() // frame_width):
+            rect = pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
+
+            if subsurfaces:
+                frames.append(sheet.subsurface(rect))
+            else:
+                frame = pygame.Surface(frame_size, pygame.SRCALPHA)
+                frame.blit(sheet, (0, 0), rect)
+                frames.append(frame)
+
+    return frames
+
+
+class FrameStore:
+    """
+    Общее для процесса хранилище спрайтшитов.
+
+    Лист с заданным путём и размером кадра загружается и нарезается один раз,
+    все последующие спрайты получают тот же объект SpriteSheet. Хранилище
+    считает ссылки, а purge() освобождает листы, которые больше никто
+    не использует (например, при смене сцены).
+
+    Пример:
+        >>> sheet = store.acquire("coin.png", (16, 16))
+        >>> store.release(sheet)
+        >>> store.purge()
+    """
+
+    def __init__(self, use_subsurfaces: bool = True):
+        self._sheets: Dict[Tuple[str, Tuple[int, int]], SpriteSheet] = {}
+        # Нарезать новые листы без копирования пикселей
+        self.use_subsurfaces = use_subsurfaces
+
+    @staticmethod
+    def make_key(
+        image_path: Union[str, Path], frame_size: Tuple[int, int]
+    ) -> Tuple[str, Tuple[int, int]]:
+        """Построить ключ листа по пути и размеру кадра."""
+        return (str(Path(image_path).resolve()), (int(frame_size[0]), int(frame_size[1])))
+
+    def acquire(
+        self, image_path: Union[str, Path], frame_size: Tuple[int, int]
+    ) -> SpriteSheet:
+        """
+        Получить спрайтшит, загрузив его при первом обращении.
+
+        Аргументы:
+            image_path: Путь к изображению спрайтшита
+            frame_size: Размер кадра (width, height)
+
+        Возвращает:
+            Общий объект SpriteSheet (счётчик ссылок увеличивается)
+        """
+        key = self.make_key(image_path, frame_size)
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            image = pygame.image.load(str(image_path)).convert_alpha()
+            sheet = SpriteSheet(key[0], key[1], image, self.use_subsurfaces)
+            self._sheets[key] = sheet
+        sheet.ref_count += 1
+        return sheet
+
+    def release(self, sheet: SpriteSheet) -> None:
+        """Уменьшить счётчик ссылок листа."""
+        if sheet.ref_count > 0:
+            sheet.ref_count -= 1
+
+    def purge(self, force: bool = False) -> int:
+        """
+        Удалить из хранилища неиспользуемые листы.
+
+        Аргументы:
+            force: Удалить все листы, даже используемые (уже созданные
+                спрайты сохранят свои кадры, новые загрузят лист заново)
+
+        Возвращает:
+            Количество удалённых листов
+        """
+        keys = [
+            key
+            for key, sheet in self._sheets.items()
+            if force or sheet.ref_count <= 0
+        ]
+        if not keys:
+            return 0
+
+        from .clips import get_clip_library  # clips импортирует этот модуль
+
+        library = get_clip_library()
+        for key in keys:
+            sheet = self._sheets.pop(key)
+            sheet.clear_caches()
+            library.forget_sheet(sheet)
+        return len(keys)
+
+    def sheets(self) -> List[SpriteSheet]:
+        """Получить список загруженных листов."""
+        return list(self._sheets.values())
+
+    def __contains__(self, key) -> bool:
+        return key in self._sheets
+
+    def __len__(self) -> int:
+        return len(self._sheets)
+
+    def debug_info(self) -> Dict:
+        """Получить отладочную информацию о хранилище."""
+        return {
+            "sheets": len(self._sheets),
+            "references": sum(s.ref_count for s in self._sheets.values()),
+            "transform_cache_bytes": sum(
+                s.transforms.size_bytes for s in self._sheets.values()
+            ),
+            "pinned_bytes": sum(s.pinned_bytes for s in self._sheets.values()),
+        }
+
+
+_cache_limit = DEFAULT_CACHE_LIMIT
+
+# Глобальное хранилище спрайтшитов
+_frame_store = FrameStore()
+
+
+def get_frame_store() -> FrameStore:
+    """Получить глобальное хранилище спрайтшитов."""
+    return _frame_store
+
+
+def purge_frame_store(force: bool = False) -> int:
+    """
+    Освободить неиспользуемые спрайтшиты глобального хранилища.
+
+    Пример:
+        >>> scene_manager.switch_to("level2")
+        >>> purge_frame_store()
+    """
+    return _frame_store.purge(force)
+
+
+def set_transform_cache_limit(max_bytes: int) -> None:
+    """
+    Задать лимит памяти (в байтах) для кэша трансформаций каждого спрайтшита.
+
+    Пример:
+        >>> set_transform_cache_limit(4 * 1024 * 1024)  # 4 МБ на лист
+    """
+    global _cache_limit
+    _cache_limit = max(0, max_bytes)
+    for sheet in _frame_store.sheets():
+        sheet.transforms.set_limit(_cache_limit)
+
+
+def clear_transform_caches() -> None:
+    """Очистить кэши трансформаций всех спрайтшитов."""
+    for sheet in _frame_store.sheets():
+        sheet.transforms.clear()
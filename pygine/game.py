@@ -4,9 +4,25 @@
 
 import pygame
 import sys
-from typing import Tuple, Optional, Callable, List, Union
-from .utils import update_input_state
+from typing import TYPE_CHECKING, Tuple, Optional, Callable, List, Union, Dict
+from .utils import consume_input_edges, update_input_state
 from .effects import get_screen_shake_offset
+from .sprite import AnimatedSprite
+from .render import RenderQueue
+from .camera import Camera
+from .broadphase import SpatialHash, LooseQuadtree
+from .coroutines import Scheduler
+
+if TYPE_CHECKING:
+    # animation_system требует NumPy и импортируется при включении системы
+    from .animation_system import AnimationSystem
+
+# Имена обработчиков спрайта для событий коллизий
+_COLLISION_HANDLERS = {
+    "enter": "on_collision_enter",
+    "stay": "on_collision_stay",
+    "exit": "on_collision_exit",
+}
 
 
 class Game:
@@ -26,6 +42,9 @@ class Game:
         background_image: Путь к изображению фона (опционально)
         *,
         create_display: bool = True,
+        dirty_rects: Перерисовывать только изменившиеся области экрана
+        fixed_timestep: Частота симуляции (тиков в секунду) для режима
+            фиксированного шага, None — шаг равен времени кадра
 
     Пример:
         >>> game = Game(800, 600, "Моя Игра")
@@ -54,6 +73,8 @@ class Game:
         background_image: Optional[str] = None,
         *,
         create_display: bool = True,
+        dirty_rects: bool = False,
+        fixed_timestep: Optional[float] = None,
     ):
         # Инициализируем pygame
         if not pygame.get_init():
@@ -97,6 +118,17 @@ class Game:
         self.dt = 0.0
         self.last_time = 0.0
 
+        # Фиксированный шаг симуляции (включается set_fixed_timestep)
+        self.fixed_dt: Optional[float] = None
+        self.max_catch_up_steps = 5  # тиков за кадр, не больше
+        self.interpolate = True  # сглаживать отрисовку между тиками
+        self.interpolation_alpha = 1.0  # доля пути от прошлого тика к текущему
+        self.interpolation_max_distance = 100  # больший скачок — телепорт, без сглаживания
+        self.steps_last_frame = 0
+        self.dropped_time = 0.0  # время, отброшенное из-за лимита тиков
+        self._accumulator = 0.0
+        self._interpolating = False  # был ли тик, от которого интерполировать
+
         # Колбэки событий
         self.update_callback: Optional[Callable] = None
         self.draw_callback: Optional[Callable] = None
@@ -105,9 +137,69 @@ class Game:
         # Группа спрайтов для автоматического управления
         self.all_sprites = pygame.sprite.Group()
 
+        # Очередь пакетной отрисовки: сцены и спрайты добавляют в неё блиты,
+        # а игра выводит их одним Surface.blits на слой
+        self.render_queue = RenderQueue()
+
+        # Камера: отсечение невидимых спрайтов и смещение отрисовки
+        self.camera: Optional[Camera] = None
+        self.cull_margin = 64  # запас вокруг области просмотра в пикселях
+        self.cull_updates = False  # не анимировать спрайты вне экрана
+        self._drawn_camera_offset: Optional[Tuple[int, int]] = None
+        self.visible_sprite_count = 0
+
+        # Широкая фаза коллизий для спрайтов игры (включается enable_broadphase)
+        self.broadphase: Optional[Union[SpatialHash, LooseQuadtree]] = None
+
+        # События коллизий: один проход за кадр и рассылка enter/stay/exit
+        self.collision_events = False
+        self.collision_callbacks: List[Callable] = []
+        # Пары прошлого прохода событий. Пары хранятся в словарях (ключ —
+        # пара, значение None), а не в множествах: словари сохраняют
+        # порядок широкой фазы, и события рассылаются в одном и том же порядке
+        self._event_contacts: Dict[Tuple, None] = {}
+        # Кэш столкновений текущего кадра (сбрасывается в начале обновления)
+        self._contacts: Dict[Tuple, None] = {}
+        self._contacts_by_sprite: Dict = {}
+        self._contacts_fresh = False
+
+        # Общая система анимаций (включается enable_animation_system)
+        self.animation_system: Optional["AnimationSystem"] = None
+        self.frame_changed_sprites: List[AnimatedSprite] = []  # сменили кадр за тик
+
+        # Сценарии-сопрограммы, продвигаемые раз в тик (start_coroutine)
+        self.scheduler = Scheduler()
+
+        # Миры физики, которые шагают раз в тик до обновления спрайтов
+        self.physics_worlds: List = []
+
+        # Тайловые карты, рисуемые поверх фона под спрайтами
+        self.tilemaps: List = []
+
+        # Элементы интерфейса, которыми управляет игра
+        self.ui_elements: List = []
+
+        # Режим грязных прямоугольников: восстанавливаем фон и обновляем
+        # дисплей только в областях, где что-то изменилось
+        self.dirty_rects = dirty_rects
+        self._full_redraw = True
+        self._pending_dirty: List[pygame.Rect] = []
+        self._drawn_sprites: Dict = {}
+        self._drawn_ui: Dict = {}
+        self._fill_surface: Optional[pygame.Surface] = None
+        self._fps_rect: Optional[pygame.Rect] = None
+
+        # Задний буфер для тряски экрана, переиспользуется между кадрами
+        self._shake_buffer: Optional[pygame.Surface] = None
+        self.last_dirty_rects: List[pygame.Rect] = []
+
         # Отладочная информация
         self.show_fps = False
         self.font = None
+        self.sprites_rebuilt = 0  # спрайтов с перестроенным изображением за кадр
+
+        if fixed_timestep is not None:
+            self.set_fixed_timestep(fixed_timestep)
 
     def _load_background_image(self, image_path: str) -> None:
         """
@@ -179,16 +271,15 @@ class Game:
             # Handle events
             self._handle_events()
 
-            # Update input state
-            update_input_state()
-
-            if not self.paused:
-                # Update game logic
-                self._update()
+            # Update input state and game logic
+            self._advance(self.dt)
 
             # Draw everything
             self._draw()
 
+            # Сколько спрайтов реально перестроили изображение за кадр
+            self.sprites_rebuilt = AnimatedSprite.pop_rebuild_count()
+
             # Maintain frame rate
             self.clock.tick(self.fps)
 
@@ -203,30 +294,206 @@ class Game:
                 elif event.key == pygame.K_PAUSE or event.key == pygame.K_p:
                     self.toggle_pause()
 
+            # Передаём событие элементам интерфейса
+            for element in self.ui_elements:
+                element.handle_event(event)
+
             # Call custom event callbacks
             for callback in self.event_callbacks:
                 callback(event)
 
     def _update(self) -> None:
         """Обновить игровую логику."""
+        # Спрайты сейчас сдвинутся — столкновения прошлого кадра устарели
+        self._contacts_fresh = False
+
+        # Все анимации продвигаются одним проходом до обновления спрайтов
+        if self.animation_system is not None:
+            self.frame_changed_sprites = self.animation_system.step(self.dt)
+
+        # Тела миров интегрируются одним векторным шагом; спрайты затем
+        # берут смещения своих тел из массивов мира
+        for world in self.physics_worlds:
+            world.step(self.dt)
+
         # Update all sprites in the group
-        self.all_sprites.update(self.dt)
+        if self.camera is not None:
+            self.camera.update(self.dt)
+
+        if self.camera is not None and self.cull_updates:
+            # Спрайты вне области просмотра двигаются, но не анимируются
+            view = self.camera.get_view_rect(self.cull_margin)
+            # (флаг на время вызова, а не аргумент: подклассы могут
+            # переопределять update(dt))
+            for sprite in self.all_sprites:
+                if isinstance(sprite, AnimatedSprite) and not sprite.rect.colliderect(view):
+                    sprite._culled = True
+                    sprite.update(self.dt)
+                    sprite._culled = False
+                else:
+                    sprite.update(self.dt)
+        else:
+            self.all_sprites.update(self.dt)
+
+        # Обновляем элементы интерфейса
+        for element in self.ui_elements:
+            element.update(self.dt)
+
+        # Сценарии видят состояние спрайтов уже после их обновления
+        if self.scheduler:
+            self.scheduler.update(self.dt)
 
         # Call custom update function
         if self.update_callback:
             self.update_callback()
 
+        # Один проход коллизий за кадр, когда вся логика уже отработала
+        if self.collision_events:
+            self._collision_pass()
+
+    def _advance(self, frame_time: float) -> None:
+        """Обновить состояние ввода и игровую логику за кадр длиной frame_time."""
+        # В режиме фиксированного шага нажатия копятся до ближайшего тика
+        # (см. _run_fixed_steps)
+        update_input_state(keep_edges=self.fixed_dt is not None and not self.paused)
+
+        if not self.paused:
+            if self.fixed_dt is None:
+                self._update()
+            else:
+                self._run_fixed_steps(frame_time)
+
+    def _run_fixed_steps(self, frame_time: float) -> None:
+        """
+        Выполнить накопившиеся тики фиксированного шага.
+
+        Время кадра копится в аккумуляторе, и за кадр выполняется столько
+        тиков по fixed_dt, сколько в нём помещается, но не больше
+        max_catch_up_steps. Остаток задаёт долю интерполяции отрисовки.
+
+        key_just_pressed() и другие "только что" видит ровно один тик:
+        нажатие из кадра без тиков ждёт следующего тика, а после первого
+        тика кадра сбрасывается.
+        """
+        step = self.fixed_dt
+        self._accumulator += frame_time
+        steps = 0
+        while self._accumulator >= step:
+            if steps >= self.max_catch_up_steps:
+                # Не успеваем догнать: отбрасываем отставание, а не копим его
+                dropped = self._accumulator - self._accumulator % step
+                self.dropped_time += dropped
+                self._accumulator -= dropped
+                break
+
+            self.dt = step
+            self._update()
+            if not steps:
+                consume_input_edges()
+            self._accumulator -= step
+            steps += 1
+
+        self.steps_last_frame = steps
+        if steps:
+            self._interpolating = self.interpolate
+        self.interpolation_alpha = self._accumulator / step if self.interpolate else 1.0
+
+    def _interpolated(self, sprite: pygame.sprite.Sprite, rect: pygame.Rect) -> pygame.Rect:
+        """
+        Сдвинуть rect спрайта к позиции между двумя последними тиками.
+
+        Прошлую позицию спрайт запоминает сам в начале update();
+        спрайты без неё (не AnimatedSprite) рисуются как есть.
+        """
+        previous = getattr(sprite, "_previous_center", None)
+        if previous is None:
+            return rect
+        back = 1.0 - self.interpolation_alpha
+        dx = previous[0] - sprite.rect.centerx
+        dy = previous[1] - sprite.rect.centery
+        limit = self.interpolation_max_distance
+        if (dx == 0 and dy == 0) or abs(dx) > limit or abs(dy) > limit:
+            return rect
+        return rect.move(round(dx * back), round(dy * back))
+
+    def get_draw_rect(self, sprite: pygame.sprite.Sprite) -> pygame.Rect:
+        """
+        Получить экранный прямоугольник спрайта для отрисовки.
+
+        Учитывает смещение камеры и, в режиме фиксированного шага,
+        интерполяцию между двумя последними тиками. Используйте его
+        вместо sprite.rect, если рисуете спрайт сами.
+
+        Пример:
+            >>> game.render_queue.submit(player.image, game.get_draw_rect(player))
+        """
+        rect = sprite.rect
+        if self.camera is not None:
+            rect = rect.move(self.camera.get_offset())
+        if self.fixed_dt is not None and self._interpolating:
+            rect = self._interpolated(sprite, rect)
+        return rect
+
+    def set_fixed_timestep(
+        self,
+        rate: Optional[float],
+        max_catch_up_steps: int = 5,
+        interpolate: bool = True,
+    ) -> None:
+        """
+        Включить режим фиксированного шага симуляции.
+
+        Логика (спрайты, интерфейс, функция обновления) выполняется
+        тиками постоянной длины 1 / rate, поэтому физика ведёт себя
+        одинаково при 30 и 144 FPS, а долгий кадр не даёт огромного dt.
+        За один кадр выполняется не больше max_catch_up_steps тиков,
+        лишнее время отбрасывается. Отрисовка интерполирует спрайты между
+        двумя последними тиками, так что частоту симуляции можно задать
+        ниже частоты кадров. get_delta_time() внутри тика возвращает шаг.
+
+        Аргументы:
+            rate: Тиков в секунду или None, чтобы вернуть переменный шаг
+            max_catch_up_steps: Максимум тиков за один кадр
+            interpolate: Интерполировать отрисовку между тиками
+
+        Пример:
+            >>> game.set_fixed_timestep(60)
+        """
+        if rate is None:
+            self.fixed_dt = None
+        elif rate <= 0:
+            raise ValueError("fixed timestep rate must be positive")
+        else:
+            self.fixed_dt = 1.0 / rate
+        self.max_catch_up_steps = max(1, int(max_catch_up_steps))
+        self.interpolate = interpolate
+        self.interpolation_alpha = 1.0
+        self._accumulator = 0.0
+        self._interpolating = False
+
     def _draw(self) -> None:
         """Отрисовать всё на экран."""
         # Получаем смещение тряски экрана
         shake_offset = get_screen_shake_offset()
-        
-        # Создаём временную поверхность для применения тряски
+
+        visible = self._visible_sprites()
+
+        if (
+            self.dirty_rects
+            and self.camera is not None
+            and self.camera.get_offset() != self._drawn_camera_offset
+        ):
+            # Сдвиг камеры меняет весь экран
+            self._full_redraw = True
+
+        if self.dirty_rects and not self._full_redraw and shake_offset == (0.0, 0.0):
+            self._draw_dirty(visible)
+            return
+
+        # При тряске рисуем кадр в постоянный задний буфер
         if shake_offset != (0.0, 0.0):
-            # Создаём временный экран для отрисовки
-            temp_surface = pygame.Surface((self.width, self.height))
             original_screen = self.screen
-            self.screen = temp_surface
+            self.screen = self._get_shake_buffer()
         
         # Отрисовка фона
         if self.background_surface is not None:
@@ -236,13 +503,26 @@ class Game:
             # Используем цветовой фон
             self.screen.fill(self.background_color)
 
+        # Тайловые карты рисуются чанками со смещением камеры
+        for tilemap in self.tilemaps:
+            tilemap.draw(self.screen, self.camera)
+
         # Draw all sprites
-        self.all_sprites.draw(self.screen)
+        for sprite, dest in visible:
+            self.render_queue.submit(sprite.image, dest)
+        self.render_queue.flush(self.screen)
+
+        # Рисуем элементы интерфейса
+        for element in self.ui_elements:
+            element.draw(self.screen)
 
         # Call custom draw function
         if self.draw_callback:
             self.draw_callback()
 
+        # Выводим блиты, добавленные в очередь функцией отрисовки
+        self.render_queue.flush(self.screen)
+
         # Draw debug information
         if self.show_fps:
             self._draw_fps()
@@ -250,15 +530,225 @@ class Game:
         # Применяем тряску, если активна
         if shake_offset != (0.0, 0.0):
             # Восстанавливаем оригинальный экран
+            back_buffer = self.screen
             self.screen = original_screen
-            # Очищаем экран и рисуем с смещением
-            self.screen.fill((0, 0, 0))  # Чёрный фон для границ при тряске
-            self.screen.blit(temp_surface, (int(shake_offset[0]), int(shake_offset[1])))
+            self._present_shaken(back_buffer, int(shake_offset[0]), int(shake_offset[1]))
+
+        if self.dirty_rects:
+            # Запоминаем нарисованное; после тряски нужен ещё один полный кадр
+            self._remember_drawn_state(visible)
+            self._pending_dirty.clear()
+            self._full_redraw = shake_offset != (0.0, 0.0)
+            self.last_dirty_rects = [self.screen.get_rect()]
 
         # Обновляем только если инициализировано окно отображения
         if pygame.display.get_init() and pygame.display.get_surface() is not None:
             pygame.display.flip()
 
+    def _visible_sprites(self) -> List[Tuple[pygame.sprite.Sprite, pygame.Rect]]:
+        """
+        Получить спрайты для отрисовки вместе с их экранными прямоугольниками.
+
+        С камерой остаются только спрайты, пересекающие область просмотра
+        (с запасом cull_margin), а их rect смещаются на смещение камеры.
+        """
+        if self.camera is None:
+            visible = [(sprite, sprite.rect) for sprite in self.all_sprites]
+        else:
+            view = self.camera.get_view_rect(self.cull_margin)
+            offset = self.camera.get_offset()
+            visible = [
+                (sprite, sprite.rect.move(offset))
+                for sprite in self.all_sprites
+                if sprite.rect.colliderect(view)
+            ]
+        if self.fixed_dt is not None and self._interpolating:
+            # Рисуем спрайты между двумя последними тиками симуляции
+            visible = [(sprite, self._interpolated(sprite, dest)) for sprite, dest in visible]
+        self.visible_sprite_count = len(visible)
+        return visible
+
+    def _get_shake_buffer(self) -> pygame.Surface:
+        """Получить задний буфер для тряски (создаётся один раз и переиспользуется)."""
+        buffer = self._shake_buffer
+        if buffer is None or buffer.get_size() != self.screen.get_size():
+            buffer = pygame.Surface(self.screen.get_size(), 0, self.screen)
+            self._shake_buffer = buffer
+        return buffer
+
+    def _present_shaken(self, back_buffer: pygame.Surface, dx: int, dy: int) -> None:
+        """Вывести задний буфер со смещением, закрасив открывшиеся полосы."""
+        self.screen.blit(back_buffer, (dx, dy))
+
+        # Чёрный фон только для границ, открывшихся при тряске
+        width, height = self.screen.get_size()
+        if dx > 0:
+            self.screen.fill((0, 0, 0), (0, 0, dx, height))
+        elif dx < 0:
+            self.screen.fill((0, 0, 0), (width + dx, 0, -dx, height))
+        if dy > 0:
+            self.screen.fill((0, 0, 0), (0, 0, width, dy))
+        elif dy < 0:
+            self.screen.fill((0, 0, 0), (0, height + dy, width, -dy))
+
+    def _draw_dirty(self, visible: List[Tuple[pygame.sprite.Sprite, pygame.Rect]]) -> None:
+        """
+        Отрисовать кадр в режиме грязных прямоугольников.
+
+        Если ничего не изменилось, функция отрисовки не вызывается.
+        """
+        screen = self.screen
+        background = self._get_background()
+        dirty = self._collect_dirty_rects(visible)
+
+        # Спрайты, задетые грязными областями, перерисовываются целиком,
+        # поэтому их прямоугольники тоже восстанавливаем
+        if dirty:
+            for _, dest in visible:
+                if dest.collidelist(dirty) != -1:
+                    dirty.append(dest.copy())
+
+        screen_rect = screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in dirty]
+        dirty = [rect for rect in dirty if rect.width > 0 and rect.height > 0]
+
+        # Восстанавливаем фон (и тайловые карты) только в грязных областях
+        for rect in dirty:
+            screen.blit(background, rect, rect)
+            for tilemap in self.tilemaps:
+                tilemap.draw(screen, self.camera, rect)
+
+        if dirty:
+            for sprite, dest in visible:
+                if dest.collidelist(dirty) != -1:
+                    self.render_queue.submit(sprite.image, dest)
+            self.render_queue.flush(screen)
+
+            for element in self.ui_elements:
+                if element.rect.collidelist(dirty) != -1:
+                    element.draw(screen)
+
+            # Call custom draw function
+            if self.draw_callback:
+                self.draw_callback()
+
+        # Выводим блиты, добавленные в очередь функцией отрисовки
+        self.render_queue.flush(screen)
+
+        # Draw debug information
+        if self.show_fps:
+            self._draw_fps()
+            dirty.append(self._fps_rect)
+
+        self.last_dirty_rects = dirty
+
+        if dirty and pygame.display.get_init() and pygame.display.get_surface() is not None:
+            pygame.display.update(dirty)
+
+    def _collect_dirty_rects(
+        self, visible: List[Tuple[pygame.sprite.Sprite, pygame.Rect]]
+    ) -> List[pygame.Rect]:
+        """Собрать области экрана, изменившиеся с прошлого кадра."""
+        dirty = self._pending_dirty
+        self._pending_dirty = []
+
+        # Спрайты: объединение старого и нового rect для изменившихся
+        drawn = self._drawn_sprites
+        current = {}
+        for sprite, rect in visible:
+            image = sprite.image
+            previous = drawn.pop(sprite, None)
+            current[sprite] = (rect.copy(), image)
+            if previous is None:
+                dirty.append(rect.copy())
+            elif previous[1] is not image or previous[0] != rect:
+                self._add_moved_rect(dirty, previous[0], rect)
+        # Удалённые и ушедшие из вида спрайты оставляют область для очистки
+        dirty.extend(old_rect for old_rect, _ in drawn.values())
+        self._drawn_sprites = current
+
+        # Элементы интерфейса: сравниваем rect и визуальное состояние
+        drawn = self._drawn_ui
+        current = {}
+        for element in self.ui_elements:
+            state = element.render_state()
+            previous = drawn.pop(element, None)
+            current[element] = (element.rect.copy(), state)
+            if previous is None:
+                dirty.append(element.rect.copy())
+            elif previous[1] != state or previous[0] != element.rect:
+                self._add_moved_rect(dirty, previous[0], element.rect)
+        dirty.extend(old_rect for old_rect, _ in drawn.values())
+        self._drawn_ui = current
+
+        return dirty
+
+    @staticmethod
+    def _add_moved_rect(
+        dirty: List[pygame.Rect], old_rect: pygame.Rect, new_rect: pygame.Rect
+    ) -> None:
+        """Добавить старую и новую области объекта (объединив, если пересекаются)."""
+        if old_rect.colliderect(new_rect):
+            dirty.append(old_rect.union(new_rect))
+        else:
+            dirty.append(old_rect)
+            dirty.append(new_rect.copy())
+
+    def _remember_drawn_state(
+        self, visible: List[Tuple[pygame.sprite.Sprite, pygame.Rect]]
+    ) -> None:
+        """Запомнить, что и где нарисовано после полной перерисовки."""
+        self._drawn_sprites = {
+            sprite: (dest.copy(), sprite.image) for sprite, dest in visible
+        }
+        self._drawn_camera_offset = (
+            self.camera.get_offset() if self.camera is not None else None
+        )
+        self._drawn_ui = {
+            element: (element.rect.copy(), element.render_state())
+            for element in self.ui_elements
+        }
+
+    def _get_background(self) -> pygame.Surface:
+        """Получить поверхность фона для восстановления грязных областей."""
+        if self.background_surface is not None:
+            return self.background_surface
+
+        fill = self._fill_surface
+        if fill is None or fill.get_size() != (self.width, self.height):
+            fill = self._fill_surface = pygame.Surface((self.width, self.height))
+        fill.fill(self.background_color)
+        return fill
+
+    def mark_dirty(self, rect: Union[pygame.Rect, Tuple[int, int, int, int]]) -> None:
+        """
+        Отметить область экрана для перерисовки в режиме грязных прямоугольников.
+
+        Нужна, если функция отрисовки рисует что-то меняющееся напрямую
+        на экране, минуя спрайты и элементы интерфейса игры.
+
+        Аргументы:
+            rect: Область экрана
+        """
+        self._pending_dirty.append(pygame.Rect(rect))
+
+    def set_dirty_rects(self, enabled: bool) -> None:
+        """
+        Включить или выключить режим грязных прямоугольников.
+
+        В этом режиме фон восстанавливается, а дисплей обновляется только
+        в областях изменившихся спрайтов и элементов интерфейса. Функция
+        отрисовки вызывается только в кадрах, где что-то изменилось:
+        меняющееся содержимое, которое она рисует сама, отмечайте через
+        mark_dirty() из логики обновления.
+        """
+        self.dirty_rects = enabled
+        self.redraw_all()
+
+    def redraw_all(self) -> None:
+        """Полностью перерисовать экран в следующем кадре."""
+        self._full_redraw = True
+
     def _draw_fps(self) -> None:
         """Отрисовать счётчик FPS."""
         if not self.font:
@@ -266,7 +756,10 @@ class Game:
 
         fps_text = f"FPS: {int(self.clock.get_fps())}"
         fps_surface = self.font.render(fps_text, True, (255, 255, 255))
-        self.screen.blit(fps_surface, (10, 10))
+        self._fps_rect = self.screen.blit(fps_surface, (10, 10))
+        if self.dirty_rects:
+            # Следующий кадр сотрёт старый текст счётчика
+            self._pending_dirty.append(self._fps_rect)
 
     def add_sprite(self, sprite: pygame.sprite.Sprite) -> None:
         """
@@ -275,7 +768,12 @@ class Game:
         Аргументы:
             sprite: Спрайт, который нужно добавить
         """
+        # Широкая фаза привязана к all_sprites и регистрирует спрайт сама
         self.all_sprites.add(sprite)
+        if self.animation_system is not None:
+            for item in self._iter_sprites(sprite):
+                if isinstance(item, AnimatedSprite):
+                    self.animation_system.add(item)
 
     def remove_sprite(self, sprite: pygame.sprite.Sprite) -> None:
         """
@@ -285,6 +783,336 @@ class Game:
             sprite: Спрайт, который нужно удалить
         """
         self.all_sprites.remove(sprite)
+        if self.animation_system is not None:
+            for item in self._iter_sprites(sprite):
+                if isinstance(item, AnimatedSprite):
+                    self.animation_system.remove(item)
+
+    @staticmethod
+    def _iter_sprites(sprites) -> List[pygame.sprite.Sprite]:
+        """Развернуть спрайт или коллекцию спрайтов в список."""
+        if isinstance(sprites, pygame.sprite.Sprite):
+            return [sprites]
+        return list(sprites)
+
+    def enable_broadphase(
+        self,
+        cell_size: float = 64,
+        world_bounds: Optional[Tuple[float, float, float, float]] = None,
+    ) -> None:
+        """
+        Включить широкую фазу коллизий для спрайтов игры.
+
+        Группа all_sprites привязывается к пространственному хэшу
+        (bind_group): все AnimatedSprite игры, текущие и добавленные позже,
+        регистрируются в нём, после чего collides_with_group() и
+        get_colliding_pairs() проверяют точно только близкие пары.
+
+        Аргументы:
+            cell_size: Размер ячейки хэша в пикселях
+            world_bounds: Если задано (left, top, width, height), вместо
+                хэша используется свободное квадродерево этой области
+        """
+        if self.broadphase is not None:
+            self.broadphase.unbind_group(self.all_sprites)
+            self.broadphase.clear()
+
+        if world_bounds is not None:
+            self.broadphase = LooseQuadtree(world_bounds)
+        else:
+            self.broadphase = SpatialHash(cell_size)
+        self.broadphase.bind_group(self.all_sprites)
+
+    def enable_animation_system(self) -> "AnimationSystem":
+        """
+        Включить общую систему анимаций для спрайтов игры.
+
+        Все AnimatedSprite игры (текущие и добавленные позже) передают
+        состояние анимаций в AnimationSystem, и в начале каждого тика
+        их кадры продвигаются одним векторным проходом. Спрайты, у которых
+        за тик сменился кадр, доступны в frame_changed_sprites.
+
+        Возвращает:
+            Систему анимаций игры
+        """
+        if self.animation_system is None:
+            from .animation_system import AnimationSystem
+
+            self.animation_system = AnimationSystem()
+            for sprite in self.all_sprites:
+                if isinstance(sprite, AnimatedSprite):
+                    self.animation_system.add(sprite)
+        return self.animation_system
+
+    def add_physics_world(self, world) -> None:
+        """
+        Добавить мир физики, который игра шагает раз в тик.
+
+        Все тела мира интегрируются одним вызовом world.step() до
+        обновления спрайтов, а спрайты с прикреплёнными телами этого мира
+        берут из него свои смещения.
+
+        Аргументы:
+            world: PhysicsWorld
+
+        Пример:
+            >>> world = PhysicsWorld()
+            >>> game.add_physics_world(world)
+            >>> for enemy in enemies:
+            ...     enemy.attach_body(world.create_body(gravity=900))
+        """
+        if world not in self.physics_worlds:
+            self.physics_worlds.append(world)
+
+    def remove_physics_world(self, world) -> None:
+        """Перестать шагать мир физики."""
+        if world in self.physics_worlds:
+            self.physics_worlds.remove(world)
+
+    def start_coroutine(self, routine):
+        """
+        Запустить сценарий, который ждёт, не блокируя игровой цикл.
+
+        Сценарий — генератор или сопрограмма async def; игра продвигает
+        его раз в тик, начиная со следующего. Ждать можно условий из
+        pygine.coroutines (wait_seconds, animation_finished и др.),
+        числа секунд или None (следующий тик).
+
+        Аргументы:
+            routine: Генератор или сопрограмма
+
+        Возвращает:
+            Тот же объект (для stop_coroutine)
+
+        Пример:
+            >>> def open_chest():
+            ...     chest.play_animation("open")
+            ...     yield animation_finished(chest)
+            ...     yield 0.5
+            ...     spawn_loot()
+            >>> game.start_coroutine(open_chest())
+        """
+        return self.scheduler.start(routine)
+
+    def stop_coroutine(self, routine) -> bool:
+        """Остановить сценарий, запущенный start_coroutine()."""
+        return self.scheduler.stop(routine)
+
+    def get_colliding_pairs(self) -> List[Tuple[AnimatedSprite, AnimatedSprite]]:
+        """
+        Получить все пары спрайтов игры, сталкивающиеся в этом кадре.
+
+        Результат кэшируется до начала следующего обновления, поэтому
+        повторные запросы в том же кадре не пересчитывают геометрию.
+
+        Возвращает:
+            Список пар (a, b)
+        """
+        return list(self._get_contacts())
+
+    def get_collisions(self, sprite: AnimatedSprite) -> List[AnimatedSprite]:
+        """
+        Получить спрайты игры, с которыми сталкивается данный (из кэша кадра).
+
+        Аргументы:
+            sprite: Спрайт
+
+        Возвращает:
+            Список спрайтов
+        """
+        self._get_contacts()
+        return list(self._contacts_by_sprite.get(sprite, ()))
+
+    def is_colliding(self, a: AnimatedSprite, b: AnimatedSprite) -> bool:
+        """Проверить по кэшу кадра, сталкиваются ли два спрайта игры."""
+        self._get_contacts()
+        return b in self._contacts_by_sprite.get(a, ())
+
+    def _get_contacts(self) -> Dict[Tuple, None]:
+        """Получить столкновения кадра, вычислив их при первом запросе."""
+        if not self._contacts_fresh:
+            if self.broadphase is None:
+                self.enable_broadphase()
+            contacts = self._find_contacts(self._contacts)
+            by_sprite: Dict = {}
+            for a, b in contacts:
+                by_sprite.setdefault(a, {})[b] = None
+                by_sprite.setdefault(b, {})[a] = None
+            self._contacts = contacts
+            self._contacts_by_sprite = by_sprite
+            self._contacts_fresh = True
+        return self._contacts
+
+    def _find_contacts(self, previous: Dict[Tuple, None]) -> Dict[Tuple, None]:
+        """
+        Проверить пары-кандидаты широкой фазы.
+
+        Пара двух спящих спрайтов не проверяется: она сохраняет
+        состояние прошлого прохода. Новое касание будит спящие тела.
+        Спрайты, убранные из всех групп в обход kill() и remove_sprite(),
+        снимаются с широкой фазы.
+        """
+        broadphase = self.broadphase
+        dead = [sprite for sprite in broadphase if not sprite.alive()]
+        for sprite in dead:
+            broadphase.remove(sprite)
+
+        contacts: Dict[Tuple, None] = {}
+        for a, b in broadphase.candidate_pairs():
+            a_sleeping = a.is_sleeping()
+            b_sleeping = b.is_sleeping()
+            if a_sleeping and b_sleeping:
+                if (a, b) in previous:
+                    contacts[(a, b)] = None
+                continue
+            if a.collides_with(b):
+                contacts[(a, b)] = None
+                if (a, b) not in previous:
+                    if a_sleeping:
+                        a.body.wake()
+                    if b_sleeping:
+                        b.body.wake()
+        return contacts
+
+    def enable_collision_events(self, enabled: bool = True) -> None:
+        """
+        Включить рассылку событий коллизий.
+
+        Раз в кадр, после обновления спрайтов и пользовательской логики,
+        игра находит все сталкивающиеся пары (через широкую фазу) и для
+        каждой пары вызывает у обоих спрайтов обработчики
+        on_collision_enter (пара только что столкнулась),
+        on_collision_stay (продолжает касаться) и on_collision_exit
+        (разошлась), передавая второй спрайт. Затем вызываются функции
+        из add_collision_callback(). Результат прохода кэшируется, и
+        get_colliding_pairs()/get_collisions()/is_colliding() до конца
+        кадра его не пересчитывают. Спрайт, убитый в обработчике
+        (kill()), в следующем проходе получает exit для своих пар.
+
+        Аргументы:
+            enabled: Включить или выключить события
+
+        Пример:
+            >>> coin.on_collision_enter = lambda other: coin.kill()
+            >>> game.enable_collision_events()
+        """
+        self.collision_events = enabled
+        self._event_contacts = {}
+        if enabled and self.broadphase is None:
+            self.enable_broadphase()
+
+    def add_collision_callback(self, callback: Callable) -> None:
+        """
+        Добавить обработчик событий коллизий всей игры.
+
+        Аргументы:
+            callback: Функция (event, a, b), где event — "enter", "stay"
+                или "exit"
+        """
+        self.collision_callbacks.append(callback)
+
+    def _collision_pass(self) -> None:
+        """
+        Найти столкновения кадра и разослать события enter/stay/exit.
+
+        Порядок событий стабилен: enter и stay идут в порядке пар широкой
+        фазы, exit — в порядке прошлого прохода.
+        """
+        previous = self._event_contacts
+        current = dict(self._get_contacts())
+        self._event_contacts = current
+
+        entered = [pair for pair in current if pair not in previous]
+        stayed = [pair for pair in current if pair in previous]
+        exited = [pair for pair in previous if pair not in current]
+        for a, b in entered:
+            self._dispatch_collision("enter", a, b)
+        for a, b in stayed:
+            self._dispatch_collision("stay", a, b)
+        for a, b in exited:
+            self._dispatch_collision("exit", a, b)
+
+    def _dispatch_collision(self, event: str, a: AnimatedSprite, b: AnimatedSprite) -> None:
+        """Вызвать обработчики одного события коллизии."""
+        name = _COLLISION_HANDLERS[event]
+        handler = getattr(a, name, None)
+        if handler is not None:
+            handler(b)
+        handler = getattr(b, name, None)
+        if handler is not None:
+            handler(a)
+        for callback in self.collision_callbacks:
+            callback(event, a, b)
+
+    def set_camera(
+        self,
+        camera: Optional[Camera],
+        cull_margin: int = 64,
+        cull_updates: bool = False,
+    ) -> None:
+        """
+        Подключить камеру к игре.
+
+        Игра обновляет камеру каждый кадр, рисует только спрайты,
+        пересекающие её область просмотра (плюс запас), и автоматически
+        смещает их на смещение камеры. Передача None отключает камеру.
+
+        Аргументы:
+            camera: Камера или None
+            cull_margin: Запас вокруг области просмотра в пикселях
+            cull_updates: Не обновлять анимацию спрайтов вне области
+                просмотра (движение продолжается)
+
+        Пример:
+            >>> camera = Camera(game.width, game.height)
+            >>> camera.follow(player)
+            >>> game.set_camera(camera, cull_updates=True)
+        """
+        self.camera = camera
+        self.cull_margin = cull_margin
+        self.cull_updates = cull_updates
+        self.redraw_all()
+
+    def add_tilemap(self, tilemap) -> None:
+        """
+        Добавить тайловую карту, которую игра рисует поверх фона под спрайтами.
+
+        Аргументы:
+            tilemap: Экземпляр TileMap
+        """
+        self.tilemaps.append(tilemap)
+        self.redraw_all()
+
+    def remove_tilemap(self, tilemap) -> None:
+        """
+        Убрать тайловую карту из отрисовки.
+
+        Аргументы:
+            tilemap: Экземпляр TileMap
+        """
+        if tilemap in self.tilemaps:
+            self.tilemaps.remove(tilemap)
+            self.redraw_all()
+
+    def add_ui_element(self, element) -> None:
+        """
+        Добавить элемент интерфейса, который игра будет обновлять,
+        отрисовывать поверх спрайтов и снабжать событиями.
+
+        Аргументы:
+            element: Экземпляр UIElement
+        """
+        self.ui_elements.append(element)
+
+    def remove_ui_element(self, element) -> None:
+        """
+        Удалить элемент интерфейса из управления игрой.
+
+        Аргументы:
+            element: Экземпляр UIElement
+        """
+        if element in self.ui_elements:
+            self.ui_elements.remove(element)
 
     def add_event_callback(self, callback: Callable) -> None:
         """
@@ -305,6 +1133,7 @@ class Game:
         self.background_color = color
         # Если установлен цвет фона, убираем фоновое изображение
         self.background_surface = None
+        self.redraw_all()
 
     def set_background_image(self, image_path: Optional[str]) -> None:
         """
@@ -323,6 +1152,7 @@ class Game:
         else:
             self.background_image_path = image_path
             self._load_background_image(image_path)
+        self.redraw_all()
 
     def has_background_image(self) -> bool:
         """
@@ -447,8 +1277,22 @@ class Game:
             "running": self.running,
             "paused": self.paused,
             "sprite_count": len(self.all_sprites),
+            "visible_sprites": self.visible_sprite_count,
+            "sprites_rebuilt": self.sprites_rebuilt,
             "screen_size": (self.width, self.height),
             "background_color": self.background_color,
             "background_image": self.background_image_path,
             "has_background_image": self.has_background_image(),
+            "dirty_rects": self.dirty_rects,
+            "dirty_rect_count": len(self.last_dirty_rects),
+            "fixed_dt": self.fixed_dt,
+            "steps_last_frame": self.steps_last_frame,
+            "interpolation_alpha": self.interpolation_alpha,
+            "collision_events": self.collision_events,
+            "contacts": len(self._event_contacts),
+            "animated_sprites": (
+                len(self.animation_system) if self.animation_system is not None else 0
+            ),
+            "frame_changed_sprites": len(self.frame_changed_sprites),
+            "coroutines": len(self.scheduler),
         }
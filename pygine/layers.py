@@ -0,0 +1,89 @@
+"""
+Слои коллизий: именованные битовые категории спрайтов.
+
+Каждый спрайт принадлежит слою (одному или нескольким битам) и имеет
+фильтр — биты слоёв, с которыми он вообще может сталкиваться. Пара
+проверяется, только если слой каждого спрайта входит в фильтр другого,
+поэтому группы и широкая фаза отбрасывают неинтересные пары (например,
+декорация с декорацией) ещё до проверки геометрии.
+"""
+
+from typing import Dict, Iterable, Union
+
+# Все слои (фильтр по умолчанию)
+ALL_LAYERS = 0xFFFFFFFF
+# Ни одного слоя (спрайт ни с чем не сталкивается)
+NO_LAYERS = 0
+# Слой спрайта по умолчанию
+DEFAULT_LAYER = 1
+
+MAX_LAYERS = 32
+
+LayerSpec = Union[int, str, Iterable[Union[int, str]]]
+
+_named_layers: Dict[str, int] = {"default": DEFAULT_LAYER}
+
+
+def define_layer(name: str) -> int:
+    """
+    Получить бит именованного слоя, выделив новый при первом обращении.
+
+    Аргументы:
+        name: Имя слоя (например, "player", "wall")
+
+    Возвращает:
+        Битовую маску слоя
+
+    Пример:
+        >>> WALL = define_layer("wall")
+    """
+    bit = _named_layers.get(name)
+    if bit is not None:
+        return bit
+
+    used = 0
+    for value in _named_layers.values():
+        used |= value
+    for index in range(MAX_LAYERS):
+        bit = 1 << index
+        if not used & bit:
+            _named_layers[name] = bit
+            return bit
+    raise ValueError(f"Cannot define layer {name!r}: all {MAX_LAYERS} layers are in use")
+
+
+def layer_bits(layers: LayerSpec) -> int:
+    """
+    Перевести описание слоёв в битовую маску.
+
+    Аргументы:
+        layers: Число (готовые биты), имя слоя или набор имён/чисел
+
+    Возвращает:
+        Объединение битов всех перечисленных слоёв
+
+    Пример:
+        >>> layer_bits(["player", "pickup"])
+        6
+    """
+    if isinstance(layers, int):
+        return layers
+    if isinstance(layers, str):
+        return define_layer(layers)
+
+    bits = 0
+    for layer in layers:
+        bits |= layer_bits(layer)
+    return bits
+
+
+def layers_interact(a, b) -> bool:
+    """
+    Проверить, могут ли два спрайта сталкиваться с учётом слоёв и фильтров.
+
+    Единственная проверка слоёв пары: ей пользуются collides_with, группы
+    и широкая фаза.
+    """
+    return bool(
+        a.collision_layer & b.collision_filter and b.collision_layer & a.collision_filter
+    )
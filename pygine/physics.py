@@ -2,73 +2,288 @@
 Базовая система физики
 """
 
-from typing import Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .physics_world import PhysicsWorld
+
+
+def __getattr__(name):
+    # PhysicsWorld требует NumPy и живёт в physics_world; имя доступно
+    # и отсюда, как раньше, но NumPy загружается только при обращении
+    if name == "PhysicsWorld":
+        from .physics_world import PhysicsWorld
+
+        return PhysicsWorld
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _BodyField:
+    """
+    Скалярное поле PhysicsBody.
+
+    У тела без мира значение хранится в самом теле обычным атрибутом,
+    у тела мира — в столбце массивов PhysicsWorld. Поле с wakes=True
+    будит спящее тело, когда его значение меняется (например, опора
+    ушла из-под тела или изменилась гравитация).
+    """
+
+    def __init__(self, column: str, cast, wakes: bool = False):
+        self.column = column
+        self.cast = cast
+        self.wakes = wakes
+
+    def __get__(self, body, owner=None):
+        if body is None:
+            return self
+        world = body.world
+        if world is None:
+            return body.__dict__[self.column]
+        return self.cast(getattr(world, self.column)[body.index])
+
+    def __set__(self, body, value) -> None:
+        value = self.cast(value)
+        world = body.__dict__.get("world")
+        if world is None:
+            fields = body.__dict__
+            changed = fields.get(self.column, value) != value
+            fields[self.column] = value
+        else:
+            column = getattr(world, self.column)
+            changed = column[body.index] != value
+            column[body.index] = value
+        if changed and self.wakes:
+            body.wake()
 
 
 class PhysicsBody:
-    """Базовое физическое тело для спрайтов."""
+    """
+    Базовое физическое тело для спрайтов.
+
+    Тело без мира хранит данные в обычных атрибутах и интегрируется
+    update() на чистом Python. Тело общего мира (world.create_body() или
+    world.add_body()) — ручка на строку массивов PhysicsWorld: такие тела
+    интегрируются все сразу через world.step(), а velocity и acceleration
+    возвращают представления строки (`body.velocity[0] += 10` изменяет
+    данные мира). Спящее тело будят apply_force(), присваивание
+    velocity/acceleration, смена on_ground или gravity, правка скорости
+    на месте (заметна при следующем шаге) и wake().
+
+    Тело без мира засыпает, только если задать ему sleep_time (по
+    умолчанию None — никогда); тела мира используют sleep_time мира.
+
+    Аргументы:
+        mass: Масса
+        gravity: Ускорение свободного падения (пикселей/с²)
+        world: Мир, в котором хранится тело (None — без мира)
+    """
+
+    # Порог и время покоя для засыпания тела без мира (см. PhysicsWorld);
+    # None — тело без мира не засыпает
+    sleep_velocity = 5.0
+    sleep_time: Optional[float] = None
+
+    mass = _BodyField("_mass", float)
+    gravity = _BodyField("_gravity", float, wakes=True)
+    friction = _BodyField("_friction", float)
+    bounce_factor = _BodyField("_bounce_factor", float)  # Коэффициент упругости (0.0 - 1.0)
+    air_resistance = _BodyField("_air_resistance", float)  # Сопротивление воздуха
+    on_ground = _BodyField("_on_ground", bool, wakes=True)
+
+    def __init__(
+        self,
+        mass: float = 1.0,
+        gravity: float = 400.0,
+        world: Optional["PhysicsWorld"] = None,
+    ):
+        # Мир тела и строка в его массивах (-1 — тело без мира)
+        self.world: Optional["PhysicsWorld"] = None
+        self.index = -1
+        self._finalizer = None
+        self._seen_step = 0  # последний шаг мира, смещение которого отдал update()
+        self._can_sleep = True
+        self._asleep = False
+        self._rest_time = 0.0
 
-    def __init__(self, mass: float = 1.0, gravity: float = 400.0):
         self.mass = mass
         self.gravity = gravity
-        self.velocity = [0.0, 0.0]
-        self.acceleration = [0.0, 0.0]
-        self.on_ground = False
         self.friction = 0.8
-        self.bounce_factor = 0.7  # Коэффициент упругости (0.0 - 1.0)
-        self.air_resistance = 0.99  # Сопротивление воздуха
+        self.bounce_factor = 0.7
+        self.air_resistance = 0.99
+        self.on_ground = False
+        self._velocity = [0.0, 0.0]
+        self._acceleration = [0.0, 0.0]
+        self._displacement = [0.0, 0.0]
+
+        if world is not None:
+            world.add_body(self)
+
+    def remove(self) -> None:
+        """Убрать тело из мира: данные возвращаются в атрибуты тела."""
+        world = self.world
+        if world is not None:
+            world.remove_body(self)
+
+    # Векторы: список тела или представление строки мира
+    @property
+    def velocity(self):
+        """Скорость [vx, vy]."""
+        if self.world is None:
+            return self._velocity
+        return self.world._velocity[self.index]
+
+    @velocity.setter
+    def velocity(self, value) -> None:
+        if self.world is None:
+            self._velocity = [float(value[0]), float(value[1])]
+        else:
+            self.world._velocity[self.index] = value
+        self.wake()
+
+    @property
+    def acceleration(self):
+        """Накопленное за тик ускорение [ax, ay]."""
+        if self.world is None:
+            return self._acceleration
+        return self.world._acceleration[self.index]
+
+    @acceleration.setter
+    def acceleration(self, value) -> None:
+        if self.world is None:
+            self._acceleration = [float(value[0]), float(value[1])]
+        else:
+            self.world._acceleration[self.index] = value
+        self.wake()
+
+    @property
+    def sleeping(self) -> bool:
+        """Спит ли тело (шаг его пропускает)."""
+        if self.world is None:
+            return self._asleep
+        return bool(self.world._asleep[self.index])
+
+    @property
+    def allow_sleep(self) -> bool:
+        """Может ли тело засыпать (False — для игрока и других активных тел)."""
+        if self.world is None:
+            return self._can_sleep
+        return bool(self.world._can_sleep[self.index])
+
+    @allow_sleep.setter
+    def allow_sleep(self, value: bool) -> None:
+        if self.world is None:
+            self._can_sleep = bool(value)
+        else:
+            self.world._can_sleep[self.index] = value
+        if not value:
+            self.wake()
+
+    def wake(self) -> None:
+        """Разбудить тело (при касании, телепорте и т.п.)."""
+        if self.world is None:
+            self._asleep = False
+            self._rest_time = 0.0
+        else:
+            self.world.wake(self.index)
+
+    def sleep(self) -> None:
+        """Усыпить тело немедленно, не дожидаясь sleep_time."""
+        if self.world is None:
+            self._velocity = [0.0, 0.0]
+            self._acceleration = [0.0, 0.0]
+            self._displacement = [0.0, 0.0]
+            self._asleep = True
+        else:
+            self.world.sleep(self.index)
+
+    @property
+    def displacement(self) -> Tuple[float, float]:
+        """Смещение за последний шаг."""
+        if self.world is None:
+            return tuple(self._displacement)
+        dx, dy = self.world._displacement[self.index]
+        return (float(dx), float(dy))
 
     def apply_force(self, force_x: float, force_y: float) -> None:
         """Применить силу к телу."""
-        self.acceleration[0] += force_x / self.mass
-        self.acceleration[1] += force_y / self.mass
+        acceleration = self.acceleration
+        mass = self.mass
+        acceleration[0] += force_x / mass
+        acceleration[1] += force_y / mass
+        if force_x or force_y:
+            self.wake()
 
     def apply_gravity(self, dt: float) -> None:
         """Применить силу гравитации."""
         if not self.on_ground:
             # Гравитация - постоянное ускорение вниз
             self.acceleration[1] += self.gravity
+            self.wake()
 
     def update(self, dt: float) -> Tuple[float, float]:
-        """Обновить физику и вернуть изменение позиции."""
-        # Применяем гравитацию
-        self.apply_gravity(dt)
+        """
+        Обновить физику и вернуть изменение позиции.
 
-        # Обновляем скорость
-        self.velocity[0] += self.acceleration[0] * dt
-        self.velocity[1] += self.acceleration[1] * dt
-
-        # Применяем сопротивление воздуха
-        if not self.on_ground:
-            self.velocity[0] *= self.air_resistance
-            self.velocity[1] *= self.air_resistance
+        Тело без мира интегрируется здесь же (те же формулы, что и в
+        PhysicsWorld.step()). Если мир тела уже сделал step() после
+        прошлого вызова, возвращается смещение тела из этого шага; иначе
+        тело интегрируется отдельно.
+        """
+        world = self.world
+        if world is not None:
+            if world.step_count != self._seen_step:
+                self._seen_step = world.step_count
+                dx, dy = world._displacement[self.index]
+                return (float(dx), float(dy))
+            return world.step_body(self.index, dt)
 
-        # Применяем трение о землю
-        if self.on_ground:
-            self.velocity[0] *= self.friction
+        velocity = self._velocity
+        acceleration = self._acceleration
+        if self._asleep:
+            if not (velocity[0] or velocity[1] or acceleration[0] or acceleration[1]):
+                return (0.0, 0.0)
+            self.wake()  # скорость изменили на месте
+        if not self._on_ground:
+            air_resistance = self._air_resistance
+            vx = (velocity[0] + acceleration[0] * dt) * air_resistance
+            vy = (velocity[1] + (acceleration[1] + self._gravity) * dt) * air_resistance
+        else:
+            vx = (velocity[0] + acceleration[0] * dt) * self._friction
+            vy = velocity[1] + acceleration[1] * dt
+        velocity[0] = vx
+        velocity[1] = vy
+        acceleration[0] = 0.0
+        acceleration[1] = 0.0
 
-        # Вычисляем изменение позиции
-        dx = self.velocity[0] * dt
-        dy = self.velocity[1] * dt
+        dx = vx * dt
+        dy = vy * dt
+        self._displacement = [dx, dy]
 
-        # Сбрасываем ускорение
-        self.acceleration = [0.0, 0.0]
-
-        return dx, dy
+        sleep_time = self.sleep_time
+        if sleep_time is not None:
+            if vx * vx + vy * vy < self.sleep_velocity * self.sleep_velocity and self._can_sleep:
+                self._rest_time += dt
+                if self._rest_time >= sleep_time:
+                    self.sleep()
+            else:
+                self._rest_time = 0.0
+        return (dx, dy)
 
     def bounce(self, surface_normal: Tuple[float, float]) -> None:
         """Отскочить от поверхности с заданным нормальным вектором."""
         nx, ny = surface_normal
-        
+        velocity = self.velocity
+
         # Отражение скорости от поверхности
-        dot_product = self.velocity[0] * nx + self.velocity[1] * ny
-        
-        self.velocity[0] = self.velocity[0] - 2 * dot_product * nx
-        self.velocity[1] = self.velocity[1] - 2 * dot_product * ny
-        
+        dot_product = velocity[0] * nx + velocity[1] * ny
+
+        velocity[0] = velocity[0] - 2 * dot_product * nx
+        velocity[1] = velocity[1] - 2 * dot_product * ny
+
         # Применяем коэффициент упругости
-        self.velocity[0] *= self.bounce_factor
-        self.velocity[1] *= self.bounce_factor
+        velocity[0] *= self.bounce_factor
+        velocity[1] *= self.bounce_factor
+        self.wake()
 
     def set_bounce_factor(self, factor: float) -> None:
         """Задать коэффициент упругости (0.0 = без отскока, 1.0 = идеальный)."""
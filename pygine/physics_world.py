@@ -0,0 +1,344 @@
+"""
+Хранилище физических тел на массивах NumPy.
+"""
+
+import weakref
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .physics import PhysicsBody
+
+
+class PhysicsWorld:
+    """
+    Хранилище физических тел в виде структуры массивов.
+
+    Масса, гравитация, скорость, ускорение, трение, упругость и
+    сопротивление воздуха всех тел лежат в непрерывных массивах NumPy,
+    а step() интегрирует их одним векторным шагом за тик. Тела
+    PhysicsBody — лёгкие ручки на строку этих массивов.
+
+    Тело, скорость которого sleep_time секунд подряд остаётся ниже
+    sleep_velocity, засыпает: его скорость обнуляется, и шаг его
+    пропускает, пока тело не разбудят сила, новая скорость, смена
+    on_ground или gravity, касание или телепорт спрайта (см.
+    PhysicsBody.wake()).
+
+    Тела, прикреплённые к спрайтам, шагают вместе с миром: вызовите
+    step() раз в тик до обновления спрайтов (Game.add_physics_world()
+    делает это сам), и update() каждого тела вернёт смещение из массивов
+    мира, не интегрируя тело повторно.
+
+    Аргументы:
+        capacity: Начальная ёмкость (массивы растут автоматически)
+        sleep_velocity: Порог скорости покоя (пикселей/с)
+        sleep_time: Сколько секунд тело должно покоиться, чтобы уснуть
+            (None — тела никогда не засыпают)
+
+    Пример:
+        >>> world = PhysicsWorld()
+        >>> bodies = [world.create_body(mass=1.0) for _ in range(10_000)]
+        >>> moves = world.step(1 / 60)  # (N, 2) смещений за тик
+        >>> dx, dy = moves[bodies[0].index]
+    """
+
+    # Столбцы хранилища: (атрибут, значение пустой строки, ширина, тип)
+    _COLUMNS = (
+        ("_mass", 1.0, 1, np.float64),
+        ("_gravity", 0.0, 1, np.float64),
+        ("_velocity", 0.0, 2, np.float64),
+        ("_acceleration", 0.0, 2, np.float64),
+        ("_displacement", 0.0, 2, np.float64),
+        ("_friction", 1.0, 1, np.float64),
+        ("_bounce_factor", 0.0, 1, np.float64),
+        ("_air_resistance", 1.0, 1, np.float64),
+        ("_on_ground", False, 1, np.bool_),
+        ("_can_sleep", True, 1, np.bool_),
+        ("_asleep", False, 1, np.bool_),
+        ("_rest_time", 0.0, 1, np.float64),
+    )
+    # Доля бодрствующих тел, ниже которой шаг выбирает их по индексам
+    _GATHER_FRACTION = 0.25
+
+    def __init__(
+        self,
+        capacity: int = 64,
+        sleep_velocity: float = 5.0,
+        sleep_time: Optional[float] = 0.5,
+    ):
+        self.sleep_velocity = sleep_velocity
+        self.sleep_time = sleep_time
+        self.capacity = max(1, int(capacity))
+        self._count = 0  # занятые строки (включая освобождённые дыры)
+        self._free: List[int] = []
+        self.body_count = 0
+        self._asleep_count = 0
+        self.step_count = 0  # сколько раз вызывался step()
+        # Кэш строк бодрствующих тел; None — пересчитать при следующем шаге
+        self._awake_rows = None
+        for name, fill, width, dtype in self._COLUMNS:
+            setattr(self, name, self._column(self.capacity, fill, width, dtype))
+
+    @staticmethod
+    def _column(capacity: int, fill, width: int, dtype) -> np.ndarray:
+        shape = capacity if width == 1 else (capacity, width)
+        return np.full(shape, fill, dtype=dtype)
+
+    def _grow(self) -> None:
+        """Удвоить ёмкость массивов, сохранив данные тел."""
+        capacity = self.capacity * 2
+        count = self._count
+        for name, fill, width, dtype in self._COLUMNS:
+            column = self._column(capacity, fill, width, dtype)
+            column[:count] = getattr(self, name)[:count]
+            setattr(self, name, column)
+        self.capacity = capacity
+
+    def _acquire(self) -> int:
+        """Занять строку под новое тело."""
+        if self._free:
+            index = self._free.pop()
+        else:
+            if self._count == self.capacity:
+                self._grow()
+            index = self._count
+            self._count += 1
+        self.body_count += 1
+        self._awake_rows = None
+        return index
+
+    def _release(self, index: int) -> None:
+        """Освободить строку тела; пустая строка не влияет на шаг."""
+        self.wake(index)
+        for name, fill, _, _ in self._COLUMNS:
+            getattr(self, name)[index] = fill
+        self._free.append(index)
+        self.body_count -= 1
+
+    def create_body(self, mass: float = 1.0, gravity: float = 400.0) -> PhysicsBody:
+        """Создать тело в этом мире."""
+        return PhysicsBody(mass, gravity, world=self)
+
+    def add_body(self, body: PhysicsBody) -> PhysicsBody:
+        """
+        Перенести тело в этот мир: его данные переходят в массивы мира.
+
+        Тело другого мира сначала убирается из него. Строка освобождается
+        при body.remove() или когда тело собрано сборщиком мусора.
+
+        Аргументы:
+            body: Тело
+
+        Возвращает:
+            То же тело
+        """
+        if body.world is self:
+            return body
+        body.remove()
+
+        index = self._acquire()
+        fields = body.__dict__
+        for name, _, _, _ in self._COLUMNS:
+            getattr(self, name)[index] = fields.pop(name)
+        if self._asleep[index]:
+            # Строка уже помечена спящей — учитываем её в счётчике
+            self._asleep[index] = False
+            self.sleep(index)
+
+        body.world = self
+        body.index = index
+        body._seen_step = self.step_count
+        body._finalizer = weakref.finalize(body, self._release, index)
+        return body
+
+    def remove_body(self, body: PhysicsBody) -> None:
+        """Убрать тело из мира: данные строки возвращаются в атрибуты тела."""
+        if body.world is not self:
+            return
+        index = body.index
+        fields = body.__dict__
+        for name, _, width, dtype in self._COLUMNS:
+            value = getattr(self, name)[index]
+            if width == 2:
+                fields[name] = [float(value[0]), float(value[1])]
+            elif dtype is np.bool_:
+                fields[name] = bool(value)
+            else:
+                fields[name] = float(value)
+
+        body._finalizer.detach()
+        self._release(index)
+        body.world = None
+        body.index = -1
+        body._finalizer = None
+
+    def step(self, dt: float) -> np.ndarray:
+        """
+        Проинтегрировать все бодрствующие тела одним векторным шагом.
+
+        Порядок действий тот же, что у PhysicsBody.update(): гравитация
+        для тел в воздухе, скорость, сопротивление воздуха в воздухе,
+        трение на земле, смещение, сброс ускорения. Спящие тела не
+        меняются, их смещение остаётся нулевым.
+
+        Аргументы:
+            dt: Шаг времени в секундах
+
+        Возвращает:
+            Массив смещений формы (N, 2), строка — индекс тела (body.index)
+        """
+        count = self._count
+        self.step_count += 1
+        if self._asleep_count:
+            self._wake_edited(count)
+        rows = self._active_rows()
+        dense = isinstance(rows, slice)
+
+        # Для среза это представления массивов мира, для индексов — копии
+        # строк бодрствующих тел, которые записываются обратно
+        velocity = self._velocity[rows]
+        acceleration = self._acceleration[rows]
+        on_ground = self._on_ground[rows]
+        airborne = ~on_ground
+        if dense and self._asleep_count:
+            # Скорость и ускорение спящих нулевые и останутся такими,
+            # если не давать им гравитацию
+            airborne &= ~self._asleep[rows]
+
+        acceleration[:, 1] += self._gravity[rows] * airborne
+        velocity += acceleration * dt
+        velocity *= np.where(airborne, self._air_resistance[rows], 1.0)[:, None]
+        velocity[:, 0] *= np.where(on_ground, self._friction[rows], 1.0)
+
+        if dense:
+            np.multiply(velocity, dt, out=self._displacement[rows])
+            acceleration.fill(0.0)
+        else:
+            self._velocity[rows] = velocity
+            self._displacement[rows] = velocity * dt
+            self._acceleration[rows] = 0.0
+
+        if self.sleep_time is not None:
+            self._update_rest(rows, velocity, dt)
+        return self._displacement[:count]
+
+    def _wake_edited(self, count: int) -> None:
+        """
+        Разбудить спящие тела, чью скорость или ускорение изменили на месте.
+
+        У спящего тела оба вектора нулевые, поэтому ненулевое значение
+        означает правку вроде `body.velocity[0] = 100` после засыпания.
+        """
+        asleep = self._asleep[:count]
+        moving = self._velocity[:count].any(axis=1) | self._acceleration[:count].any(axis=1)
+        for index in np.flatnonzero(asleep & moving):
+            self.wake(index)
+
+    def _active_rows(self):
+        """
+        Строки для шага: срез всех строк или индексы бодрствующих тел.
+
+        Выборка по индексам копирует данные, поэтому окупается, только
+        когда бодрствующих тел мало (меньше _GATHER_FRACTION от всех).
+        """
+        if self._awake_rows is None:
+            count = self._count
+            if count - self._asleep_count < count * self._GATHER_FRACTION:
+                self._awake_rows = np.flatnonzero(~self._asleep[:count])
+            else:
+                self._awake_rows = slice(0, count)
+        return self._awake_rows
+
+    def _update_rest(self, rows, velocity: np.ndarray, dt: float) -> None:
+        """Накопить время покоя строк rows и усыпить покоившиеся достаточно долго."""
+        speed_sq = velocity[:, 0] * velocity[:, 0] + velocity[:, 1] * velocity[:, 1]
+        resting = (speed_sq < self.sleep_velocity * self.sleep_velocity) & self._can_sleep[rows]
+        if isinstance(rows, slice) and self._asleep_count:
+            resting &= ~self._asleep[rows]
+        rest_time = np.where(resting, self._rest_time[rows] + dt, 0.0)
+        self._rest_time[rows] = rest_time
+
+        falling_asleep = rest_time >= self.sleep_time
+        if falling_asleep.any():
+            if isinstance(rows, slice):
+                indices = np.flatnonzero(falling_asleep) + rows.start
+            else:
+                indices = rows[falling_asleep]
+            for index in indices:
+                self.sleep(index)
+
+    def step_body(self, index: int, dt: float) -> Tuple[float, float]:
+        """Проинтегрировать одно тело (те же формулы, что и в step())."""
+        velocity = self._velocity[index]
+        acceleration = self._acceleration[index]
+        on_ground = self._on_ground[index]
+
+        if self._asleep[index]:
+            if not (velocity.any() or acceleration.any()):
+                return (0.0, 0.0)
+            self.wake(index)  # скорость изменили на месте
+
+        if not on_ground:
+            acceleration[1] += self._gravity[index]
+        velocity += acceleration * dt
+        if not on_ground:
+            velocity *= self._air_resistance[index]
+        else:
+            velocity[0] *= self._friction[index]
+
+        displacement = self._displacement[index]
+        np.multiply(velocity, dt, out=displacement)
+        acceleration.fill(0.0)
+
+        if self.sleep_time is not None:
+            speed_sq = velocity[0] * velocity[0] + velocity[1] * velocity[1]
+            if speed_sq < self.sleep_velocity * self.sleep_velocity and self._can_sleep[index]:
+                self._rest_time[index] += dt
+                if self._rest_time[index] >= self.sleep_time:
+                    self.sleep(index)
+            else:
+                self._rest_time[index] = 0.0
+        return (float(displacement[0]), float(displacement[1]))
+
+    def wake(self, index: int) -> None:
+        """Разбудить тело с индексом index и сбросить его время покоя."""
+        self._rest_time[index] = 0.0
+        if self._asleep[index]:
+            self._asleep[index] = False
+            self._asleep_count -= 1
+            self._awake_rows = None
+
+    def sleep(self, index: int) -> None:
+        """Усыпить тело с индексом index: скорость и смещение обнуляются."""
+        self._velocity[index] = 0.0
+        self._acceleration[index] = 0.0
+        self._displacement[index] = 0.0
+        if not self._asleep[index]:
+            self._asleep[index] = True
+            self._asleep_count += 1
+            self._awake_rows = None
+
+    def wake_all(self) -> None:
+        """Разбудить все тела мира (например, после перестройки уровня)."""
+        self._asleep.fill(False)
+        self._rest_time.fill(0.0)
+        self._asleep_count = 0
+        self._awake_rows = None
+
+    @property
+    def sleeping_count(self) -> int:
+        """Количество спящих тел."""
+        return self._asleep_count
+
+    def __len__(self) -> int:
+        return self.body_count
+
+    def debug_info(self) -> dict:
+        """Получить отладочную информацию о мире."""
+        return {
+            "bodies": self.body_count,
+            "capacity": self.capacity,
+            "free_slots": len(self._free),
+            "sleeping": self.sleeping_count,
+        }
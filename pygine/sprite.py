@@ -4,9 +4,15 @@
 
 import pygame
 import math
-from typing import List, Dict, Tuple, Optional, Union
+import weakref
+from typing import Callable, List, Dict, Tuple, Optional, Union
 from pathlib import Path
 from .animation import Animation, AnimationManager
+from .broadphase import bound_broadphase
+from .clips import get_clip_library
+from .frame_cache import extract_frames, get_frame_store
+from .layers import ALL_LAYERS, DEFAULT_LAYER, LayerSpec, layer_bits, layers_interact
+from .physics import PhysicsBody
 
 
 class AnimatedSprite(pygame.sprite.Sprite):
@@ -29,6 +35,22 @@ class AnimatedSprite(pygame.sprite.Sprite):
         >>> player.play_animation("walk")
     """
 
+    # Сколько спрайтов перестроили изображение с последнего сброса счётчика
+    _rebuild_count = 0
+
+    # Копировать ли кадр в image при перестроении. По умолчанию image —
+    # общая поверхность кэша трансформаций листа, только для чтения.
+    # True даёт спрайту свою копию при каждом перестроении, которую можно
+    # менять (set_alpha, fill) без влияния на другие спрайты
+    copy_images = False
+
+    # Обработчики событий коллизий: функция(other), вызывает Game при
+    # включённых событиях (см. Game.enable_collision_events). Можно
+    # присвоить экземпляру или переопределить методом в подклассе
+    on_collision_enter: Optional[Callable] = None
+    on_collision_stay: Optional[Callable] = None
+    on_collision_exit: Optional[Callable] = None
+
     def __init__(
         self,
         image_path: Union[str, Path],
@@ -37,24 +59,34 @@ class AnimatedSprite(pygame.sprite.Sprite):
     ):
         super().__init__()
 
+        # Спрайтшит берём из общего хранилища: лист загружается и
+        # нарезается один раз для всех спрайтов
+        store = get_frame_store()
+        self._sheet = store.acquire(image_path, frame_size)
+        self._release_sheet = weakref.finalize(self, store.release, self._sheet)
+
         # Основные свойства
-        self.original_image = pygame.image.load(str(image_path)).convert_alpha()
+        self.original_image = self._sheet.image
         self.frame_size = frame_size
         self._position = list(position)
 
         # Вычисляем размеры спрайтшита
         self.sheet_width = self.original_image.get_width()
         self.sheet_height = self.original_image.get_height()
-        self.frames_per_row = self.sheet_width // frame_size[0]
-        self.frames_per_col = self.sheet_height // frame_size[1]
+        self.frames_per_row = self._sheet.frames_per_row
+        self.frames_per_col = self._sheet.frames_per_col
         self.total_frames = self.frames_per_row * self.frames_per_col
 
-        # Извлекаем все кадры из спрайтшита
-        self.frames = self._extract_frames()
+        # Общий для спрайтшита кэш трансформированных кадров
+        self._transform_cache = self._sheet.transforms
 
         # Система анимации
         self.animation_manager = AnimationManager()
         self.current_frame = 0
+        self._pending_animation_time = 0.0
+        # Спрайт вне области просмотра: Game с cull_updates ставит флаг
+        # на время update(), и анимация копит время вместо продвижения
+        self._culled = False
 
         # Свойства трансформации
         self.rotation = 0.0
@@ -63,46 +95,138 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.flip_y = False
         self._mirrored = False
 
-        # Физические свойства
-        self.velocity = [0.0, 0.0]
-        self.acceleration = [0.0, 0.0]
+        # Режим предрассчитанных поворотов (None — поворот на лету)
+        self.rotation_steps: Optional[int] = None
+        self._rotation_table: Optional[Dict[int, List[pygame.Surface]]] = None
+        self._rotation_table_key = None
+
+        # Физические свойства. Физическое тело (PhysicsBody) или None:
+        # с телом скорость и ускорение хранит тело, спящее тело исключает
+        # спрайт из проверок коллизий Game, телепорт его будит
+        self.body: Optional[PhysicsBody] = None
+        self._velocity = [0.0, 0.0]
+        self._acceleration = [0.0, 0.0]
 
         # Инициализируем свойства pygame спрайта
-        self.image = self.frames[0] if self.frames else pygame.Surface(frame_size)
+        if self.frames:
+            self.image = self.frames[0].copy() if self.copy_images else self.frames[0]
+        else:
+            self.image = pygame.Surface(frame_size)
         self.rect = self.image.get_rect()
         self.rect.topleft = position
 
+        # Отслеживание изменений: состояние, с которым строились image и rect
+        self._image_key = None
+        self._placement_key = None
+        self._hitbox_rotation = None  # угол хитбокса, известный широкой фазе
+        self.changes = set()  # что изменилось за последний update()
+
         # Свойства коллизий
         self.collision_rect = self.rect.copy()
         self.collision_offset = (0, 0)
 
         # Пользовательские свойства хитбокса
         self.custom_hitbox_size = None  # (width, height) or None for default
-        self.hitbox_shape = "rect"  # "rect" or "circle"
+        self.hitbox_shape = "rect"  # "rect", "circle" или "mask"
         self.hitbox_radius = None  # для круглых хитбоксов
+        # Растеризованный rect/circle-хитбокс для проверки против масок
+        self._shape_mask = None
+
+        # Слой коллизий спрайта и слои, с которыми он может сталкиваться
+        self.collision_layer = DEFAULT_LAYER
+        self.collision_filter = ALL_LAYERS
+
+        # Кэш геометрии хитбокса (углы, AABB, нормали) и ключ его актуальности
+        self._geometry = None
+        self._geometry_key = None
+
+        # Структуры широкой фазы (SpatialHash/LooseQuadtree), где зарегистрирован спрайт
+        self._broadphases: List = []
+
+        # Центр rect перед последним update() — Game интерполирует от него
+        # отрисовку в режиме фиксированного шага
+        self._previous_center: Optional[Tuple[int, int]] = None
+
+    @property
+    def frames(self) -> Tuple[pygame.Surface, ...]:
+        """
+        Кадры спрайтшита, общие для всех спрайтов этого листа (только для чтения).
+
+        Присваивание списка кадров даёт спрайту собственный лист с этими
+        кадрами; другие спрайты листа его не видят.
+        """
+        return self._sheet.frames
+
+    @frames.setter
+    def frames(self, frames: List[pygame.Surface]) -> None:
+        sheet = self._sheet.with_frames(frames)
+        self._release_sheet()
+        self._sheet = sheet
+        self._transform_cache = sheet.transforms
+        self._rotation_table = None
+        self._rotation_table_key = None
+        self.invalidate()
 
     def _extract_frames(self) -> List[pygame.Surface]:
-        """Извлечь все отдельные кадры из спрайтшита."""
-        frames = []
-        frame_width, frame_height = self.frame_size
-
-        for row in range(self.frames_per_col):
-            for col in range(self.frames_per_row):
-                x = col * frame_width
-                y = row * frame_height
-
-                frame = pygame.Surface(self.frame_size, pygame.SRCALPHA)
-                frame.blit(
-                    self.original_image,
-                    (0, 0),
-                    pygame.Rect(x, y, frame_width, frame_height),
-                )
-                frames.append(frame)
+        """Извлечь все отдельные кадры из спрайтшита (собственные копии)."""
+        return extract_frames(self.original_image, self.frame_size)
+
+    def get_mutable_frame(self, index: int) -> pygame.Surface:
+        """
+        Получить кадр спрайтшита для изменения (рисования поверх и т.п.).
+
+        Кадр копируется из листа только при первом таком обращении;
+        изменения видны всем спрайтам этого листа.
+        """
+        return self._sheet.get_mutable_frame(index)
+
+    def release_frames(self) -> None:
+        """
+        Освободить ссылку на общий спрайтшит.
 
-        return frames
+        Вызывается автоматически при удалении спрайта сборщиком мусора;
+        после явного вызова лист можно выгрузить через purge_frame_store().
+        """
+        self._release_sheet()
+
+    def kill(self) -> None:
+        """
+        Удалить спрайт из всех групп.
+
+        Спрайт также снимается со структур широкой фазы и с системы
+        анимаций: убитый спрайт больше не попадает в пары коллизий (Game
+        разошлёт для его пар событие exit) и не продвигается системой.
+        """
+        for broadphase in list(self._broadphases):
+            broadphase.remove(self)
+        system = self.animation_manager._system
+        if system is not None:
+            system.remove(self)
+        super().kill()
+
+    def add_internal(self, group) -> None:
+        # Группа, привязанная к широкой фазе, регистрирует в ней новых членов
+        super().add_internal(group)
+        broadphase = bound_broadphase(group)
+        if broadphase is not None:
+            broadphase.insert(self)
+
+    def remove_internal(self, group) -> None:
+        super().remove_internal(group)
+        broadphase = bound_broadphase(group)
+        if broadphase is None or broadphase not in self._broadphases:
+            return
+        # Спрайт остаётся, если он ещё в другой группе той же структуры
+        if not any(bound_broadphase(other) is broadphase for other in self.groups()):
+            broadphase.remove(self)
 
     def add_animation(
-        self, name: str, frames: List[int], fps: float = 10, loop: bool = True
+        self,
+        name: str,
+        frames: List[int],
+        fps: float = 10,
+        loop: bool = True,
+        markers: Optional[Dict[int, str]] = None,
     ) -> None:
         """
         Добавить новую анимацию этому спрайту.
@@ -112,22 +236,48 @@ class AnimatedSprite(pygame.sprite.Sprite):
             frames: Список индексов кадров из спрайтшита
             fps: Скорость анимации (кадров в секунду)
             loop: Зацикливать ли анимацию
+            markers: Метки кадров {позиция в анимации: имя метки}
+                (см. on_animation_marker)
+
+        Спрайты одного листа с одинаковым описанием анимации получают
+        один общий объект Animation. Клипы, общие для всех спрайтов
+        листа, удобнее определить в библиотеке (см. define_clip).
 
         Пример:
             >>> sprite.add_animation("walk", [0, 1, 2, 3], fps=8)
             >>> sprite.add_animation("jump", [4, 5, 6], fps=12, loop=False)
         """
-        # Проверяем индексы кадров
-        valid_frames = [f for f in frames if 0 <= f < len(self.frames)]
-        if len(valid_frames) != len(frames):
-            invalid = [f for f in frames if f not in valid_frames]
-            print(
-                f"Warning: Invalid frame indices {invalid} for sprite with {len(self.frames)} frames"
-            )
+        # Одинаковые клипы спрайтов одного листа — один общий объект
+        library = get_clip_library()
+        sheet = self._sheet
+        animation = library.intern(sheet, name, frames, fps, loop, markers)
+        if animation is None:
+            # Проверяем индексы кадров
+            valid_frames = [f for f in frames if 0 <= f < len(self.frames)]
+            if len(valid_frames) != len(frames):
+                invalid = [f for f in frames if f not in valid_frames]
+                print(
+                    f"Warning: Invalid frame indices {invalid} for sprite with {len(self.frames)} frames"
+                )
 
-        animation = Animation(name, valid_frames, fps, loop)
+            animation = Animation(name, valid_frames, fps, loop, dict(markers or {}))
+            if len(valid_frames) == len(frames):
+                library.add_interned(sheet, animation)
         self.animation_manager.add_animation(animation)
 
+    def _library_clip(self, name: str) -> Optional[Animation]:
+        """Взять клип листа из библиотеки клипов и добавить его спрайту."""
+        clip = get_clip_library().get(self._sheet.key, name)
+        if clip is None:
+            return None
+        if max(clip.frames) >= len(self.frames) or min(clip.frames) < 0:
+            print(
+                f"Warning: Clip {name!r} uses frames outside the sheet with {len(self.frames)} frames"
+            )
+            return None
+        self.animation_manager.add_animation(clip)
+        return clip
+
     def play_animation(
         self, name: str, restart: bool = False, mirror: Optional[bool] = None
     ) -> bool:
@@ -139,12 +289,18 @@ class AnimatedSprite(pygame.sprite.Sprite):
             restart: Перезапустить, если анимация уже играет
             mirror: Переопределить состояние зеркалирования для этой анимации
 
+        Анимацию, не добавленную спрайту, play_animation() ищет среди
+        клипов его листа в библиотеке клипов.
+
         Возвращает:
             True — если анимация успешно запущена, False — если не найдена
         """
         if mirror is not None:
             self._mirrored = mirror
 
+        if not self.animation_manager.has_animation(name):
+            # Анимации нет у спрайта — ищем клип листа в библиотеке
+            self._library_clip(name)
         return self.animation_manager.play_animation(name, restart)
 
     def stop_animation(self) -> None:
@@ -159,6 +315,38 @@ class AnimatedSprite(pygame.sprite.Sprite):
         """Возобновить приостановленную анимацию."""
         self.animation_manager.resume()
 
+    def on_animation_finished(self, callback: Callable[[str], None]) -> None:
+        """
+        Вызвать функцию, когда незацикленная анимация спрайта завершится.
+
+        Обработчик вызывается из обычного обновления спрайта (или шага
+        AnimationSystem) с именем анимации, так что опрашивать
+        is_animation_finished() каждый кадр не нужно.
+
+        Аргументы:
+            callback: Функция (animation_name)
+
+        Пример:
+            >>> player.on_animation_finished(
+            ...     lambda name: player.play_animation("idle") if name == "attack" else None
+            ... )
+        """
+        self.animation_manager.on_finish(callback)
+
+    def on_animation_marker(self, marker: str, callback: Callable[[str, str], None]) -> None:
+        """
+        Вызвать функцию, когда анимация входит в кадр с меткой.
+
+        Аргументы:
+            marker: Имя метки (см. параметр markers у add_animation)
+            callback: Функция (animation_name, marker)
+
+        Пример:
+            >>> player.add_animation("walk", [1, 2, 3, 4], fps=8, markers={1: "step", 3: "step"})
+            >>> player.on_animation_marker("step", lambda name, marker: step_sound.play())
+        """
+        self.animation_manager.on_marker(marker, callback)
+
     def is_animation_finished(self) -> bool:
         """Проверить, завершилась ли текущая анимация (для незцикленных анимаций)."""
         return self.animation_manager.is_finished()
@@ -175,11 +363,21 @@ class AnimatedSprite(pygame.sprite.Sprite):
         """
         Обновить анимацию и физику спрайта.
 
+        Пока спрайт вне экрана (Game.set_camera с cull_updates), время
+        анимации копится и догоняется при первом обновлении на экране.
+
         Аргументы:
             dt: Дельта-время в секундах
         """
-        # Обновляем анимацию
-        self.animation_manager.update(dt)
+        self._previous_center = self.rect.center
+
+        if self._culled:
+            self._pending_animation_time += dt
+        else:
+            # Обновляем анимацию
+            self.animation_manager.update(dt + self._pending_animation_time)
+            self._pending_animation_time = 0.0
+
         current_animation = self.animation_manager.get_current_animation()
 
         if current_animation:
@@ -189,49 +387,127 @@ class AnimatedSprite(pygame.sprite.Sprite):
                 if 0 <= sprite_frame_index < len(self.frames):
                     self.current_frame = sprite_frame_index
 
-        # Обновляем физику
-        self.velocity[0] += self.acceleration[0] * dt
-        self.velocity[1] += self.acceleration[1] * dt
-
-        self._position[0] += self.velocity[0] * dt
-        self._position[1] += self.velocity[1] * dt
+        # Обновляем физику: движение интегрируется ровно один раз за тик —
+        # телом, если оно есть, иначе собственной скоростью спрайта
+        body = self.body
+        if body is not None:
+            dx, dy = body.update(dt)
+            self._position[0] += dx
+            self._position[1] += dy
+        else:
+            velocity = self._velocity
+            acceleration = self._acceleration
+            if acceleration[0] or acceleration[1]:
+                velocity[0] += acceleration[0] * dt
+                velocity[1] += acceleration[1] * dt
+            if velocity[0] or velocity[1]:
+                self._position[0] += velocity[0] * dt
+                self._position[1] += velocity[1] * dt
+
+        # Перестраиваем изображение и rect, только если что-то изменилось.
+        # Угол в ключе тот же, что выбирает изображение: квантованный
+        # кэшем трансформаций или шаг таблицы поворотов
+        flip_x = self.flip_x or self._mirrored
+        steps = self.rotation_steps
+        if steps:
+            rotation_key = int(round(self.rotation * steps / 360.0)) % steps
+        else:
+            rotation_key = self._transform_cache.quantize_rotation(self.rotation)
+        image_key = (
+            self.current_frame,
+            self.scale,
+            flip_x,
+            self.flip_y,
+            rotation_key,
+            self._sheet.version,
+            steps,
+        )
+        center = (int(self._position[0]), int(self._position[1]))
+        placement_key = (center, self.collision_offset)
+
+        changes = self.changes
+        changes.clear()
+        previous = self._image_key
+        if image_key != previous:
+            if previous is None:
+                changes.update(("frame", "scale", "flip", "rotation"))
+            else:
+                if image_key[0] != previous[0] or image_key[5:] != previous[5:]:
+                    changes.add("frame")
+                if image_key[1] != previous[1]:
+                    changes.add("scale")
+                if image_key[2:4] != previous[2:4]:
+                    changes.add("flip")
+                if image_key[4] != previous[4]:
+                    changes.add("rotation")
+
+            # Обновляем изображение с текущими трансформациями
+            self._update_image()
+            self._image_key = image_key
+            AnimatedSprite._rebuild_count += 1
+            if self.hitbox_shape == "mask":
+                # Маска совпадает с изображением по размеру
+                self.collision_rect.size = self.rect.size
+
+        if placement_key != self._placement_key:
+            changes.add("position")
+            self._placement_key = placement_key
+        elif not changes:
+            if self.rotation != self._hitbox_rotation and self._broadphases:
+                # Поворот внутри шага квантования не меняет изображение,
+                # но поворачивает хитбокс
+                self._hitbox_rotation = self.rotation
+                self._notify_broadphases()
+            return
 
-        # Обновляем изображение с текущими трансформациями
-        self._update_image()
+        # Хитбокс мог сместиться или измениться — обновляем широкую фазу
+        self._hitbox_rotation = self.rotation
+        if self._broadphases:
+            self._notify_broadphases()
 
         # Обновляем позицию rect
-        self.rect.center = (int(self._position[0]), int(self._position[1]))
+        self.rect.center = center
 
         # Обновляем rect коллизии
         self.collision_rect.center = (
-            self.rect.centerx + self.collision_offset[0],
-            self.rect.centery + self.collision_offset[1],
+            center[0] + self.collision_offset[0],
+            center[1] + self.collision_offset[1],
         )
 
+    def invalidate(self) -> None:
+        """Принудительно перестроить изображение при следующем update()."""
+        self._image_key = None
+        self._placement_key = None
+
+    @classmethod
+    def pop_rebuild_count(cls) -> int:
+        """
+        Получить количество перестроений изображения спрайтов с прошлого
+        вызова и сбросить счётчик. Game вызывает метод раз в кадр.
+        """
+        count = cls._rebuild_count
+        cls._rebuild_count = 0
+        return count
+
     def _update_image(self) -> None:
         """Обновить изображение с учётом текущих трансформаций."""
         if not self.frames:
             return
 
-        # Начинаем с текущего кадра
-        image = self.frames[self.current_frame].copy()
-
-        # Применяем масштабирование
-        if self.scale != 1.0:
-            new_size = (
-                int(image.get_width() * self.scale),
-                int(image.get_height() * self.scale),
+        if self.rotation_steps:
+            image = self._get_prerotated_image()
+        else:
+            # Берём кадр с трансформациями из кэша спрайтшита
+            image = self._transform_cache.get(
+                self.frames,
+                self.current_frame,
+                self.scale,
+                self.flip_x or self._mirrored,
+                self.flip_y,
+                self.rotation,
             )
-            image = pygame.transform.scale(image, new_size)
-
-        # Применяем отражение/зеркалирование
-        flip_x = self.flip_x or self._mirrored
-        if flip_x or self.flip_y:
-            image = pygame.transform.flip(image, flip_x, self.flip_y)
-
-        # Применяем поворот
-        if self.rotation != 0:
-            image = pygame.transform.rotate(image, self.rotation)
+        if self.copy_images:
+            image = image.copy()
 
         # Обновляем изображение и создаём новый rect.
         # Координаты центра установит вызывающий метод update(),
@@ -239,10 +515,167 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.image = image
         self.rect = self.image.get_rect()
 
+    def _get_prerotated_image(self) -> pygame.Surface:
+        """Взять текущий кадр из таблицы предрассчитанных поворотов."""
+        steps = self.rotation_steps
+        flip_x = self.flip_x or self._mirrored
+        key = (steps, self.scale, flip_x, self.flip_y, self._sheet.version)
+        if key != self._rotation_table_key:
+            self._rotation_table = self._sheet.get_rotation_table(
+                steps, self.scale, flip_x, self.flip_y, self._animation_frame_indices()
+            )
+            self._rotation_table_key = key
+
+        rotations = self._rotation_table.get(self.current_frame)
+        if rotations is None:
+            # Кадр не из анимаций (например, выставлен вручную) — досчитываем
+            rotations = self._sheet.get_rotation_table(
+                steps, self.scale, flip_x, self.flip_y, (self.current_frame,)
+            )[self.current_frame]
+
+        step = int(round(self.rotation * steps / 360.0)) % steps
+        return rotations[step]
+
+    def _animation_frame_indices(self) -> List[int]:
+        """Получить индексы кадров, используемых анимациями спрайта."""
+        indices = {self.current_frame}
+        for animation in self.animation_manager.animations.values():
+            indices.update(animation.frames)
+        return sorted(indices)
+
+    def set_rotation_steps(self, steps: Optional[int]) -> None:
+        """
+        Включить режим предрассчитанных поворотов.
+
+        Все кадры анимаций заранее поворачиваются на `steps` равных шагов
+        за полный оборот (например, 32, 64 или 128), после чего поворот
+        в каждом кадре — это поиск в таблице без вызова
+        pygame.transform.rotate. Больше шагов — точнее угол, но больше
+        памяти. Таблицы общие для всех спрайтов одного листа.
+        Передача None возвращает поворот на лету.
+
+        Аргументы:
+            steps: Количество шагов на оборот или None
+
+        Пример:
+            >>> turret.set_rotation_steps(64)
+            >>> turret.rotate_towards_mouse()
+        """
+        if steps is not None and steps < 1:
+            raise ValueError("rotation steps must be positive")
+
+        self.rotation_steps = steps
+        self._rotation_table = None
+        self._rotation_table_key = None
+        if steps and self.frames:
+            # Считаем таблицу сразу, а не в первом игровом кадре
+            self._get_prerotated_image()
+        self.invalidate()
+
     # Методы позиционирования и движения
     def set_position(self, x: float, y: float) -> None:
         """Установить позицию спрайта."""
         self._position = [float(x), float(y)]
+        if self.body is not None and self.body.sleeping:
+            self.body.wake()
+        if self._broadphases:
+            self._notify_broadphases()
+
+    # Физика
+    @property
+    def velocity(self):
+        """
+        Скорость [vx, vy] в пикселях/с.
+
+        Без тела — список спрайта, с телом — представление скорости тела
+        (правка элементов меняет тело; присваивание целиком будит его).
+        """
+        if self.body is not None:
+            return self.body.velocity
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value) -> None:
+        if self.body is not None:
+            self.body.velocity = value
+        else:
+            self._velocity = [float(value[0]), float(value[1])]
+
+    @property
+    def acceleration(self):
+        """
+        Ускорение [ax, ay] в пикселях/с².
+
+        Без тела ускорение постоянно; у тела это накопитель сил текущего
+        тика, который сбрасывается после шага (постоянное ускорение задают
+        гравитацией тела или apply_force() каждый тик).
+        """
+        if self.body is not None:
+            return self.body.acceleration
+        return self._acceleration
+
+    @acceleration.setter
+    def acceleration(self, value) -> None:
+        if self.body is not None:
+            self.body.acceleration = value
+        else:
+            self._acceleration = [float(value[0]), float(value[1])]
+
+    def attach_body(
+        self,
+        body: Optional[PhysicsBody] = None,
+        mass: float = 1.0,
+        gravity: float = 400.0,
+    ) -> PhysicsBody:
+        """
+        Прикрепить к спрайту физическое тело.
+
+        После этого update() двигает спрайт только смещением тела
+        (гравитация, трение, сопротивление воздуха, сон тела), а
+        velocity/acceleration спрайта читают и пишут данные тела.
+        Текущая скорость спрайта переходит к телу. Новое тело (без мира)
+        интегрируется в update() спрайта. Тела общего PhysicsWorld шагают
+        разом: добавьте мир в игру (Game.add_physics_world) или вызывайте
+        world.step() раз в тик до обновления спрайтов — update() возьмёт
+        смещение тела из массивов мира.
+
+        Аргументы:
+            body: Готовое тело (например, из общего PhysicsWorld);
+                если не указано, создаётся новое
+            mass: Масса нового тела
+            gravity: Гравитация нового тела (пикселей/с²)
+
+        Возвращает:
+            Прикреплённое тело
+
+        Пример:
+            >>> body = player.attach_body(gravity=1500)
+            >>> body.velocity = (0, -500)  # прыжок
+        """
+        if body is None:
+            body = PhysicsBody(mass, gravity)
+        if self.body is None:
+            body.velocity = self._velocity
+        self.body = body
+        return body
+
+    def detach_body(self) -> Optional[PhysicsBody]:
+        """
+        Открепить физическое тело; его скорость остаётся у спрайта.
+
+        Возвращает:
+            Открепленное тело или None
+        """
+        body = self.body
+        if body is not None:
+            self.body = None
+            self._velocity = [float(body.velocity[0]), float(body.velocity[1])]
+            self._acceleration = [0.0, 0.0]
+        return body
+
+    def is_sleeping(self) -> bool:
+        """Спит ли физическое тело спрайта (без тела — всегда False)."""
+        return self.body is not None and self.body.sleeping
 
     def get_position(self) -> Tuple[float, float]:
         """Получить текущую позицию спрайта."""
@@ -259,6 +692,8 @@ class AnimatedSprite(pygame.sprite.Sprite):
         # Синхронизируем rect и collision rect немедленно
         self.rect.centerx = int(value)
         self.collision_rect.centerx = int(value) + self.collision_offset[0]
+        if self._broadphases:
+            self._notify_broadphases()
 
     @property
     def y(self) -> float:
@@ -271,6 +706,8 @@ class AnimatedSprite(pygame.sprite.Sprite):
         # Синхронизируем rect и collision rect немедленно
         self.rect.centery = int(value)
         self.collision_rect.centery = int(value) + self.collision_offset[1]
+        if self._broadphases:
+            self._notify_broadphases()
 
     # -------------------------------------------------------------------------------
 
@@ -278,6 +715,8 @@ class AnimatedSprite(pygame.sprite.Sprite):
         """Переместить спрайт на смещение."""
         self._position[0] += dx
         self._position[1] += dy
+        if self._broadphases:
+            self._notify_broadphases()
 
     def move_to(self, x: float, y: float, speed: float = None) -> None:
         """Переместить спрайт к заданной позиции."""
@@ -291,8 +730,7 @@ class AnimatedSprite(pygame.sprite.Sprite):
             if distance > 0:
                 dx_norm = dx / distance
                 dy_norm = dy / distance
-                self.velocity[0] = dx_norm * speed
-                self.velocity[1] = dy_norm * speed
+                self.velocity = (dx_norm * speed, dy_norm * speed)
 
     # Методы трансформации
     def set_rotation(self, angle: float) -> None:
@@ -337,6 +775,7 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.collision_offset = (offset_x, offset_y)
         self.custom_hitbox_size = (width, height)
         self.hitbox_shape = "rect"
+        self._center_collision_rect()
 
     def set_collision_circle(
         self, radius: float, offset_x: int = 0, offset_y: int = 0
@@ -349,6 +788,133 @@ class AnimatedSprite(pygame.sprite.Sprite):
         size = int(radius * 2)
         self.collision_rect = pygame.Rect(0, 0, size, size)
         # Всё равно устанавливаем rect для совместимости
+        self._center_collision_rect()
+
+    def set_collision_mask(self) -> None:
+        """
+        Использовать попиксельную маску изображения как область коллизии.
+
+        Маски строятся один раз для каждого кадра, масштаба, отражения и
+        поворота и хранятся в спрайтшите, поэтому в установившемся режиме проверка стоит примерно как
+        прямоугольная: сначала сравниваются прямоугольники масок, и только
+        при их пересечении вызывается Mask.overlap. Маска совпадает с
+        изображением, collision_offset не используется.
+
+        Здесь же заранее строятся маски всех кадров анимаций при текущем
+        масштабе в обе стороны по X (зеркалирование переключается во время
+        игры), а в режиме предрассчитанных поворотов (set_rotation_steps) —
+        и для каждого шага поворота. Эти маски закреплены в листе вне лимита
+        кэша трансформаций. При свободном повороте маска нового угла
+        строится при первой проверке с этим углом и живёт в кэше.
+        Размер collision_rect следует за изображением при смене кадра,
+        масштаба или поворота.
+
+        Пример:
+            >>> player.set_collision_mask()
+            >>> if player.collides_with(spikes):
+            ...     player.take_damage()
+        """
+        self.hitbox_shape = "mask"
+        self.hitbox_radius = None
+        self.custom_hitbox_size = None
+        self.collision_offset = (0, 0)
+
+        steps = self.rotation_steps
+        if steps:
+            rotations = [step * 360.0 / steps for step in range(steps)]
+        else:
+            rotations = [self.rotation]
+        for frame_index in self._animation_frame_indices():
+            if 0 <= frame_index < len(self.frames):
+                for flip_x in (False, True):
+                    for rotation in rotations:
+                        self._sheet.get_mask(
+                            frame_index, self.scale, flip_x, self.flip_y, rotation, steps,
+                            pin=True,
+                        )
+
+        self.collision_rect = self.get_mask().get_rect()
+        self._center_collision_rect()
+
+    def get_mask(self) -> pygame.mask.Mask:
+        """Получить маску текущего кадра (с текущими трансформациями) из кэша спрайтшита."""
+        if not self.frames:
+            return pygame.mask.Mask(self.rect.size, fill=True)
+        return self._sheet.get_mask(
+            self.current_frame,
+            self.scale,
+            self.flip_x or self._mirrored,
+            self.flip_y,
+            self.rotation,
+            self.rotation_steps,
+        )
+
+    def _get_placed_mask(self) -> Tuple[pygame.mask.Mask, int, int]:
+        """Получить маску хитбокса и мировые координаты её левого верхнего угла."""
+        center_x = int(self._position[0])
+        center_y = int(self._position[1])
+        if self.hitbox_shape == "mask":
+            # Маска стоит там же, где изображение (rect.center = позиция)
+            mask = self.get_mask()
+            width, height = mask.get_size()
+            return mask, center_x - width // 2, center_y - height // 2
+
+        mask, dx, dy = self._get_shape_mask()
+        return mask, center_x + dx, center_y + dy
+
+    def _get_shape_mask(self) -> Tuple[pygame.mask.Mask, int, int]:
+        """
+        Растеризовать прямоугольный или круглый хитбокс в маску.
+
+        Нужна для проверки такого хитбокса против маски. Результат
+        кэшируется и не зависит от позиции: смещение (dx, dy) задано
+        относительно целочисленного центра спрайта.
+        """
+        key = (
+            self.hitbox_shape,
+            self.hitbox_radius,
+            self.collision_offset,
+            self.rotation,
+            self.scale,
+            self.custom_hitbox_size,
+            self.frame_size,
+        )
+        if self._shape_mask is not None and self._shape_mask[0] == key:
+            return self._shape_mask[1:]
+
+        center_x = int(self._position[0])
+        center_y = int(self._position[1])
+        left, top, right, bottom = self.get_collision_bounds()
+        origin_x = math.floor(left)
+        origin_y = math.floor(top)
+        size = (
+            max(1, math.ceil(right) - origin_x),
+            max(1, math.ceil(bottom) - origin_y),
+        )
+
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        if self.hitbox_shape == "circle":
+            circle_center = (
+                center_x + self.collision_offset[0] - origin_x,
+                center_y + self.collision_offset[1] - origin_y,
+            )
+            pygame.draw.circle(surface, (255, 255, 255), circle_center, self.hitbox_radius)
+        else:
+            points = [(x - origin_x, y - origin_y) for x, y in self._get_corners()]
+            pygame.draw.polygon(surface, (255, 255, 255), points)
+
+        mask = pygame.mask.from_surface(surface)
+        self._shape_mask = (key, mask, origin_x - center_x, origin_y - center_y)
+        return self._shape_mask[1:]
+
+    def _center_collision_rect(self) -> None:
+        """Поставить rect коллизии в текущую позицию спрайта."""
+        self.collision_rect.center = (
+            int(self._position[0]) + self.collision_offset[0],
+            int(self._position[1]) + self.collision_offset[1],
+        )
+        if self._broadphases:
+            self._notify_broadphases()
 
     def reset_collision_to_default(self) -> None:
         """Сбросить область коллизии к размеру спрайта."""
@@ -356,9 +922,42 @@ class AnimatedSprite(pygame.sprite.Sprite):
         self.hitbox_shape = "rect"
         self.hitbox_radius = None
         self.collision_offset = (0, 0)
+        if self._broadphases:
+            self._notify_broadphases()
+
+    def set_collision_layer(
+        self, layer: LayerSpec, collides_with: Optional[LayerSpec] = None
+    ) -> None:
+        """
+        Задать слой коллизий спрайта и слои, с которыми он сталкивается.
+
+        Пары, в которых слой одного спрайта не входит в фильтр другого,
+        отбрасываются до проверки геометрии — в collides_with, группах
+        и широкой фазе.
+
+        Аргументы:
+            layer: Имя слоя, набор имён или битовая маска
+            collides_with: Слои, с которыми спрайт может сталкиваться
+                (None — со всеми)
+
+        Пример:
+            >>> player.set_collision_layer("player", ["wall", "pickup", "trigger"])
+            >>> coin.set_collision_layer("pickup", "player")
+            >>> bush.set_collision_layer("decoration", [])
+        """
+        self.collision_layer = layer_bits(layer)
+        self.collision_filter = ALL_LAYERS if collides_with is None else layer_bits(collides_with)
 
     def collides_with(self, other: "AnimatedSprite") -> bool:
         """Проверить столкновение с другим спрайтом (поддерживает поворот и разные формы)."""
+        # Пары из несовместимых слоёв не проверяем вовсе
+        if not layers_interact(self, other):
+            return False
+
+        # Попиксельное столкновение, если хотя бы у одного хитбокс-маска
+        if self.hitbox_shape == "mask" or other.hitbox_shape == "mask":
+            return self._check_mask_collision(other)
+
         # Столкновение окружности с окружностью
         if self.hitbox_shape == "circle" and other.hitbox_shape == "circle":
             return self._check_circle_collision(other)
@@ -370,59 +969,129 @@ class AnimatedSprite(pygame.sprite.Sprite):
         # ВСЕГДА используем ту же коллизию по углам, что показывает debug_draw
         return self._check_precise_rect_collision(other)
 
+    def _check_mask_collision(self, other: "AnimatedSprite") -> bool:
+        """Попиксельное столкновение масок с предварительной проверкой прямоугольников."""
+        mask_a, left_a, top_a = self._get_placed_mask()
+        mask_b, left_b, top_b = other._get_placed_mask()
+
+        width_a, height_a = mask_a.get_size()
+        width_b, height_b = mask_b.get_size()
+        if (
+            left_a >= left_b + width_b
+            or left_b >= left_a + width_a
+            or top_a >= top_b + height_b
+            or top_b >= top_a + height_a
+        ):
+            return False
+
+        return mask_a.overlap(mask_b, (left_b - left_a, top_b - top_a)) is not None
+
     def _check_precise_rect_collision(self, other: "AnimatedSprite") -> bool:
         """Точное столкновение прямоугольников, использующее те же координаты, что и debug_draw."""
-        corners_a = self._get_corners()
-        corners_b = other._get_corners()
+        corners_a, bounds_a, normals_a = self._get_geometry()
+        corners_b, bounds_b, normals_b = other._get_geometry()
+
+        # Быстрый отказ по ограничивающим прямоугольникам
+        if (
+            bounds_a[2] < bounds_b[0]
+            or bounds_b[2] < bounds_a[0]
+            or bounds_a[3] < bounds_b[1]
+            or bounds_b[3] < bounds_a[1]
+        ):
+            return False
+
+        # Для двух неповёрнутых прямоугольников пересечения AABB достаточно
+        if self.rotation == 0 and other.rotation == 0:
+            return True
 
         # Используем SAT (теорема о разделяющих осях) для точной коллизии
-        return self._separating_axis_test(corners_a, corners_b)
-
-    def _separating_axis_test(self, corners_a, corners_b):
+        return self._separating_axis_test(corners_a, corners_b, normals_a + normals_b)
+
+    @staticmethod
+    def _edge_normals(corners) -> List[Tuple[float, float]]:
+        """Нормализованные нормали рёбер многоугольника (вырожденные пропускаются)."""
+        normals = []
+        for i in range(len(corners)):
+            # Получаем вектор ребра
+            p1 = corners[i]
+            p2 = corners[(i + 1) % len(corners)]
+            edge = (p2[0] - p1[0], p2[1] - p1[1])
+
+            # Получаем перпендикулярный (нормальный) вектор
+            normal = (-edge[1], edge[0])
+
+            # Нормализуем
+            length = math.sqrt(normal[0] ** 2 + normal[1] ** 2)
+            if length == 0:
+                continue
+            normals.append((normal[0] / length, normal[1] / length))
+        return normals
+
+    def _separating_axis_test(self, corners_a, corners_b, normals=None):
         """Проверка столкновения многоугольников методом теоремы о разделяющих осях."""
-        # Получаем все рёбра обоих многоугольников
-        all_corners = [corners_a, corners_b]
-
-        for corners in all_corners:
-            for i in range(len(corners)):
-                # Получаем вектор ребра
-                p1 = corners[i]
-                p2 = corners[(i + 1) % len(corners)]
-                edge = (p2[0] - p1[0], p2[1] - p1[1])
-
-                # Получаем перпендикулярный (нормальный) вектор
-                normal = (-edge[1], edge[0])
-
-                # Нормализуем
-                length = math.sqrt(normal[0] ** 2 + normal[1] ** 2)
-                if length == 0:
-                    continue
-                normal = (normal[0] / length, normal[1] / length)
-
-                # Проецируем оба многоугольника на эту ось
-                proj_a = [
-                    corner[0] * normal[0] + corner[1] * normal[1]
-                    for corner in corners_a
-                ]
-                proj_b = [
-                    corner[0] * normal[0] + corner[1] * normal[1]
-                    for corner in corners_b
-                ]
-
-                min_a, max_a = min(proj_a), max(proj_a)
-                min_b, max_b = min(proj_b), max(proj_b)
-
-                # Проверяем разделение
-                if max_a < min_b or max_b < min_a:
-                    return False  # Найдено разделение — коллизии нет
+        # Оси — нормали всех рёбер обоих многоугольников
+        if normals is None:
+            normals = self._edge_normals(corners_a) + self._edge_normals(corners_b)
+
+        for normal in normals:
+            # Проецируем оба многоугольника на эту ось
+            proj_a = [
+                corner[0] * normal[0] + corner[1] * normal[1]
+                for corner in corners_a
+            ]
+            proj_b = [
+                corner[0] * normal[0] + corner[1] * normal[1]
+                for corner in corners_b
+            ]
+
+            min_a, max_a = min(proj_a), max(proj_a)
+            min_b, max_b = min(proj_b), max(proj_b)
+
+            # Проверяем разделение
+            if max_a < min_b or max_b < min_a:
+                return False  # Найдено разделение — коллизии нет
         return True  # Разделение не найдено — коллизия обнаружена
 
     def _check_obb_collision(self, other: "AnimatedSprite") -> bool:
         """УСТАРЕЛО: Используйте _check_precise_rect_collision instead."""
         return self._check_precise_rect_collision(other)
 
+    def _get_geometry(self):
+        """
+        Получить кэшированную геометрию прямоугольного хитбокса.
+
+        Углы, ограничивающий прямоугольник и нормали рёбер пересчитываются
+        только при изменении позиции, поворота, масштаба или хитбокса.
+
+        Возвращает:
+            Кортеж (углы, (left, top, right, bottom), нормали рёбер)
+        """
+        key = (
+            int(self._position[0]),
+            int(self._position[1]),
+            self.collision_offset,
+            self.rotation,
+            self.scale,
+            self.custom_hitbox_size,
+            self.frame_size,
+        )
+        if key == self._geometry_key:
+            return self._geometry
+
+        corners = self._compute_corners()
+        xs = [x for x, _ in corners]
+        ys = [y for _, y in corners]
+        bounds = (min(xs), min(ys), max(xs), max(ys))
+        self._geometry = (corners, bounds, self._edge_normals(corners))
+        self._geometry_key = key
+        return self._geometry
+
     def _get_corners(self):
         """Получить четыре угла хитбокса спрайта — ТОЧНО как в debug_draw."""
+        return self._get_geometry()[0]
+
+    def _compute_corners(self):
+        """Вычислить четыре угла хитбокса в мировых координатах."""
         # Используем пользовательский размер, если задан, иначе размер кадра с масштабом
         if self.custom_hitbox_size:
             width, height = self.custom_hitbox_size
@@ -609,7 +1278,22 @@ class AnimatedSprite(pygame.sprite.Sprite):
         return math.sqrt(dx * dx + dy * dy)
 
     def collides_with_group(self, group: pygame.sprite.Group) -> List["AnimatedSprite"]:
-        """Проверить столкновение со всеми спрайтами в группе."""
+        """
+        Проверить столкновение со всеми спрайтами в группе.
+
+        Если группа привязана к структуре широкой фазы (bind_group,
+        Game.enable_broadphase), точная проверка выполняется только для
+        кандидатов из соседних ячеек; иначе проверяется вся группа.
+        """
+        broadphase = bound_broadphase(group)
+        if broadphase is not None:
+            # Кандидаты широкой фазы уже отфильтрованы по слоям коллизий
+            return [
+                sprite
+                for sprite in broadphase.query_sprite(self)
+                if sprite in group and self.collides_with(sprite)
+            ]
+
         collisions = []
         for sprite in group:
             if isinstance(sprite, AnimatedSprite) and sprite != self:
@@ -617,6 +1301,41 @@ class AnimatedSprite(pygame.sprite.Sprite):
                     collisions.append(sprite)
         return collisions
 
+    def get_collision_bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Получить ограничивающий прямоугольник хитбокса в мировых координатах.
+
+        Возвращает:
+            Кортеж (left, top, right, bottom)
+        """
+        if self.hitbox_shape == "circle":
+            center_x = int(self._position[0]) + self.collision_offset[0]
+            center_y = int(self._position[1]) + self.collision_offset[1]
+            radius = self.hitbox_radius
+            return (center_x - radius, center_y - radius, center_x + radius, center_y + radius)
+
+        if self.hitbox_shape == "mask":
+            mask, left, top = self._get_placed_mask()
+            width, height = mask.get_size()
+            return (left, top, left + width, top + height)
+
+        return self._get_geometry()[1]
+
+    def _register_broadphase(self, broadphase) -> None:
+        """Запомнить структуру широкой фазы, в которой зарегистрирован спрайт."""
+        if broadphase not in self._broadphases:
+            self._broadphases.append(broadphase)
+
+    def _unregister_broadphase(self, broadphase) -> None:
+        """Забыть структуру широкой фазы."""
+        if broadphase in self._broadphases:
+            self._broadphases.remove(broadphase)
+
+    def _notify_broadphases(self) -> None:
+        """Сообщить структурам широкой фазы об изменении хитбокса."""
+        for broadphase in self._broadphases:
+            broadphase.update(self)
+
     # Утилитарные методы
     def distance_to(self, other: Union["AnimatedSprite", Tuple[float, float]]) -> float:
         """Вычислить расстояние до другого спрайта или точки с учётом согласованных координат."""
@@ -677,6 +1396,12 @@ class AnimatedSprite(pygame.sprite.Sprite):
             )
             radius = int(self.hitbox_radius)
             pygame.draw.circle(screen, (0, 255, 0), center, radius, 2)
+        elif self.hitbox_shape == "mask":
+            # Контур маски в её мировой позиции
+            mask, left, top = self._get_placed_mask()
+            outline = [(left + x, top + y) for x, y in mask.outline()]
+            if len(outline) > 1:
+                pygame.draw.lines(screen, (0, 255, 0), True, outline, 1)
         else:
             # Рисуем прямоугольный хитбокс — ТОЧНО те же углы, что используются в коллизии
             corners = self._get_corners()
@@ -688,7 +1413,7 @@ class AnimatedSprite(pygame.sprite.Sprite):
         """Получить отладочную информацию о спрайте."""
         return {
             "position": self.get_position(),
-            "velocity": self.velocity.copy(),
+            "velocity": [float(v) for v in self.velocity],
             "rotation": self.rotation,
             "scale": self.scale,
             "current_frame": self.current_frame,
@@ -696,4 +1421,5 @@ class AnimatedSprite(pygame.sprite.Sprite):
             "animation_frame": self.get_animation_frame(),
             "total_frames": len(self.frames),
             "rect": (self.rect.x, self.rect.y, self.rect.width, self.rect.height),
+            "changes": sorted(self.changes),
         }
@@ -171,9 +171,14 @@ def create_spritesheet_from_frames(
         x = col * frame_width
         y = row * frame_height
 
-        frame = pygame.Surface(frame_size, pygame.SRCALPHA)
-        frame.blit(source_sheet, (0, 0), pygame.Rect(x, y, frame_width, frame_height))
-        frames.append(frame)
+        # Кадр — представление исходного листа, пиксели не копируются
+        frame_rect = pygame.Rect(x, y, frame_width, frame_height)
+        if source_sheet.get_rect().contains(frame_rect):
+            frames.append(source_sheet.subsurface(frame_rect))
+        else:
+            frame = pygame.Surface(frame_size, pygame.SRCALPHA)
+            frame.blit(source_sheet, (0, 0), frame_rect)
+            frames.append(frame)
 
     # Вычисляем размеры нового спрайтшита
     total_frames = len(frames)
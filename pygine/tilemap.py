@@ -0,0 +1,361 @@
+"""
+Тайловые карты с отрисовкой через заранее собранные чанки.
+"""
+
+import csv
+import pygame
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from .collision_grid import CollisionGrid
+
+# Идентификатор пустой клетки
+EMPTY_TILE = 0
+
+# Сетка хранит id в беззнаковых 16-битных ячейках
+MAX_TILE_ID = 0xFFFF
+
+TileSource = Union[str, Path, pygame.Surface]
+
+
+def _check_tile_id(tile_id: int) -> int:
+    """Проверить, что id тайла помещается в сетку карты."""
+    if not 0 <= tile_id <= MAX_TILE_ID:
+        raise ValueError(f"Tile id {tile_id} is outside the range 0..{MAX_TILE_ID}")
+    return tile_id
+
+
+class TileMap:
+    """
+    Тайловая карта уровня.
+
+    Карта хранит сетку идентификаторов тайлов и рисует её не по тайлам,
+    а готовыми поверхностями-чанками (по умолчанию 16x16 тайлов). Чанк
+    собирается при первой отрисовке и пересобирается, только когда в нём
+    меняется тайл, поэтому уровень 1000x100 тайлов выводится парой блитов
+    видимых чанков за кадр.
+
+    Аргументы:
+        tiles: Сетка идентификаторов тайлов (список строк), id от 0
+            до MAX_TILE_ID
+        tileset: Словарь {id: путь к изображению или Surface}; список
+            трактуется как id 1, 2, 3...
+        tile_size: Размер тайла (width, height) в пикселях
+        chunk_size: Размер чанка в тайлах
+        max_chunks: Сколько собранных чанков держать в памяти
+            (None — без ограничения)
+
+    Пример:
+        >>> level = TileMap(
+        ...     [[0, 0, 0], [1, 2, 1]],
+        ...     {1: "assets/tile_0136.png", 2: "assets/tile_0137.png"},
+        ...     (21, 21),
+        ... )
+        >>> game.add_tilemap(level)
+    """
+
+    def __init__(
+        self,
+        tiles: Sequence[Sequence[int]],
+        tileset: Union[Dict[int, TileSource], Sequence[TileSource]],
+        tile_size: Tuple[int, int],
+        chunk_size: int = 16,
+        max_chunks: Optional[int] = None,
+    ):
+        self.tile_size = (int(tile_size[0]), int(tile_size[1]))
+        self.chunk_size = max(1, int(chunk_size))
+        self.max_chunks = max_chunks
+
+        self.rows = len(tiles)
+        self.cols = max((len(row) for row in tiles), default=0)
+        self._grid = array("H", [EMPTY_TILE]) * (self.cols * self.rows)
+        for row_index, row in enumerate(tiles):
+            offset = row_index * self.cols
+            for col_index, tile_id in enumerate(row):
+                self._grid[offset + col_index] = _check_tile_id(tile_id)
+
+        self.chunks_x = (self.cols + self.chunk_size - 1) // self.chunk_size
+        self.chunks_y = (self.rows + self.chunk_size - 1) // self.chunk_size
+        self._chunks: "OrderedDict[Tuple[int, int], Optional[pygame.Surface]]" = OrderedDict()
+        self.chunks_baked = 0
+
+        self.tileset: Dict[int, pygame.Surface] = {}
+        if not isinstance(tileset, dict):
+            tileset = {index + 1: source for index, source in enumerate(tileset)}
+        for tile_id, source in tileset.items():
+            self.set_tile_image(tile_id, source)
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: Union[str, Path],
+        tileset: Union[Dict[int, TileSource], Sequence[TileSource]],
+        tile_size: Tuple[int, int],
+        chunk_size: int = 16,
+        max_chunks: Optional[int] = None,
+    ) -> "TileMap":
+        """
+        Загрузить карту из CSV-файла (строка файла — строка тайлов).
+
+        Пустые ячейки считаются пустыми тайлами. Остальные аргументы —
+        как у конструктора.
+        """
+        with open(path, newline="") as file:
+            tiles = [
+                [int(cell) if cell.strip() else EMPTY_TILE for cell in row]
+                for row in csv.reader(file)
+                if row
+            ]
+        return cls(tiles, tileset, tile_size, chunk_size, max_chunks)
+
+    # Размеры
+    @property
+    def pixel_width(self) -> int:
+        """Ширина карты в пикселях."""
+        return self.cols * self.tile_size[0]
+
+    @property
+    def pixel_height(self) -> int:
+        """Высота карты в пикселях."""
+        return self.rows * self.tile_size[1]
+
+    def get_rect(self) -> pygame.Rect:
+        """Получить прямоугольник карты в мировых координатах."""
+        return pygame.Rect(0, 0, self.pixel_width, self.pixel_height)
+
+    # Работа с тайлами
+    def set_tile_image(self, tile_id: int, source: TileSource) -> None:
+        """Задать изображение тайла (масштабируется под размер тайла)."""
+        if isinstance(source, pygame.Surface):
+            image = source
+        else:
+            image = pygame.image.load(str(source)).convert_alpha()
+        if image.get_size() != self.tile_size:
+            image = pygame.transform.scale(image, self.tile_size)
+        self.tileset[tile_id] = image
+        # Этот тайл мог уже попасть в собранные чанки
+        self._chunks.clear()
+
+    def in_bounds(self, col: int, row: int) -> bool:
+        """Проверить, лежит ли клетка внутри карты."""
+        return 0 <= col < self.cols and 0 <= row < self.rows
+
+    def get_tile(self, col: int, row: int) -> int:
+        """Получить id тайла в клетке (EMPTY_TILE за пределами карты)."""
+        if not self.in_bounds(col, row):
+            return EMPTY_TILE
+        return self._grid[row * self.cols + col]
+
+    def set_tile(self, col: int, row: int, tile_id: int) -> None:
+        """
+        Изменить тайл в клетке. Пересобран будет только его чанк.
+
+        Аргументы:
+            col: Столбец
+            row: Строка
+            tile_id: Новый id тайла (EMPTY_TILE — очистить)
+        """
+        if not self.in_bounds(col, row):
+            raise IndexError(f"Tile ({col}, {row}) is outside the {self.cols}x{self.rows} map")
+        tile_id = _check_tile_id(tile_id)
+        index = row * self.cols + col
+        if self._grid[index] == tile_id:
+            return
+        self._grid[index] = tile_id
+        self._chunks.pop((col // self.chunk_size, row // self.chunk_size), None)
+
+    def tile_at(self, x: float, y: float) -> int:
+        """Получить id тайла в точке мира."""
+        return self.get_tile(int(x // self.tile_size[0]), int(y // self.tile_size[1]))
+
+    def world_to_cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Перевести мировые координаты в (столбец, строка)."""
+        return (int(x // self.tile_size[0]), int(y // self.tile_size[1]))
+
+    def iter_tiles(self) -> Iterator[Tuple[int, int, int]]:
+        """Перебрать непустые клетки как (столбец, строка, id)."""
+        cols = self.cols
+        for index, tile_id in enumerate(self._grid):
+            if tile_id != EMPTY_TILE:
+                yield (index % cols, index // cols, tile_id)
+
+    def build_collision_grid(
+        self,
+        solid_ids: Optional[Iterable[int]] = None,
+        solid_outside: bool = False,
+    ) -> CollisionGrid:
+        """
+        Построить статическую сетку коллизий по карте.
+
+        Сетка — снимок текущих тайлов: после set_tile() её нужно
+        построить заново.
+
+        Аргументы:
+            solid_ids: Id твёрдых тайлов (None — любой непустой тайл)
+            solid_outside: Считать ли твёрдым всё за пределами карты
+
+        Пример:
+            >>> walls = level.build_collision_grid(solid_ids={1, 2})
+            >>> walls.move_sprite(player, dx, dy)
+        """
+        return CollisionGrid.from_tilemap(self, solid_ids, solid_outside)
+
+    # Чанки
+    def _bake_chunk(self, chunk_x: int, chunk_y: int) -> Optional[pygame.Surface]:
+        """Собрать поверхность чанка (None для полностью пустого)."""
+        tile_w, tile_h = self.tile_size
+        size = self.chunk_size
+        col_start = chunk_x * size
+        row_start = chunk_y * size
+        col_end = min(col_start + size, self.cols)
+        row_end = min(row_start + size, self.rows)
+
+        blits = []
+        for row in range(row_start, row_end):
+            offset = row * self.cols
+            y = (row - row_start) * tile_h
+            for col in range(col_start, col_end):
+                image = self.tileset.get(self._grid[offset + col])
+                if image is not None:
+                    blits.append((image, ((col - col_start) * tile_w, y)))
+
+        self.chunks_baked += 1
+        if not blits:
+            return None
+
+        surface = pygame.Surface(
+            ((col_end - col_start) * tile_w, (row_end - row_start) * tile_h),
+            pygame.SRCALPHA,
+        )
+        surface.blits(blits, doreturn=False)
+        return surface
+
+    def get_chunk(self, chunk_x: int, chunk_y: int) -> Optional[pygame.Surface]:
+        """Получить собранный чанк, собрав его при необходимости."""
+        key = (chunk_x, chunk_y)
+        if key in self._chunks:
+            self._chunks.move_to_end(key)
+            return self._chunks[key]
+
+        chunk = self._bake_chunk(chunk_x, chunk_y)
+        self._chunks[key] = chunk
+        if self.max_chunks is not None:
+            while len(self._chunks) > self.max_chunks:
+                self._chunks.popitem(last=False)
+        return chunk
+
+    def invalidate(self) -> None:
+        """Сбросить все собранные чанки."""
+        self._chunks.clear()
+
+    def _visible_chunks(
+        self, view: pygame.Rect
+    ) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Получить чанки, пересекающие область мира, с их мировыми позициями."""
+        chunk_w = self.chunk_size * self.tile_size[0]
+        chunk_h = self.chunk_size * self.tile_size[1]
+        first_x = max(0, view.left // chunk_w)
+        first_y = max(0, view.top // chunk_h)
+        last_x = min(self.chunks_x - 1, (view.right - 1) // chunk_w)
+        last_y = min(self.chunks_y - 1, (view.bottom - 1) // chunk_h)
+
+        visible = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.get_chunk(chunk_x, chunk_y)
+                if chunk is not None:
+                    visible.append((chunk, (chunk_x * chunk_w, chunk_y * chunk_h)))
+        return visible
+
+    # Отрисовка
+    def draw(
+        self,
+        surface: pygame.Surface,
+        camera=None,
+        area: Optional[pygame.Rect] = None,
+    ) -> int:
+        """
+        Нарисовать видимую часть карты.
+
+        Аргументы:
+            surface: Поверхность назначения
+            camera: Камера (её область просмотра и смещение), опционально
+            area: Ограничить отрисовку этой областью экрана
+
+        Возвращает:
+            Количество нарисованных чанков
+        """
+        if camera is not None:
+            offset = camera.get_offset()
+        else:
+            offset = (0, 0)
+
+        view = surface.get_rect() if area is None else pygame.Rect(area)
+        view = view.move(-offset[0], -offset[1])
+
+        blits = [
+            (chunk, (x + offset[0], y + offset[1]))
+            for chunk, (x, y) in self._visible_chunks(view)
+        ]
+        if not blits:
+            return 0
+
+        if area is not None:
+            previous_clip = surface.get_clip()
+            surface.set_clip(area)
+            surface.blits(blits, doreturn=False)
+            surface.set_clip(previous_clip)
+        else:
+            surface.blits(blits, doreturn=False)
+        return len(blits)
+
+    def submit(
+        self,
+        render_queue,
+        camera=None,
+        view_size: Optional[Tuple[int, int]] = None,
+        layer: int = -1,
+    ) -> None:
+        """
+        Добавить видимые чанки в очередь отрисовки.
+
+        Слой упорядочивает чанки только относительно блитов того же вывода
+        очереди. Game выводит очередь со спрайтами до вызова draw_callback,
+        поэтому чанки, добавленные из draw_callback, ложатся поверх
+        спрайтов; карту под спрайтами рисует Game.add_tilemap().
+
+        Аргументы:
+            render_queue: Очередь RenderQueue
+            camera: Камера, опционально
+            view_size: Размер области просмотра без камеры (по умолчанию
+                размер текущего окна; без окна обязателен)
+            layer: Слой очереди (по умолчанию -1 — под блитами слоя 0,
+                добавленными до того же flush())
+        """
+        if camera is not None:
+            view = camera.get_view_rect()
+            offset = camera.get_offset()
+        else:
+            if view_size is None:
+                screen = pygame.display.get_surface()
+                if screen is None:
+                    raise RuntimeError(
+                        "TileMap.submit() needs a camera or view_size when no display is set"
+                    )
+                view_size = screen.get_size()
+            view = pygame.Rect((0, 0), view_size)
+            offset = (0, 0)
+
+        for chunk, (x, y) in self._visible_chunks(view):
+            render_queue.submit(chunk, (x + offset[0], y + offset[1]), layer=layer)
+
+    def debug_info(self) -> Dict:
+        """Получить отладочную информацию о карте."""
+        return {
+            "size": (self.cols, self.rows),
+            "tile_size": self.tile_size,
+            "chunk_size": self.chunk_size,
+            "chunks_cached": len(self._chunks),
+            "chunks_baked": self.chunks_baked,
+        }
@@ -83,6 +83,15 @@ class UIElement(ABC):
         """Обработать событие ввода. Возвращает True, если событие было обработано."""
         return False
 
+    def render_state(self) -> tuple:
+        """
+        Состояние, от которого зависит внешний вид элемента.
+
+        Используется режимом грязных прямоугольников Game: элемент
+        перерисовывается, только когда состояние или rect изменились.
+        """
+        return (self.visible, self.enabled)
+
 
 class Button(UIElement):
     """Простой элемент кнопки интерфейса."""
@@ -146,6 +155,19 @@ class Button(UIElement):
         mouse_pos = pygame.mouse.get_pos()
         self.hovered = self.rect.collidepoint(mouse_pos)
 
+    def render_state(self) -> tuple:
+        """Состояние, от которого зависит внешний вид кнопки."""
+        return super().render_state() + (
+            self.hovered,
+            self.text,
+            self.font,
+            self.color,
+            self.hover_color,
+            self.text_color,
+            self.border_color,
+            self.border_radius,
+        )
+
     def draw(self, screen: pygame.Surface) -> None:
         """Нарисовать кнопку."""
         if not self.visible:
@@ -282,6 +304,17 @@ class HealthBar(UIElement):
         """Получить значение в процентах (0.0 до 1.0)."""
         return self.current_value / self.max_value if self.max_value > 0 else 0
 
+    def render_state(self) -> tuple:
+        """Состояние, от которого зависит внешний вид полосы."""
+        return super().render_state() + (
+            self.current_value,
+            self.max_value,
+            self.background_color,
+            self.fill_color,
+            self.border_color,
+            self.border_radius,
+        )
+
     def set_colors(
         self,
         background_color: Tuple[int, int, int] = None,
@@ -373,6 +406,10 @@ class Text(UIElement):
         text_surface = self.font.render(self.text, True, self.color)
         screen.blit(text_surface, self.rect.topleft)
 
+    def render_state(self) -> tuple:
+        """Состояние, от которого зависит внешний вид текста."""
+        return super().render_state() + (self.text, self.color, self.font)
+
     def set_text(self, text: str) -> None:
         """Установить содержимое текста."""
         self.text = text
@@ -457,6 +494,15 @@ class Panel(UIElement):
         if self.border_color:
             draw_rounded_rect_border(screen, self.border_color, self.rect, self.border_radius, self.border_width)
 
+    def render_state(self) -> tuple:
+        """Состояние, от которого зависит внешний вид панели."""
+        return super().render_state() + (
+            self.color,
+            self.border_color,
+            self.border_radius,
+            self.border_width,
+        )
+
     def set_colors(
         self,
         color: Tuple[int, int, int] = None,
@@ -611,6 +657,24 @@ class TextInput(UIElement):
             if cursor_x >= self.rect.x + 5 and cursor_x <= self.rect.x + self.rect.width - 5:
                 pygame.draw.line(screen, self.cursor_color, 
                                (cursor_x, cursor_y), (cursor_x, cursor_y + cursor_height), 2)
+
+    def render_state(self) -> tuple:
+        """Состояние, от которого зависит внешний вид поля ввода."""
+        return super().render_state() + (
+            self.text,
+            self.placeholder,
+            self.active,
+            self.cursor_pos,
+            self.cursor_visible,
+            self.font,
+            self.background_color,
+            self.text_color,
+            self.placeholder_color,
+            self.border_color,
+            self.active_border_color,
+            self.cursor_color,
+            self.border_radius,
+        )
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Обработать события ввода."""
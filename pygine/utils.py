@@ -4,6 +4,7 @@
 
 import pygame
 import time
+import warnings
 from typing import Tuple, Set, Any
 
 
@@ -17,19 +18,24 @@ _mouse_just_released: Tuple[bool, bool, bool] = (False, False, False)
 _mouse_pos: Tuple[int, int] = (0, 0)
 
 
-def update_input_state() -> None:
+def update_input_state(keep_edges: bool = False) -> None:
     """
     Обновить отслеживание состояния ввода. Должна вызываться один раз за кадр.
     Эта функция автоматически вызывается классом Game.
+
+    Аргументы:
+        keep_edges: Не сбрасывать ещё не прочитанные "только что нажато/
+            отпущено" прошлых кадров, а добавить к ним новые. Так Game в
+            режиме фиксированного шага доносит нажатие из кадра без тиков
+            до ближайшего тика (и сбрасывает его consume_input_edges())
     """
     global _pressed_keys, _just_pressed_keys, _just_released_keys
     global _mouse_pressed, _mouse_just_pressed, _mouse_just_released, _mouse_pos
 
-    # Очищаем состояния "только что нажато" с предыдущего кадра
-    _just_pressed_keys.clear()
-    _just_released_keys.clear()
-    _mouse_just_pressed = (False, False, False)
-    _mouse_just_released = (False, False, False)
+    previous_pressed = _just_pressed_keys if keep_edges else set()
+    previous_released = _just_released_keys if keep_edges else set()
+    previous_mouse_pressed = _mouse_just_pressed if keep_edges else (False, False, False)
+    previous_mouse_released = _mouse_just_released if keep_edges else (False, False, False)
 
     # Получаем текущие состояния
     current_keys = set()
@@ -77,22 +83,40 @@ def update_input_state() -> None:
             current_keys.add(key_code)
 
     # Определяем только что нажатые и только что отпущенные клавиши
-    _just_pressed_keys = current_keys - _pressed_keys
-    _just_released_keys = _pressed_keys - current_keys
+    _just_pressed_keys = previous_pressed | (current_keys - _pressed_keys)
+    _just_released_keys = previous_released | (_pressed_keys - current_keys)
     _pressed_keys = current_keys
 
     # Обновляем состояние мыши
     current_mouse = pygame.mouse.get_pressed()
     _mouse_just_pressed = tuple(
-        current_mouse[i] and not _mouse_pressed[i] for i in range(3)
+        previous_mouse_pressed[i] or (current_mouse[i] and not _mouse_pressed[i])
+        for i in range(3)
     )
     _mouse_just_released = tuple(
-        not current_mouse[i] and _mouse_pressed[i] for i in range(3)
+        previous_mouse_released[i] or (not current_mouse[i] and _mouse_pressed[i])
+        for i in range(3)
     )
     _mouse_pressed = current_mouse
     _mouse_pos = pygame.mouse.get_pos()
 
 
+def consume_input_edges() -> None:
+    """
+    Сбросить "только что нажато/отпущено" после того, как их увидел тик.
+
+    Game вызывает её после первого тика кадра в режиме фиксированного
+    шага, чтобы следующий тик того же кадра не увидел нажатие повторно.
+    """
+    global _just_pressed_keys, _just_released_keys
+    global _mouse_just_pressed, _mouse_just_released
+
+    _just_pressed_keys = set()
+    _just_released_keys = set()
+    _mouse_just_pressed = (False, False, False)
+    _mouse_just_released = (False, False, False)
+
+
 def key_pressed(key_code: int) -> bool:
     """
     Проверить, удерживается ли клавиша в данный момент.
@@ -265,6 +289,13 @@ def wait_for_animation(sprite: Any) -> None:
     """
     Ожидать, пока не завершится текущая анимация спрайта.
 
+    Устарело: функция блокирует игровой цикл. Внутри игры используйте
+    сценарий с `yield animation_finished(sprite)` (Game.start_coroutine)
+    или обработчик sprite.on_animation_finished().
+
+    Возвращается сразу, если анимация не играет, и раньше конца, если
+    её остановили или сменили. Для зацикленной анимации вызывает ValueError.
+
     Args:
         sprite: Экземпляр AnimatedSprite
 
@@ -274,12 +305,37 @@ def wait_for_animation(sprite: Any) -> None:
     """
     from .sprite import AnimatedSprite
 
+    warnings.warn(
+        "wait_for_animation() blocks the game loop; use "
+        "Game.start_coroutine() with animation_finished() instead",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if not isinstance(sprite, AnimatedSprite):
         return
-
-    while not sprite.is_animation_finished():
-        sprite.update()
-        time.sleep(0.01)
+    if sprite.animation_manager._system is not None:
+        # Кадры такого спрайта продвигает только шаг системы в игровом цикле
+        raise RuntimeError(
+            "wait_for_animation() cannot drive a sprite managed by AnimationSystem; "
+            "use animation_finished() in a coroutine"
+        )
+
+    manager = sprite.animation_manager
+    clip = manager.current_animation
+    if clip is None or not manager.is_playing:
+        return
+    if clip.loop:
+        raise ValueError(
+            f"Animation '{clip.name}' loops and never finishes; use a non-looping clip"
+        )
+
+    # Продвигаем анимацию реальным временем и обрабатываем события окна,
+    # чтобы оно не зависало, пока ждём. Ожидание заканчивается и тогда,
+    # когда клип остановили или сменили (например, обработчиком метки)
+    clock = pygame.time.Clock()
+    while manager.is_playing and manager.current_animation is clip:
+        pygame.event.pump()
+        sprite.update(clock.tick(60) / 1000.0)
 
 
 def distance(pos1: Tuple[float, float], pos2: Tuple[float, float]) -> float:
@@ -0,0 +1,34 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def display():
+    pygame.init()
+    screen = pygame.display.set_mode((320, 240))
+    yield screen
+    pygame.quit()
+
+
+@pytest.fixture(scope="session")
+def sheet_path(tmp_path_factory):
+    """Спрайтшит 4x2 кадра 16x16; кадр n залит своим непрозрачным цветом."""
+    sheet = pygame.Surface((64, 32), pygame.SRCALPHA)
+    for index in range(8):
+        color = (30 * index, 255 - 30 * index, 100, 255)
+        sheet.fill(color, ((index % 4) * 16, (index // 4) * 16, 16, 16))
+    path = tmp_path_factory.mktemp("sheets") / "sheet.png"
+    pygame.image.save(sheet, str(path))
+    return str(path)
+
+
+@pytest.fixture
+def game():
+    from pygine import Game
+
+    return Game(320, 240, create_display=False)
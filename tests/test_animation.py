@@ -0,0 +1,118 @@
+import gc
+import random
+
+import pytest
+
+from pygine import AnimatedSprite, AnimationManager, AnimationSystem
+from pygine.animation import Animation
+
+
+def _manager(loop=True):
+    manager = AnimationManager()
+    manager.add_animation(Animation("walk", [0, 1, 2, 3], fps=10, loop=loop))
+    manager.play_animation("walk")
+    return manager
+
+
+def test_update_carries_remainder():
+    manager = _manager()
+    for _ in range(3):
+        manager.update(0.04)
+    # 0.12 с при 0.1 с на кадр: один кадр и остаток 0.02
+    assert manager.current_frame_index == 1
+    assert manager.frame_timer == pytest.approx(0.02)
+
+
+def test_update_steps_several_frames_at_once():
+    manager = _manager()
+    manager.update(0.25)
+    assert manager.current_frame_index == 2
+    assert manager.frame_timer == pytest.approx(0.05)
+
+    manager.update(0.2)  # 4 + 0.5 кадра: круг
+    assert manager.current_frame_index == 0
+
+
+def test_non_looping_stops_on_last_frame():
+    manager = _manager(loop=False)
+    finished = []
+    manager.on_finish(finished.append)
+    manager.update(10.0)
+    assert manager.current_frame_index == 3
+    assert manager.is_finished()
+    assert not manager.is_playing
+    assert finished == ["walk"]
+
+
+def test_markers_fire_once_per_entry():
+    manager = AnimationManager()
+    manager.add_animation(Animation("run", [0, 1, 2], fps=10, markers={1: "step"}))
+    manager.play_animation("run")
+    hits = []
+    manager.on_marker("step", lambda name, marker: hits.append(marker))
+    manager.update(0.1)
+    manager.update(0.05)
+    assert hits == ["step"]
+    manager.update(1.0)  # несколько кругов за раз — одна метка
+    assert hits == ["step", "step"]
+
+
+def test_system_matches_manager_update(sheet_path):
+    rng = random.Random(7)
+    local = []
+    shared = []
+    system = AnimationSystem(capacity=2)
+    for index in range(20):
+        loop = index % 3 != 0
+        fps = rng.choice([5, 8, 12, 24])
+        for bucket in (local, shared):
+            sprite = AnimatedSprite(sheet_path, (16, 16))
+            sprite.add_animation("clip", [0, 1, 2, 3, 4], fps=fps, loop=loop)
+            sprite.play_animation("clip")
+            bucket.append(sprite)
+    for sprite in shared:
+        system.add(sprite)
+
+    for _ in range(60):
+        dt = rng.uniform(0.0, 0.2)
+        system.step(dt)
+        for sprite in local:
+            sprite.animation_manager.update(dt)
+        for a, b in zip(local, shared):
+            ma, mb = a.animation_manager, b.animation_manager
+            assert mb.current_frame_index == ma.current_frame_index
+            assert mb.frame_timer == pytest.approx(ma.frame_timer)
+            assert mb.is_playing == ma.is_playing
+            assert mb.finished == ma.finished
+
+
+def test_killed_sprite_leaves_system(game, sheet_path):
+    system = game.enable_animation_system()
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    sprite.add_animation("walk", [0, 1, 2], fps=10)
+    sprite.play_animation("walk")
+    game.add_sprite(sprite)
+    game.dt = 0.1
+    game._update()
+    assert sprite in system
+
+    sprite.kill()
+    assert sprite not in system
+    assert len(system) == 0
+    # Состояние вернулось в менеджер спрайта
+    assert sprite.animation_manager.current_frame_index == 1
+    assert sprite.animation_manager._system is None
+
+
+def test_collected_sprite_releases_slot(sheet_path):
+    system = AnimationSystem()
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    sprite.add_animation("walk", [0, 1], fps=10)
+    sprite.play_animation("walk")
+    system.add(sprite)
+    assert len(system) == 1
+
+    del sprite
+    gc.collect()
+    assert len(system) == 0
+    assert system.step(1.0) == []
@@ -0,0 +1,167 @@
+import random
+
+import pygame
+import pytest
+
+from pygine import AnimatedSprite, LooseQuadtree, SpatialHash, layers_interact, query_many
+
+
+def _scatter(sheet_path, count, seed=1):
+    rng = random.Random(seed)
+    sprites = []
+    for _ in range(count):
+        sprite = AnimatedSprite(sheet_path, (16, 16))
+        sprite.set_scale(rng.choice([0.5, 1.0, 2.0]))
+        sprite.set_rotation(rng.choice([0, 15, 45, 90]))
+        if rng.random() < 0.3:
+            sprite.set_collision_circle(rng.randint(4, 12))
+        sprite.set_position(rng.uniform(0, 300), rng.uniform(0, 300))
+        sprite.update(0)
+        sprites.append(sprite)
+    return sprites
+
+
+def _brute_force(sprites):
+    pairs = set()
+    for i, a in enumerate(sprites):
+        for b in sprites[i + 1:]:
+            if layers_interact(a, b) and a.collides_with(b):
+                pairs.add(frozenset((a, b)))
+    return pairs
+
+
+@pytest.mark.parametrize(
+    "make", [lambda: SpatialHash(32), lambda: LooseQuadtree((0, 0, 320, 320))]
+)
+def test_colliding_pairs_match_brute_force(sheet_path, make):
+    sprites = _scatter(sheet_path, 80)
+    structure = make()
+    for sprite in sprites:
+        structure.insert(sprite)
+    expected = _brute_force(sprites)
+    assert expected
+    assert {frozenset(pair) for pair in structure.colliding_pairs()} == expected
+
+    # После перемещения структура обновляется инкрементально
+    rng = random.Random(2)
+    for sprite in sprites[::2]:
+        sprite.set_position(rng.uniform(0, 300), rng.uniform(0, 300))
+        sprite.update(0)
+    expected = _brute_force(sprites)
+    assert {frozenset(pair) for pair in structure.colliding_pairs()} == expected
+
+
+def test_collides_with_group_checks_unregistered_members(sheet_path):
+    grid = SpatialHash(32)
+    player = AnimatedSprite(sheet_path, (16, 16))
+    player.set_position(100, 100)
+    player.update(0)
+    grid.insert(player)
+    for index in range(3):
+        other = AnimatedSprite(sheet_path, (16, 16))
+        other.set_position(300 + index * 40, 300)
+        other.update(0)
+        grid.insert(other)
+
+    group = []
+    for index in range(5):
+        hit = AnimatedSprite(sheet_path, (16, 16))
+        hit.set_position(100 + index, 100)
+        hit.update(0)
+        group.append(hit)
+
+    hits = player.collides_with_group(pygame.sprite.Group(group))
+    assert set(hits) == set(group)
+
+
+def test_collides_with_group_uses_bound_broadphase(sheet_path, monkeypatch):
+    sprites = _scatter(sheet_path, 40, seed=5)
+    grid = SpatialHash(32)
+    group = pygame.sprite.Group(sprites)
+    grid.bind_group(group)
+    assert all(sprite in grid for sprite in sprites)
+
+    # Группа не перебирается: кандидаты берутся из структуры
+    monkeypatch.setattr(
+        pygame.sprite.Group, "__iter__", lambda self: pytest.fail("group was scanned")
+    )
+    for sprite in sprites:
+        expected = {
+            other
+            for other in sprites
+            if other is not sprite and layers_interact(sprite, other) and sprite.collides_with(other)
+        }
+        assert set(sprite.collides_with_group(group)) == expected
+
+
+def test_bound_group_tracks_membership(sheet_path):
+    grid = SpatialHash(32)
+    group = pygame.sprite.Group()
+    grid.bind_group(group)
+
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    group.add(sprite)
+    assert sprite in grid
+    group.remove(sprite)
+    assert sprite not in grid
+
+    other_group = pygame.sprite.Group()
+    grid.bind_group(other_group)
+    group.add(sprite)
+    other_group.add(sprite)
+    group.remove(sprite)
+    assert sprite in grid  # ещё в другой привязанной группе
+    sprite.kill()
+    assert sprite not in grid
+
+    grid.unbind_group(group)
+    group.add(sprite)
+    assert sprite not in grid
+
+
+def test_game_broadphase_follows_all_sprites(game, sheet_path):
+    game.enable_broadphase(32)
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    game.all_sprites.add(sprite)
+    assert sprite in game.broadphase
+    game.remove_sprite(sprite)
+    assert sprite not in game.broadphase
+
+
+@pytest.mark.parametrize(
+    "make", [lambda: SpatialHash(32), lambda: LooseQuadtree((0, 0, 320, 320))]
+)
+def test_layer_filter_applies_everywhere(sheet_path, make):
+    # Все спрайты в одной точке: геометрически сталкивается каждая пара
+    sprites = []
+    specs = [("player", ["wall", "pickup"]), ("wall", None), ("pickup", "player"), ("decoration", [])]
+    for layer, collides_with in specs * 2:
+        sprite = AnimatedSprite(sheet_path, (16, 16))
+        sprite.set_collision_layer(layer, collides_with)
+        sprite.set_position(50, 50)
+        sprite.update(0)
+        sprites.append(sprite)
+
+    structure = make()
+    for sprite in sprites:
+        structure.insert(sprite)
+
+    expected = _brute_force(sprites)
+    # Игрок — со стеной и подбором, стена — со стеной; декорация ни с чем
+    names = dict(zip(sprites, [layer for layer, _ in specs] * 2))
+    assert {frozenset(names[s] for s in pair) for pair in expected} == {
+        frozenset(("player", "wall")),
+        frozenset(("player", "pickup")),
+        frozenset(("wall",)),
+    }
+    assert {frozenset(pair) for pair in structure.colliding_pairs()} == expected
+
+    player, wall, pickup, decoration = sprites[:4]
+    assert structure.query_sprite(player) == {wall, pickup, sprites[5], sprites[6]}
+    assert structure.query_sprite(decoration) == set()
+    assert not layers_interact(wall, pickup)
+    assert not wall.collides_with(pickup)
+    assert player.collides_with(pickup)
+
+    pairs = {frozenset((sprites[i], sprites[j])) for i, j in query_many(sprites).tolist()}
+    assert pairs == expected
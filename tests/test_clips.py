@@ -0,0 +1,97 @@
+import gc
+import json
+import shutil
+
+import pygame
+import pytest
+
+from pygine import AnimatedSprite, define_clip, get_clip_library, load_clip_manifest
+from pygine.frame_cache import get_frame_store
+
+
+@pytest.fixture(autouse=True)
+def library():
+    library = get_clip_library()
+    yield library
+    library.clear()
+
+
+@pytest.fixture
+def own_sheet(sheet_path, tmp_path):
+    """Копия тестового листа, которую не держат спрайты других тестов."""
+    path = tmp_path / "own.png"
+    shutil.copy(sheet_path, path)
+    return str(path)
+
+
+def test_define_clip_is_shared_by_sprites_of_the_sheet(sheet_path):
+    clip = define_clip(sheet_path, (16, 16), "walk", [0, 1, 2], fps=10)
+    a = AnimatedSprite(sheet_path, (16, 16))
+    b = AnimatedSprite(sheet_path, (16, 16))
+    assert a.play_animation("walk")
+    assert b.play_animation("walk")
+    assert a.animation_manager.animations["walk"] is clip
+    assert b.animation_manager.animations["walk"] is clip
+
+    # Лист с другим размером кадра — другие клипы
+    other = AnimatedSprite(sheet_path, (32, 16))
+    assert not other.play_animation("walk")
+
+
+def test_manifest_defines_clips_relative_to_its_folder(own_sheet, tmp_path):
+    manifest = tmp_path / "clips.json"
+    manifest.write_text(json.dumps({"sheets": [{
+        "image": "own.png",
+        "frame_size": [16, 16],
+        "clips": {
+            "idle": {"frames": [0], "fps": 1},
+            "spin": {"frames": [0, 1], "loop": False, "markers": {"1": "flip"}},
+        },
+    }]}))
+    assert load_clip_manifest(manifest) == 2
+
+    clips = get_clip_library().clips_for(own_sheet, (16, 16))
+    assert set(clips) == {"idle", "spin"}
+    assert clips["spin"].loop is False
+    assert clips["spin"].markers == {1: "flip"}
+    assert clips["idle"].fps == 1
+
+
+def test_add_animation_interns_per_sheet(own_sheet, library):
+    a = AnimatedSprite(own_sheet, (16, 16))
+    b = AnimatedSprite(own_sheet, (16, 16))
+    a.add_animation("walk", [0, 1, 2], fps=8)
+    b.add_animation("walk", [0, 1, 2], fps=8)
+    assert a.animation_manager.animations["walk"] is b.animation_manager.animations["walk"]
+
+    # Другое описание — другой объект
+    b.add_animation("run", [0, 1, 2], fps=12)
+    a.add_animation("run", [0, 1, 2], fps=8)
+    assert a.animation_manager.animations["run"] is not b.animation_manager.animations["run"]
+
+    # Частный лист с тем же путём не делит клипы с общим
+    private = AnimatedSprite(own_sheet, (16, 16))
+    private.frames = [frame.copy() for frame in private.frames]
+    private.add_animation("walk", [0, 1, 2], fps=8)
+    assert private.animation_manager.animations["walk"] is not a.animation_manager.animations["walk"]
+    assert library.debug_info()["interned"] == 4
+
+
+def test_purge_forgets_interned_clips(own_sheet, library):
+    sprite = AnimatedSprite(own_sheet, (16, 16))
+    sprite.add_animation("walk", [0, 1, 2], fps=8)
+    sheet = sprite._sheet
+    assert library.intern(sheet, "walk", [0, 1, 2], 8, True) is not None
+
+    sprite.release_frames()
+    assert get_frame_store().purge() >= 1
+    assert library.intern(sheet, "walk", [0, 1, 2], 8, True) is None
+
+    # Частный лист забывается вместе с последней ссылкой на него
+    private = AnimatedSprite(own_sheet, (16, 16))
+    private.frames = [pygame.Surface((16, 16))] * 3
+    private.add_animation("walk", [0, 1, 2], fps=8)
+    before = library.debug_info()["interned"]
+    del private
+    gc.collect()
+    assert library.debug_info()["interned"] == before - 1
@@ -0,0 +1,143 @@
+import random
+
+import pygame
+import pytest
+
+from pygine import AnimatedSprite, query_many
+
+
+def _project(corners, axis):
+    values = [x * axis[0] + y * axis[1] for x, y in corners]
+    return min(values), max(values)
+
+
+def _reference_overlap(corners_a, corners_b):
+    """SAT без кэшей и ранних выходов: все нормали рёбер обоих многоугольников."""
+    for corners in (corners_a, corners_b):
+        for i in range(len(corners)):
+            x1, y1 = corners[i]
+            x2, y2 = corners[(i + 1) % len(corners)]
+            axis = (y1 - y2, x2 - x1)
+            if axis == (0, 0):
+                continue
+            min_a, max_a = _project(corners_a, axis)
+            min_b, max_b = _project(corners_b, axis)
+            if max_a < min_b or max_b < min_a:
+                return False
+    return True
+
+
+def _random_rect_sprites(sheet_path, count, rng):
+    sprites = []
+    for _ in range(count):
+        sprite = AnimatedSprite(sheet_path, (16, 16))
+        sprite.set_scale(rng.choice([0.5, 1.0, 2.0]))
+        sprite.set_rotation(rng.choice([0, 0, 10, 30, 45, 60, 90]))
+        if rng.random() < 0.3:
+            sprite.set_collision_rect(rng.randint(4, 30), rng.randint(4, 30))
+        sprite.set_position(rng.uniform(0, 120), rng.uniform(0, 120))
+        sprite.update(0)
+        sprites.append(sprite)
+    return sprites
+
+
+def test_sat_matches_reference(sheet_path):
+    rng = random.Random(7)
+    sprites = _random_rect_sprites(sheet_path, 40, rng)
+    for i, a in enumerate(sprites):
+        for b in sprites[i + 1:]:
+            expected = _reference_overlap(a._compute_corners(), b._compute_corners())
+            assert a.collides_with(b) == expected
+
+
+def test_geometry_cache_follows_changes(sheet_path):
+    rng = random.Random(3)
+    a, b = _random_rect_sprites(sheet_path, 2, rng)
+    for _ in range(200):
+        # Меняем позицию, поворот или масштаб после того, как геометрия закэширована
+        sprite = rng.choice((a, b))
+        change = rng.randrange(3)
+        if change == 0:
+            sprite.set_position(rng.uniform(0, 60), rng.uniform(0, 60))
+        elif change == 1:
+            sprite.set_rotation(rng.uniform(0, 360))
+        else:
+            sprite.set_scale(rng.choice([0.5, 1.0, 2.0]))
+        sprite.update(0)
+        expected = _reference_overlap(a._compute_corners(), b._compute_corners())
+        assert a.collides_with(b) == expected
+        assert a._get_corners() == a._compute_corners()
+
+
+def test_query_many_matches_brute_force(sheet_path):
+    rng = random.Random(11)
+    sprites = _random_rect_sprites(sheet_path, 40, rng)
+    for sprite in sprites[::4]:
+        sprite.set_collision_circle(rng.randint(4, 14))
+        sprite.update(0)
+
+    pairs = {tuple(pair) for pair in query_many(sprites).tolist()}
+    expected = {
+        (i, j)
+        for i in range(len(sprites))
+        for j in range(i + 1, len(sprites))
+        if sprites[i].collides_with(sprites[j])
+    }
+    assert pairs == expected
+
+    bullets, enemies = sprites[:15], sprites[15:]
+    pairs = {tuple(pair) for pair in query_many(bullets, enemies).tolist()}
+    expected = {
+        (i, j)
+        for i, a in enumerate(bullets)
+        for j, b in enumerate(enemies)
+        if a.collides_with(b)
+    }
+    assert pairs == expected
+
+
+@pytest.fixture
+def blob_sheet(tmp_path):
+    """Лист 4x16x16 с прозрачным фоном: круги разного радиуса со сдвигом."""
+    sheet = pygame.Surface((64, 16), pygame.SRCALPHA)
+    for index in range(4):
+        pygame.draw.circle(sheet, (255, 255, 255, 255), (index * 16 + 6, 8), 3 + index)
+    path = tmp_path / "blobs.png"
+    pygame.image.save(sheet, str(path))
+    return str(path)
+
+
+def _pixels(sprite):
+    mask = pygame.mask.from_surface(sprite.image)
+    left, top = sprite.rect.topleft
+    width, height = mask.get_size()
+    return {
+        (left + x, top + y)
+        for y in range(height)
+        for x in range(width)
+        if mask.get_at((x, y))
+    }
+
+
+def test_mask_collision_matches_pixel_brute_force(blob_sheet):
+    rng = random.Random(5)
+    sprites = []
+    for index in range(12):
+        sprite = AnimatedSprite(blob_sheet, (16, 16))
+        if index % 2:
+            sprite.set_rotation_steps(8)
+        sprite.set_collision_mask()
+        sprites.append(sprite)
+
+    for _ in range(30):
+        for sprite in sprites:
+            sprite.current_frame = rng.randrange(4)
+            sprite.flip_x = rng.random() < 0.5
+            sprite.set_scale(rng.choice([1.0, 2.0]))
+            sprite.set_rotation(rng.choice([0, 45, 90, 100]))
+            sprite.set_position(rng.uniform(0, 60), rng.uniform(0, 60))
+            sprite.update(0)
+        pixels = [_pixels(sprite) for sprite in sprites]
+        for i, a in enumerate(sprites):
+            for j in range(i + 1, len(sprites)):
+                assert a.collides_with(sprites[j]) == bool(pixels[i] & pixels[j])
@@ -0,0 +1,90 @@
+from pygine import AnimatedSprite
+
+
+def _sprite(sheet_path, x, y):
+    sprite = AnimatedSprite(sheet_path, (16, 16), (x, y))
+    sprite.set_position(x, y)
+    sprite.update(0)
+    return sprite
+
+
+def test_killed_sprite_gets_exit_and_leaves_broadphase(game, sheet_path):
+    player = _sprite(sheet_path, 50, 50)
+    coin = _sprite(sheet_path, 55, 50)
+    game.add_sprite([player, coin])
+
+    events = []
+    coin.on_collision_enter = lambda other: (events.append("enter"), coin.kill())
+    coin.on_collision_stay = lambda other: events.append("stay")
+    coin.on_collision_exit = lambda other: events.append("exit")
+    game.enable_collision_events()
+
+    for _ in range(4):
+        game._update()
+
+    assert events == ["enter", "exit"]
+    assert coin not in game.broadphase
+    assert game.get_colliding_pairs() == []
+
+
+def test_sprite_removed_from_groups_is_pruned(game, sheet_path):
+    a = _sprite(sheet_path, 50, 50)
+    b = _sprite(sheet_path, 55, 50)
+    game.add_sprite([a, b])
+    assert len(game.get_colliding_pairs()) == 1
+
+    # В обход kill() и remove_sprite()
+    game.all_sprites.remove(b)
+    game._update()
+    assert game.get_colliding_pairs() == []
+    assert b not in game.broadphase
+    assert b._broadphases == []
+
+
+def test_separated_pair_gets_exit(game, sheet_path):
+    a = _sprite(sheet_path, 50, 50)
+    b = _sprite(sheet_path, 55, 50)
+    game.add_sprite([a, b])
+    seen = []
+    game.add_collision_callback(lambda event, x, y: seen.append(event))
+    game.enable_collision_events()
+
+    game._update()
+    game._update()
+    b.set_position(200, 200)
+    b.update(0)
+    game._update()
+
+    assert seen == ["enter", "stay", "exit"]
+
+
+def _event_log(game, sheet_path, positions):
+    sprites = [_sprite(sheet_path, x, y) for x, y in positions]
+    names = {sprite: index for index, sprite in enumerate(sprites)}
+    game.add_sprite(sprites)
+    log = []
+    game.add_collision_callback(lambda event, a, b: log.append((event, names[a], names[b])))
+    game.enable_collision_events()
+    return sprites, log
+
+
+def test_collision_events_follow_registration_order(game, sheet_path):
+    # Цепочка спрайтов внахлёст: 0-1, 1-2, 2-3, ... и вторая цепочка дальше
+    positions = [(20 + 10 * i, 50) for i in range(6)] + [(20 + 10 * i, 150) for i in range(6)]
+    sprites, log = _event_log(game, sheet_path, positions)
+    game._update()
+    chain = [(i, i + 1) for i in range(5)] + [(i, i + 1) for i in range(6, 11)]
+    assert log == [("enter", a, b) for a, b in chain]
+
+    log.clear()
+    sprites[1].set_position(20, 200)  # 1 уходит от 0 и 2
+    sprites[1].update(0)
+    game._update()
+    stays = [pair for pair in chain if 1 not in pair]
+    assert log == [("stay", a, b) for a, b in stays] + [("exit", 0, 1), ("exit", 1, 2)]
+
+    # Пересоздание широкой фазы не меняет порядок внутри пар
+    game.enable_broadphase(cell_size=32)
+    log.clear()
+    game._update()
+    assert log == [("stay", a, b) for a, b in stays]
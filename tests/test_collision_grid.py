@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from pygine import CollisionGrid
+
+CELL = 8
+
+
+def _random_grid(rng, cols=12, rows=10, density=0.25):
+    return [[1 if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+
+
+def _stepped(grid, bounds, delta, axis):
+    """Свип перебором: двигаем по пикселю, пока не упрёмся в твёрдую клетку."""
+    left, top, right, bottom = bounds
+    direction = 1 if delta > 0 else -1
+    moved = 0
+    for _ in range(abs(delta)):
+        step = moved + direction
+        if axis == 0:
+            candidate = (left + step, top, right + step, bottom)
+        else:
+            candidate = (left, top + step, right, bottom + step)
+        if grid.overlaps(candidate):
+            break
+        moved = step
+    return moved
+
+
+def _free_bounds(grid, rng):
+    while True:
+        left = rng.randrange(-CELL, grid.pixel_width)
+        top = rng.randrange(-CELL, grid.pixel_height)
+        bounds = (left, top, left + rng.randint(2, 20), top + rng.randint(2, 20))
+        if not grid.overlaps(bounds):
+            return bounds
+
+
+@pytest.mark.parametrize("solid_outside", [False, True])
+def test_sweeps_match_stepping(solid_outside):
+    rng = random.Random(2)
+    for _ in range(20):
+        grid = CollisionGrid(_random_grid(rng), (CELL, CELL), solid_outside)
+        for _ in range(20):
+            bounds = _free_bounds(grid, rng)
+            dx = rng.choice([-1, 1]) * rng.randint(1, 40)
+            dy = rng.choice([-1, 1]) * rng.randint(1, 40)
+            assert grid.sweep_x(bounds, dx) == _stepped(grid, bounds, dx, 0)
+            assert grid.sweep_y(bounds, dy) == _stepped(grid, bounds, dy, 1)
+
+
+def test_touching_edge_is_not_overlap():
+    grid = CollisionGrid([[0, 1], [0, 0]], (CELL, CELL))
+    assert not grid.overlaps((0, 0, CELL, CELL))
+    assert grid.sweep_x((0, 0, CELL, CELL), 5) == 0
+    assert grid.is_grounded((CELL, -CELL, 2 * CELL, 0))
+
+
+def test_move_resolves_x_then_y():
+    grid = CollisionGrid([[0, 0, 1], [0, 0, 0], [1, 1, 1]], (CELL, CELL))
+    # Стена справа останавливает X, затем пол останавливает Y
+    assert grid.move((0, 0, CELL, CELL), 20, 20) == (CELL, CELL, True, True)
+    # Без стены на пути X проходит целиком
+    assert grid.move((0, CELL, CELL, 2 * CELL), 10, 5) == (10, 0, False, True)
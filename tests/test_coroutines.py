@@ -0,0 +1,85 @@
+import warnings
+
+import pytest
+
+from pygine import AnimatedSprite, Scheduler, animation_finished, animation_marker
+from pygine.utils import wait_for_animation
+
+
+@pytest.fixture
+def sprite(sheet_path):
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    sprite.add_animation("attack", [0, 1, 2], fps=10, loop=False, markers={1: "hit"})
+    sprite.add_animation("idle", [3, 4], fps=10)
+    return sprite
+
+
+def _run(scheduler, sprite, ticks, dt=0.05):
+    for _ in range(ticks):
+        sprite.update(dt)
+        scheduler.update(dt)
+
+
+def test_animation_finished_resumes_after_clip(sprite):
+    log = []
+
+    def routine():
+        sprite.play_animation("attack")
+        yield animation_finished(sprite)
+        log.append("done")
+
+    scheduler = Scheduler()
+    scheduler.start(routine())
+    _run(scheduler, sprite, 10)
+    assert log == ["done"]
+    assert len(scheduler) == 0
+
+
+def test_animation_finished_rejects_looping_clip(sprite):
+    sprite.play_animation("idle")
+    with pytest.raises(ValueError):
+        animation_finished(sprite)
+
+
+def test_interrupted_wait_resolves(sprite):
+    waits = []
+
+    def routine():
+        sprite.play_animation("attack")
+        wait = animation_finished(sprite)
+        waits.append(wait)
+        yield wait
+
+    scheduler = Scheduler()
+    scheduler.start(routine())
+    scheduler.update(0.0)
+    sprite.play_animation("idle")
+    scheduler.update(0.0)
+    assert len(scheduler) == 0
+    assert waits[0].interrupted
+    assert not sprite.animation_manager.has_listeners()
+
+
+def test_marker_wait_resolves_on_stop(sprite):
+    sprite.play_animation("attack")
+    wait = animation_marker(sprite, "missing")
+    sprite.animation_manager.stop()
+    assert wait.ready(0.0)
+    assert wait.interrupted
+
+
+def test_wait_for_animation_rejects_looping_clip(sprite):
+    sprite.play_animation("idle")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        with pytest.raises(ValueError):
+            wait_for_animation(sprite)
+
+
+def test_wait_for_animation_returns_when_clip_changes(sprite):
+    sprite.play_animation("attack")
+    sprite.on_animation_marker("hit", lambda *args: sprite.play_animation("idle"))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        wait_for_animation(sprite)
+    assert sprite.animation_manager.current_animation.name == "idle"
@@ -0,0 +1,54 @@
+from pygine import AnimatedSprite, Camera
+
+
+class LegacySprite(AnimatedSprite):
+    """Подкласс со старой сигнатурой update(self, dt)."""
+
+    def update(self, dt):
+        self.ticks = getattr(self, "ticks", 0) + 1
+        super().update(dt)
+
+
+def _walker(cls, sheet_path, x):
+    sprite = cls(sheet_path, (16, 16))
+    sprite.add_animation("walk", [0, 1, 2, 3], fps=10)
+    sprite.play_animation("walk")
+    sprite.set_position(x, 100)
+    sprite.update(0.0)
+    sprite.velocity = [60, 0]
+    return sprite
+
+
+def test_offscreen_sprites_move_but_do_not_animate(game, sheet_path):
+    game.set_camera(Camera(320, 240), cull_margin=0, cull_updates=True)
+    near = _walker(AnimatedSprite, sheet_path, 100)
+    far = _walker(LegacySprite, sheet_path, 2000)
+    game.add_sprite(near)
+    game.add_sprite(far)
+
+    for _ in range(3):
+        game.dt = 0.1
+        game._update()
+
+    assert near.get_animation_frame() == 3
+    assert far.get_animation_frame() == 0
+    assert far.ticks == 4  # включая update(0.0) в _walker
+    assert far.get_position()[0] > 2000
+    assert not far._culled
+
+    # На экране спрайт догоняет накопленное время
+    far.set_position(100, 100)
+    far.update(0.0)
+    game.dt = 0.1
+    game._update()
+    assert far.get_animation_frame() == 0  # 0.4 с = полный круг из 4 кадров
+    assert far._pending_animation_time == 0.0
+
+
+def test_without_cull_updates_everything_animates(game, sheet_path):
+    game.set_camera(Camera(320, 240), cull_margin=0)
+    far = _walker(LegacySprite, sheet_path, 2000)
+    game.add_sprite(far)
+    game.dt = 0.1
+    game._update()
+    assert far.get_animation_frame() == 1
@@ -0,0 +1,143 @@
+from pygine import AnimatedSprite, Button, Camera, Game, TextInput
+
+
+def _dirty_game():
+    return Game(320, 240, create_display=False, dirty_rects=True)
+
+
+def test_draw_callback_skipped_when_nothing_changed(sheet_path):
+    game = _dirty_game()
+    sprite = AnimatedSprite(sheet_path, (16, 16), (50, 50))
+    sprite.update(0)
+    game.add_sprite(sprite)
+    calls = []
+    game.draw_callback = lambda: calls.append(1)
+
+    game._draw()  # полная перерисовка
+    game._draw()  # ничего не изменилось
+    assert len(calls) == 1
+    assert game.last_dirty_rects == []
+
+    sprite.set_position(80, 50)
+    sprite.update(0)
+    game._draw()
+    assert len(calls) == 2
+    assert game.last_dirty_rects
+
+
+def test_render_state_covers_drawn_fields():
+    text_input = TextInput(10, 10, 100, 30, placeholder="name")
+    state = text_input.render_state()
+    text_input.placeholder_color = (1, 2, 3)
+    assert text_input.render_state() != state
+    state = text_input.render_state()
+    text_input.cursor_color = (4, 5, 6)
+    assert text_input.render_state() != state
+
+    button = Button(10, 10, 100, 30, "ok")
+    state = button.render_state()
+    button.enabled = False
+    assert button.render_state() != state
+
+
+def test_camera_move_redraws_once(sheet_path, monkeypatch):
+    game = _dirty_game()
+    camera = Camera(320, 240)
+    game.set_camera(camera)
+    sprite = AnimatedSprite(sheet_path, (16, 16), (50, 50))
+    sprite.update(0)
+    game.add_sprite(sprite)
+    game._draw()
+
+    calls = []
+    original = game._visible_sprites
+    monkeypatch.setattr(game, "_visible_sprites", lambda: calls.append(1) or original())
+    camera.x = 10
+    game._draw()
+    assert len(calls) == 1
+    assert game.last_dirty_rects == [game.screen.get_rect()]
+
+
+def _placed(sheet_path, game, x, y):
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    sprite.set_position(x, y)
+    sprite.update(0)
+    game.add_sprite(sprite)
+    return sprite
+
+
+def test_static_sprites_produce_no_dirty_rects(sheet_path):
+    game = _dirty_game()
+    sprites = [_placed(sheet_path, game, 20 + 30 * i, 50) for i in range(5)]
+    game._draw()
+    assert game.last_dirty_rects == [game.screen.get_rect()]
+
+    for _ in range(3):
+        for sprite in sprites:
+            sprite.update(1 / 60)
+        game._draw()
+        assert game.last_dirty_rects == []
+
+
+def test_moved_sprite_dirties_old_and_new_rects(sheet_path):
+    game = _dirty_game()
+    sprite = _placed(sheet_path, game, 50, 50)
+    _placed(sheet_path, game, 200, 200)  # неподвижный сосед не попадает в список
+    game._draw()
+    old_rect = sprite.rect.copy()
+
+    # Далеко: две отдельные области
+    sprite.set_position(150, 50)
+    sprite.update(0)
+    game._draw()
+    # (спрайты под грязной областью добавляют свой rect ещё раз)
+    assert set(map(tuple, game.last_dirty_rects)) == {tuple(old_rect), tuple(sprite.rect)}
+    assert game.screen.get_at(old_rect.center) == game.background_color
+
+    # Рядом: одна объединённая область
+    old_rect = sprite.rect.copy()
+    sprite.set_position(155, 50)
+    sprite.update(0)
+    game._draw()
+    union = old_rect.union(sprite.rect)
+    assert all(union.contains(rect) for rect in game.last_dirty_rects)
+    assert union in game.last_dirty_rects
+
+
+def test_removed_sprite_dirties_its_old_rect(sheet_path):
+    game = _dirty_game()
+    sprite = _placed(sheet_path, game, 50, 50)
+    game._draw()
+    old_rect = sprite.rect.copy()
+    assert game.screen.get_at(old_rect.center) != game.background_color
+
+    game.remove_sprite(sprite)
+    game._draw()
+    assert game.last_dirty_rects == [old_rect]
+    assert game.screen.get_at(old_rect.center) == game.background_color
+
+
+def test_sprites_rebuilt_counts_only_changed_images(sheet_path):
+    game = _dirty_game()
+    _placed(sheet_path, game, 50, 50)
+    walker = _placed(sheet_path, game, 100, 50)
+    frames = []
+
+    def stop_after_three():
+        frames.append(game.sprites_rebuilt)
+        if len(frames) == 3:
+            game.running = False
+
+    game.update_callback = stop_after_three
+    AnimatedSprite.pop_rebuild_count()  # перестроения из _placed
+    game.running = True
+    game._game_loop()
+    assert frames == [0, 0, 0]
+    assert game.sprites_rebuilt == 0
+
+    # Обработчик видит счётчик прошлого кадра: поворот — одно перестроение
+    walker.set_rotation(90)
+    game.running = True
+    frames.clear()
+    game._game_loop()
+    assert frames == [0, 1, 0]
@@ -0,0 +1,97 @@
+import pygame
+import pytest
+
+from pygine import AnimatedSprite, key_just_pressed, key_just_released
+
+
+@pytest.fixture
+def mover(game, sheet_path):
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    sprite.set_position(100, 100)
+    sprite.update(0.0)  # rect следует за позицией после update()
+    sprite.velocity = [60, 0]  # 1 пиксель за тик при 60 тиках в секунду
+    game.add_sprite(sprite)
+    return sprite
+
+
+def test_ticks_run_per_accumulated_step(game, mover):
+    game.set_fixed_timestep(60)
+    game._run_fixed_steps(2.5 / 60)
+    assert game.steps_last_frame == 2
+    assert game.interpolation_alpha == pytest.approx(0.5)
+    assert mover.rect.centerx == 102
+
+
+def test_catch_up_limit_drops_time(game, mover):
+    game.set_fixed_timestep(60, max_catch_up_steps=3)
+    game._run_fixed_steps(10 / 60)
+    assert game.steps_last_frame == 3
+    assert game.dropped_time == pytest.approx(7 / 60)
+
+
+def test_draw_rect_interpolates_between_ticks(game, mover):
+    game.set_fixed_timestep(60)
+    mover.velocity = [600, 0]  # 10 пикселей за тик
+    game._run_fixed_steps(1.5 / 60)
+    assert mover._previous_center == (100, 100)
+    assert mover.rect.centerx == 110
+    # Половина пути от прошлого тика к текущему
+    assert game.get_draw_rect(mover).centerx == 105
+
+
+def test_no_interpolation_without_ticks_or_when_disabled(game, mover):
+    game.set_fixed_timestep(60)
+    assert game.get_draw_rect(mover).centerx == 100
+
+    game.set_fixed_timestep(60, interpolate=False)
+    mover.velocity = [600, 0]
+    game._run_fixed_steps(1.5 / 60)
+    assert game.get_draw_rect(mover).centerx == mover.rect.centerx
+
+
+def test_teleport_is_not_interpolated(game, mover):
+    game.set_fixed_timestep(60)
+    mover.velocity = [0, 0]
+    game._run_fixed_steps(1 / 60)
+    # Скачок больше interpolation_max_distance рисуется сразу на новом месте
+    mover.set_position(400, 100)
+    game._run_fixed_steps(1.5 / 60)
+    assert mover._previous_center == (100, 100)
+    assert game.get_draw_rect(mover).centerx == 400
+
+
+class _Keys:
+    """Подмена pygame.key.get_pressed() с управляемым набором клавиш."""
+
+    def __init__(self):
+        self.down = set()
+
+    def __call__(self):
+        return self
+
+    def __getitem__(self, key):
+        return key in self.down
+
+
+def test_key_edges_reach_exactly_one_tick(game, monkeypatch):
+    keys = _Keys()
+    monkeypatch.setattr(pygame.key, "get_pressed", keys)
+    seen = []
+    game.update_callback = lambda: seen.append(key_just_pressed(pygame.K_SPACE))
+    game.set_fixed_timestep(60)
+    game._advance(0.0)  # начальное состояние клавиш
+
+    # Кадр без тиков: нажатие дожидается следующего тика
+    keys.down.add(pygame.K_SPACE)
+    game._advance(0.5 / 60)
+    assert seen == []
+
+    # Кадр с двумя тиками: нажатие видит только первый
+    game._advance(1.6 / 60)
+    assert seen == [True, False]
+
+    keys.down.clear()
+    released = []
+    game.update_callback = lambda: released.append(key_just_released(pygame.K_SPACE))
+    game._advance(2 / 60)
+    assert released == [True, False]
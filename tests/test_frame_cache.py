@@ -0,0 +1,252 @@
+import pygame
+
+from pygine import AnimatedSprite
+
+
+class CopyingSprite(AnimatedSprite):
+    copy_images = True
+
+
+def _sprite(sheet_path, cls=AnimatedSprite, **transform):
+    sprite = cls(sheet_path, (16, 16), (50, 50))
+    if "scale" in transform:
+        sprite.set_scale(transform["scale"])
+    if "rotation" in transform:
+        sprite.set_rotation(transform["rotation"])
+    sprite.update(0)
+    return sprite
+
+
+def test_copied_image_changes_do_not_leak_between_sprites(sheet_path):
+    for transform in ({}, {"scale": 2.0}, {"rotation": 30}):
+        a = _sprite(sheet_path, CopyingSprite, **transform)
+        b = _sprite(sheet_path, CopyingSprite, **transform)
+        before = b.image.get_at((8, 8))
+        a.image.fill((1, 2, 3, 255))
+        a.image.set_alpha(10)
+        assert b.image.get_at((8, 8)) == before
+        assert b.image.get_alpha() != 10
+        assert a.frames[0].get_at((8, 8)) == before
+
+
+def test_images_are_shared_by_default(sheet_path):
+    a = AnimatedSprite(sheet_path, (16, 16))
+    b = AnimatedSprite(sheet_path, (16, 16))
+    a.set_scale(2.0)
+    b.set_scale(2.0)
+    a.update(0)
+    b.update(0)
+    assert a.image is b.image
+
+
+def test_frames_setter_is_private_to_sprite(sheet_path):
+    a = _sprite(sheet_path)
+    b = _sprite(sheet_path)
+    red = pygame.Surface((16, 16), pygame.SRCALPHA)
+    red.fill((255, 0, 0, 255))
+
+    a.frames = [red, red]
+    a.current_frame = 1
+    a.update(0)
+    assert len(a.frames) == 2
+    assert a.image.get_at((8, 8)) == pygame.Color(255, 0, 0, 255)
+    assert len(b.frames) == 8
+    assert b.image.get_at((8, 8)) != pygame.Color(255, 0, 0, 255)
+
+
+def test_extract_frames_returns_copies(sheet_path):
+    sprite = _sprite(sheet_path)
+    frames = sprite._extract_frames()
+    assert len(frames) == 8
+    frames[0].fill((0, 0, 0, 0))
+    assert sprite.frames[0].get_at((8, 8)).a == 255
+
+
+def test_on_the_fly_masks_respect_cache_limit(sheet_path):
+    from pygine.frame_cache import get_frame_store
+
+    sprite = _sprite(sheet_path)
+    cache = sprite._sheet.transforms
+    limit = cache.max_bytes
+    try:
+        cache.set_limit(20_000)
+        for angle in range(0, 360, 3):
+            sprite._sheet.get_mask(0, 2.0, False, False, angle)
+        assert cache.size_bytes <= 20_000
+    finally:
+        cache.set_limit(limit)
+        cache.clear()
+    assert not hasattr(get_frame_store().sheets()[0], "masks")
+
+
+def test_rotation_tables_are_pinned_outside_cache_limit(sheet_path, monkeypatch):
+    sheet = _sprite(sheet_path)._sheet
+    cache = sheet.transforms
+    limit = cache.max_bytes
+    try:
+        cache.set_limit(20_000)
+        table = sheet.get_rotation_table(64, 2.0, False, False, range(8))
+        assert sheet.pinned_bytes > 20_000
+        assert cache.size_bytes == 0
+
+        # Повороты на лету не вытесняют таблицу: повторный запрос не вращает
+        for angle in range(0, 360, 3):
+            cache.get(sheet.frames, 0, 2.0, False, False, angle)
+        rotate_calls = []
+        monkeypatch.setattr(pygame.transform, "rotate", lambda *args: rotate_calls.append(args))
+        again = sheet.get_rotation_table(64, 2.0, False, False, range(8))
+        assert rotate_calls == []
+        assert all(again[index] is table[index] for index in range(8))
+    finally:
+        cache.set_limit(limit)
+        sheet.clear_caches()
+    assert sheet.pinned_bytes == 0
+
+
+def test_set_collision_mask_prebakes_rotation_steps(sheet_path):
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    sprite.add_animation("spin", [0, 1], fps=10)
+    sprite.play_animation("spin")
+    sprite._sheet.clear_caches()
+    sprite.set_rotation_steps(8)
+    cache = sprite._sheet.transforms
+
+    sprite.set_collision_mask()
+    # 2 кадра анимации x 2 отражения x 8 шагов поворота, все закреплены
+    masks = [key for key in sprite._sheet._pinned if key[0] == "mask"]
+    assert len(masks) == 2 * 2 * 8
+    assert not any(key[0] == "mask" for key in cache._entries)
+
+    misses = cache.misses
+    for angle in range(0, 360, 45):
+        sprite.set_rotation(angle)
+        sprite.update(0)
+        sprite.get_mask()
+    assert cache.misses == misses
+
+
+def test_mask_collision_rect_follows_image(sheet_path):
+    sprite = _sprite(sheet_path)
+    sprite.set_collision_mask()
+    assert sprite.collision_rect.size == (16, 16)
+
+    sprite.set_scale(2.0)
+    sprite.update(0)
+    assert sprite.collision_rect.size == (32, 32)
+    assert sprite.collision_rect.center == sprite.rect.center
+
+    sprite.set_rotation(45)
+    sprite.update(0)
+    assert sprite.collision_rect.size == sprite.image.get_size()
+    assert sprite.collision_rect.size == sprite.get_mask().get_size()
+
+
+def test_sub_quantum_rotation_does_not_rebuild(sheet_path):
+    sprite = _sprite(sheet_path, rotation=30)
+    image = sprite.image
+    AnimatedSprite.pop_rebuild_count()
+
+    for angle in (30.1, 30.2, 29.9, 30.4):
+        sprite.set_rotation(angle)
+        sprite.update(0)
+        assert sprite.image is image
+        assert "rotation" not in sprite.changes
+    assert AnimatedSprite.pop_rebuild_count() == 0
+
+    sprite.set_rotation(31)
+    sprite.update(0)
+    assert "rotation" in sprite.changes
+    assert AnimatedSprite.pop_rebuild_count() == 1
+
+
+def test_frame_store_counts_references_and_purges_unused(sheet_path, tmp_path):
+    import gc
+    import shutil
+
+    from pygine.frame_cache import FrameStore
+
+    path = tmp_path / "counted.png"
+    shutil.copy(sheet_path, path)
+    store = FrameStore()
+
+    a = store.acquire(path, (16, 16))
+    b = store.acquire(str(path), [16, 16])
+    assert a is b
+    assert a.ref_count == 2
+    assert len(store) == 1
+
+    store.release(a)
+    assert store.purge() == 0
+    assert a.key in store
+
+    store.release(a)
+    store.release(a)  # лишний release не уводит счётчик в минус
+    assert a.ref_count == 0
+    assert store.purge() == 1
+    assert a.key not in store
+    assert store.acquire(path, (16, 16)) is not a
+
+    # Спрайты глобального хранилища отпускают лист сами при удалении
+    from pygine.frame_cache import get_frame_store
+
+    global_store = get_frame_store()
+    sprites = [AnimatedSprite(str(path), (16, 16)) for _ in range(3)]
+    sheet = sprites[0]._sheet
+    assert sheet.ref_count == 3
+    sprites[0].release_frames()
+    sprites[0].release_frames()  # повторный вызов ничего не меняет
+    assert sheet.ref_count == 2
+    del sprites
+    gc.collect()
+    assert sheet.ref_count == 0
+    assert global_store.purge() >= 1
+    assert sheet.key not in global_store
+
+
+def test_get_mutable_frame_detaches_from_sheet(sheet_path, tmp_path):
+    import shutil
+
+    from pygine.frame_cache import FrameStore
+
+    path = tmp_path / "mutable.png"
+    shutil.copy(sheet_path, path)
+    sheet = FrameStore().acquire(path, (16, 16))
+
+    # Кадры — представления листа без копирования пикселей
+    assert sheet.frames[1].get_parent() is sheet.image
+    original = sheet.image.get_at((16, 0))
+    sheet.transforms.get(sheet.frames, 1, 2.0, False, False, 0)
+    version = sheet.version
+
+    frame = sheet.get_mutable_frame(1)
+    assert frame.get_parent() is None
+    assert sheet.frames[1] is frame
+    assert sheet.get_mutable_frame(1) is frame  # копируется только раз
+    frame.fill((1, 2, 3, 255))
+
+    assert sheet.image.get_at((16, 0)) == original
+    assert sheet.frames[0].get_parent() is sheet.image
+    assert sheet.version > version
+    assert len(sheet.transforms) == 0
+
+
+def test_rotation_steps_snap_to_table_without_rotating_per_frame(sheet_path, monkeypatch):
+    sprite = AnimatedSprite(sheet_path, (16, 16), (50, 50))
+    sprite.add_animation("walk", [0, 1, 2, 3], fps=10)
+    sprite.play_animation("walk")
+    sprite.set_rotation_steps(16)
+    table = sprite._rotation_table
+    assert sorted(table) == [0, 1, 2, 3]
+    assert all(len(rotations) == 16 for rotations in table.values())
+
+    rotate_calls = []
+    original = pygame.transform.rotate
+    monkeypatch.setattr(
+        pygame.transform, "rotate", lambda *args: rotate_calls.append(args) or original(*args)
+    )
+    # Угол округляется до ближайшего шага в 22.5°
+    for angle, step in ((0, 0), (10, 0), (12, 1), (100, 4), (350, 0), (-22.5, 15), (720 + 45, 2)):
+        sprite.set_rotation(angle)
+        sprite.update(0.1)
+        assert sprite.image is table[sprite.current_frame][step]
+    assert rotate_calls == []
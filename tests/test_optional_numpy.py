@@ -0,0 +1,52 @@
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+
+def test_import_without_numpy():
+    # numpy = None в sys.modules заставляет "import numpy" падать с ImportError
+    script = textwrap.dedent(
+        """
+        import os, sys
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        sys.modules["numpy"] = None
+        import pygine
+        game = pygine.Game(64, 64, create_display=False)
+        assert game.animation_system is None
+        body = pygine.PhysicsBody(gravity=100.0)
+        assert body.update(0.1)[1] > 0
+        import pygame, tempfile
+        pygame.display.set_mode((16, 16))
+        path = os.path.join(tempfile.mkdtemp(), "sheet.png")
+        pygame.image.save(pygame.Surface((16, 16)), path)
+        sprite = pygine.AnimatedSprite(path, (16, 16))
+        sprite.attach_body(gravity=100.0)
+        sprite.update(0.1)
+        assert sprite.get_position()[1] > 0
+        try:
+            pygine.PhysicsWorld
+        except ImportError as error:
+            assert "NumPy" in str(error)
+        else:
+            raise AssertionError("PhysicsWorld imported without NumPy")
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=Path(__file__).resolve().parents[1],
+    )
+    assert result.returncode == 0, result.stderr
+
+
+def test_numpy_names_load_lazily():
+    import pygine
+
+    from pygine import physics
+
+    assert pygine.PhysicsWorld.__module__ == "pygine.physics_world"
+    assert physics.PhysicsWorld is pygine.PhysicsWorld
+    assert "query_many" in pygine.__all__
+    assert callable(pygine.query_many)
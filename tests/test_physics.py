@@ -0,0 +1,247 @@
+import random
+
+import pytest
+
+from pygine import PhysicsBody, PhysicsWorld
+
+
+def _configure(body, rng):
+    body.mass = rng.uniform(0.5, 3.0)
+    body.gravity = rng.choice([0.0, 400.0, 980.0])
+    body.friction = rng.uniform(0.5, 1.0)
+    body.air_resistance = rng.uniform(0.95, 1.0)
+    body.on_ground = rng.random() < 0.3
+    body.velocity = (rng.uniform(-200, 200), rng.uniform(-200, 200))
+
+
+def test_standalone_body_keeps_plain_attributes():
+    body = PhysicsBody(2.0, 300.0)
+    assert body.world is None
+    assert isinstance(body.velocity, list)
+    body.velocity[0] += 10
+    assert body.velocity == [10.0, 0.0]
+    assert body.mass == 2.0
+
+
+def test_standalone_update_matches_world_step():
+    rng = random.Random(3)
+    world = PhysicsWorld(sleep_time=None)
+    pairs = []
+    for _ in range(30):
+        solo = PhysicsBody()
+        solo.sleep_time = None
+        shared = world.create_body()
+        state = rng.getstate()
+        _configure(solo, rng)
+        rng.setstate(state)
+        _configure(shared, rng)
+        pairs.append((solo, shared))
+
+    for tick in range(50):
+        for solo, shared in pairs:
+            if tick % 7 == 0:
+                solo.apply_force(50.0, -20.0)
+                shared.apply_force(50.0, -20.0)
+        moves = world.step(1 / 60)
+        for solo, shared in pairs:
+            dx, dy = solo.update(1 / 60)
+            assert (dx, dy) == pytest.approx(tuple(moves[shared.index]))
+            assert solo.velocity == pytest.approx(list(shared.velocity))
+
+
+def test_add_and_remove_body_move_data():
+    world = PhysicsWorld()
+    body = PhysicsBody(3.0, 100.0)
+    body.velocity = (12.0, -4.0)
+    body.friction = 0.5
+
+    world.add_body(body)
+    assert body.world is world
+    assert len(world) == 1
+    assert world._velocity[body.index].tolist() == [12.0, -4.0]
+    assert body.mass == 3.0 and body.friction == 0.5
+
+    body.remove()
+    assert body.world is None
+    assert len(world) == 0
+    assert body.velocity == [12.0, -4.0]
+    assert body.gravity == 100.0
+
+
+def test_world_row_released_when_body_collected():
+    world = PhysicsWorld()
+    body = world.create_body()
+    assert len(world) == 1
+    del body
+    assert len(world) == 0
+
+
+def test_body_reads_displacement_after_world_step():
+    world = PhysicsWorld(sleep_time=None)
+    body = world.create_body(gravity=0.0)
+    body.velocity = (60.0, 0.0)
+
+    world.step(0.5)
+    velocity = list(body.velocity)
+    # Шаг мира уже проинтегрировал тело — update() не шагает повторно
+    assert body.update(0.5) == pytest.approx((30.0 * 0.99, 0.0))
+    assert list(body.velocity) == velocity
+    # Без нового шага мира тело интегрируется отдельно
+    body.update(0.5)
+    assert body.velocity[0] < velocity[0]
+
+
+def test_game_steps_physics_world_once_per_tick(game, sheet_path):
+    from pygine import AnimatedSprite
+
+    world = PhysicsWorld(sleep_time=None)
+    game.add_physics_world(world)
+    sprites = []
+    for index in range(3):
+        sprite = AnimatedSprite(sheet_path, (16, 16), (0, 0))
+        sprite.set_position(10.0 * index, 0.0)
+        sprite.attach_body(world.create_body(gravity=0.0))
+        sprite.velocity = (100.0, 0.0)
+        game.add_sprite(sprite)
+        sprites.append(sprite)
+
+    game.dt = 0.1
+    game._update()
+    assert world.step_count == 1
+    for index, sprite in enumerate(sprites):
+        assert sprite.x == pytest.approx(10.0 * index + 100.0 * 0.99 * 0.1)
+
+
+def _tick(world, body, shared, dt=1 / 60):
+    if shared:
+        world.step(dt)
+    else:
+        body.update(dt)
+
+
+def _resting(body):
+    body.on_ground = True
+    body.velocity = (1.0, 0.0)
+    return body
+
+
+def _sleepy_body(world, shared, gravity=400.0):
+    if shared:
+        return world.create_body(gravity=gravity)
+    body = PhysicsBody(gravity=gravity)
+    body.sleep_time = world.sleep_time  # тело без мира засыпает только по запросу
+    return body
+
+
+def test_standalone_body_does_not_sleep_by_default():
+    body = _resting(PhysicsBody())
+    for _ in range(120):
+        body.update(1 / 60)
+    assert not body.sleeping
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_resting_body_falls_asleep(shared):
+    world = PhysicsWorld()
+    body = _resting(_sleepy_body(world, shared))
+    for _ in range(29):
+        _tick(world, body, shared)
+    assert not body.sleeping
+    for _ in range(2):
+        _tick(world, body, shared)
+    assert body.sleeping
+    assert list(body.velocity) == [0.0, 0.0]
+    if shared:
+        assert world.sleeping_count == 1
+
+
+def _fall_asleep_on_ground(world, body, shared):
+    _resting(body)
+    for _ in range(40):
+        _tick(world, body, shared)
+    assert body.sleeping
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_body_wakes_and_falls_when_support_removed(shared):
+    world = PhysicsWorld()
+    body = _sleepy_body(world, shared)
+    _fall_asleep_on_ground(world, body, shared)
+
+    body.on_ground = False
+    assert not body.sleeping
+    _tick(world, body, shared)
+    assert body.displacement[1] > 0
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_gravity_change_wakes_body(shared):
+    world = PhysicsWorld()
+    body = _sleepy_body(world, shared, gravity=0.0)
+    body.on_ground = False
+    body.velocity = (1.0, 0.0)
+    for _ in range(40):
+        _tick(world, body, shared)
+    assert body.sleeping
+
+    body.gravity = 400.0
+    assert not body.sleeping
+    _tick(world, body, shared)
+    assert body.displacement[1] > 0
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_in_place_velocity_edit_wakes_body(shared):
+    world = PhysicsWorld()
+    body = _sleepy_body(world, shared)
+    _fall_asleep_on_ground(world, body, shared)
+
+    body.velocity[0] = 100.0
+    _tick(world, body, shared)
+    assert not body.sleeping
+    assert body.displacement[0] > 0
+
+
+def test_in_place_velocity_edit_wakes_body_of_sprite(sheet_path):
+    from pygine import AnimatedSprite
+
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    body = sprite.attach_body(gravity=0.0)
+    body.sleep_time = 0.5
+    _fall_asleep_on_ground(None, body, False)
+
+    sprite.velocity[0] = 120.0
+    x = sprite.get_position()[0]
+    sprite.update(1 / 60)
+    assert sprite.get_position()[0] > x
+
+
+def test_wake_triggers():
+    world = PhysicsWorld()
+    body = world.create_body()
+    body.sleep()
+    body.velocity = (50.0, 0.0)
+    assert not body.sleeping
+
+    body.sleep()
+    body.allow_sleep = False
+    assert not body.sleeping
+    _resting(body)
+    for _ in range(120):
+        world.step(1 / 60)
+    assert not body.sleeping
+
+    other = world.create_body()
+    other.sleep()
+    world.wake_all()
+    assert world.sleeping_count == 0 and not other.sleeping
+
+
+def test_sprite_teleport_wakes_body(sheet_path):
+    from pygine import AnimatedSprite
+
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    body = sprite.attach_body(gravity=0.0)
+    body.sleep()
+    sprite.set_position(50, 50)
+    assert not body.sleeping
@@ -0,0 +1,83 @@
+import pygame
+
+from pygine import RenderQueue
+
+
+class _Target(pygame.Surface):
+    """Поверхность, записывающая вызовы blits()."""
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.calls = []
+
+    def blits(self, blit_sequence, doreturn=True):
+        entries = list(blit_sequence)
+        self.calls.append(entries)
+        return super().blits(entries, doreturn)
+
+
+def _solid(color, size=(4, 4)):
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    return surface
+
+
+def test_layers_flush_in_order_and_overlap_correctly():
+    queue = RenderQueue()
+    red, green, blue = _solid((255, 0, 0)), _solid((0, 255, 0)), _solid((0, 0, 255))
+    queue.submit(red, (0, 0), layer=2)
+    queue.submit(green, (0, 0), layer=-1)
+    queue.submit(blue, (2, 0), layer=2)
+
+    target = _Target((8, 8))
+    assert queue.flush(target) == 3
+    # Один вызов blits() на слой, слои по возрастанию, внутри — по добавлению
+    assert [[entry[0] for entry in call] for call in target.calls] == [[green], [red, blue]]
+    assert target.get_at((0, 0)) == (255, 0, 0, 255)
+    assert target.get_at((2, 0)) == (0, 0, 255, 255)
+    assert len(queue) == 0
+    assert queue.last_flush_count == 3
+
+
+def test_area_and_flags_reach_blits():
+    queue = RenderQueue()
+    source = _solid((10, 20, 30))
+    area = pygame.Rect(0, 0, 2, 2)
+    queue.submit(source, (1, 1), area=area, flags=pygame.BLEND_ADD)
+
+    target = _Target((8, 8))
+    target.fill((5, 5, 5))
+    queue.flush(target)
+    assert target.calls == [[(source, (1, 1), area, pygame.BLEND_ADD)]]
+    assert target.get_at((2, 2)) == (15, 25, 35, 255)
+    assert target.get_at((3, 3)) == (5, 5, 5, 255)
+
+
+def test_submit_sprites_appends_image_and_rect(sheet_path):
+    from pygine import AnimatedSprite
+
+    sprites = []
+    for x in (0, 20, 40):
+        sprite = AnimatedSprite(sheet_path, (16, 16))
+        sprite.set_position(x + 8, 8)
+        sprite.update(0.0)
+        sprites.append(sprite)
+
+    queue = RenderQueue()
+    queue.submit(_solid((0, 0, 0)), (0, 0), layer=1)
+    queue.submit_sprites(sprites)
+    assert len(queue) == 4
+
+    target = _Target((64, 16))
+    queue.flush(target)
+    assert target.calls[0] == [(sprite.image, sprite.rect) for sprite in sprites]
+    assert target.get_at((20, 8)) == sprites[1].image.get_at((0, 8))
+
+
+def test_clear_drops_entries():
+    queue = RenderQueue()
+    queue.submit(_solid((1, 2, 3)), (0, 0))
+    queue.clear()
+    target = _Target((4, 4))
+    assert queue.flush(target) == 0
+    assert target.calls == []
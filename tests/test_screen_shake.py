@@ -0,0 +1,51 @@
+import pygame
+import pytest
+
+import pygine.game
+
+
+@pytest.fixture
+def shaking(monkeypatch):
+    offset = [(3.0, -2.0)]
+    monkeypatch.setattr(pygine.game, "get_screen_shake_offset", lambda: offset[0])
+    return offset
+
+
+def test_shake_buffer_is_reused_across_frames(game, shaking, monkeypatch):
+    created = []
+    original = pygame.Surface
+
+    def counting_surface(*args, **kwargs):
+        surface = original(*args, **kwargs)
+        created.append(surface.get_size())
+        return surface
+
+    game.background_color = (10, 20, 30)
+    game._draw()
+    buffer = game._shake_buffer
+    assert buffer is not None and buffer is not game.screen
+
+    monkeypatch.setattr(pygine.game.pygame, "Surface", counting_surface)
+    for _ in range(5):
+        game._draw()
+    assert game._shake_buffer is buffer
+    assert (320, 240) not in created
+
+    # Кадр сдвинут на (3, -2), открывшиеся полосы залиты чёрным
+    assert game.screen.get_at((1, 100)) == (0, 0, 0, 255)
+    assert game.screen.get_at((100, 239)) == (0, 0, 0, 255)
+    assert game.screen.get_at((100, 100)) == (10, 20, 30, 255)
+
+
+def test_shake_buffer_follows_screen_size(game, shaking):
+    game._draw()
+    buffer = game._shake_buffer
+
+    game.screen = pygame.Surface((200, 100))
+    game._draw()
+    assert game._shake_buffer is not buffer
+    assert game._shake_buffer.get_size() == (200, 100)
+
+    resized = game._shake_buffer
+    game._draw()
+    assert game._shake_buffer is resized
@@ -0,0 +1,78 @@
+import pygame
+import pytest
+
+from pygine import TileMap
+from pygine.tilemap import MAX_TILE_ID
+
+
+def _tile(color):
+    surface = pygame.Surface((8, 8))
+    surface.fill(color)
+    return surface
+
+
+def test_tile_id_out_of_range_is_rejected():
+    with pytest.raises(ValueError):
+        TileMap([[0, MAX_TILE_ID + 1]], [_tile((255, 0, 0))], (8, 8))
+
+    level = TileMap([[0, 1]], [_tile((255, 0, 0))], (8, 8))
+    with pytest.raises(ValueError):
+        level.set_tile(0, 0, -1)
+    level.set_tile(0, 0, MAX_TILE_ID)
+    assert level.get_tile(0, 0) == MAX_TILE_ID
+
+
+def test_from_csv_passes_max_chunks(tmp_path):
+    path = tmp_path / "level.csv"
+    path.write_text("1,0,1\n,1,\n")
+    level = TileMap.from_csv(path, [_tile((0, 255, 0))], (8, 8), chunk_size=1, max_chunks=2)
+    assert level.max_chunks == 2
+    assert level.get_tile(1, 1) == 1
+    assert level.get_tile(0, 1) == 0
+
+
+def test_submit_uses_explicit_view_size():
+    level = TileMap([[1, 1], [1, 1]], [_tile((0, 0, 255))], (8, 8), chunk_size=1)
+    submitted = []
+
+    class Queue:
+        def submit(self, image, dest, layer=0):
+            submitted.append(dest)
+
+    level.submit(Queue(), view_size=(8, 8))
+    assert submitted == [(0, 0)]
+
+
+def _sprite_over_map(game, sheet_path):
+    from pygine import AnimatedSprite
+
+    sprite = AnimatedSprite(sheet_path, (16, 16))
+    sprite.set_position(8, 8)
+    sprite.update(0.0)
+    game.add_sprite(sprite)
+    return sprite
+
+
+def test_game_draws_tilemap_under_sprites(game, sheet_path):
+    sprite = _sprite_over_map(game, sheet_path)
+    game.add_tilemap(TileMap([[1] * 4] * 4, [_tile((255, 0, 0))], (8, 8)))
+    game._draw()
+    assert game.screen.get_at((8, 8)) == sprite.image.get_at((8, 8))
+    assert game.screen.get_at((24, 24)) == (255, 0, 0, 255)
+
+
+def test_submitted_chunks_order_within_one_flush(game, sheet_path):
+    sprite = _sprite_over_map(game, sheet_path)
+    level = TileMap([[1] * 4] * 4, [_tile((255, 0, 0))], (8, 8))
+
+    # В одном выводе очереди слой -1 лежит под спрайтом слоя 0
+    game.screen.fill((0, 0, 0))
+    game.render_queue.submit(sprite.image, sprite.rect)
+    level.submit(game.render_queue, view_size=(320, 240))
+    game.render_queue.flush(game.screen)
+    assert game.screen.get_at((8, 8)) == sprite.image.get_at((8, 8))
+
+    # Из draw_callback чанки попадают во второй вывод — поверх спрайтов
+    game.draw_callback = lambda: level.submit(game.render_queue, view_size=(320, 240))
+    game._draw()
+    assert game.screen.get_at((8, 8)) == (255, 0, 0, 255)